@@ -1,150 +1,178 @@
-from tableauserverclient.bin._version import get_versions
+from typing import TYPE_CHECKING
+
+from tableauserverclient.lazy_imports import lazy_exports
 from tableauserverclient.namespace import NEW_NAMESPACE as DEFAULT_NAMESPACE
-from tableauserverclient.models import (
-    BackgroundJobItem,
-    CollectionItem,
-    ColumnItem,
-    ConnectionCredentials,
-    ConnectionItem,
-    CustomViewItem,
-    DQWItem,
-    DailyInterval,
-    DataAlertItem,
-    DatabaseItem,
-    DataFreshnessPolicyItem,
-    DatasourceItem,
-    ExtensionsServer,
-    ExtensionsSiteSettings,
-    FavoriteItem,
-    FlowItem,
-    FlowRunItem,
-    FileuploadItem,
-    GroupItem,
-    GroupSetItem,
-    HourlyInterval,
-    IntervalItem,
-    JobItem,
-    JWTAuth,
-    LinkedTaskItem,
-    LinkedTaskStepItem,
-    LinkedTaskFlowRunItem,
-    LocationItem,
-    MetricItem,
-    MonthlyInterval,
-    PaginationItem,
-    Permission,
-    PermissionsRule,
-    PersonalAccessTokenAuth,
-    ProjectItem,
-    Resource,
-    RevisionItem,
-    SafeExtension,
-    ScheduleItem,
-    SiteAuthConfiguration,
-    SiteOIDCConfiguration,
-    SiteItem,
-    ServerInfoItem,
-    SubscriptionItem,
-    TableauItem,
-    TableItem,
-    TableauAuth,
-    Target,
-    TaskItem,
-    UserItem,
-    ViewItem,
-    VirtualConnectionItem,
-    WebhookItem,
-    WeeklyInterval,
-    WorkbookItem,
-)
 
-from tableauserverclient.server import (
-    CSVRequestOptions,
-    ExcelRequestOptions,
-    ImageRequestOptions,
-    PDFRequestOptions,
-    PPTXRequestOptions,
-    RequestOptions,
-    MissingRequiredFieldError,
-    FailedSignInError,
-    NotSignedInError,
-    ServerResponseError,
-    Filter,
-    Pager,
-    Server,
-    Sort,
-)
+if TYPE_CHECKING:
+    # Imported as themselves, which marks them as exported for type checkers that cannot read __all__
+    from tableauserverclient.bin._version import get_versions as get_versions
+    from tableauserverclient.models import (
+        BackgroundJobItem as BackgroundJobItem,
+        CollectionItem as CollectionItem,
+        ColumnItem as ColumnItem,
+        ConnectionCredentials as ConnectionCredentials,
+        ConnectionItem as ConnectionItem,
+        CustomViewItem as CustomViewItem,
+        DQWItem as DQWItem,
+        DailyInterval as DailyInterval,
+        DataAlertItem as DataAlertItem,
+        DatabaseItem as DatabaseItem,
+        DataFreshnessPolicyItem as DataFreshnessPolicyItem,
+        DatasourceItem as DatasourceItem,
+        ExtensionsServer as ExtensionsServer,
+        ExtensionsSiteSettings as ExtensionsSiteSettings,
+        FavoriteItem as FavoriteItem,
+        FlowItem as FlowItem,
+        FlowRunItem as FlowRunItem,
+        FileuploadItem as FileuploadItem,
+        GroupItem as GroupItem,
+        GroupSetItem as GroupSetItem,
+        HourlyInterval as HourlyInterval,
+        IntervalItem as IntervalItem,
+        JobItem as JobItem,
+        JWTAuth as JWTAuth,
+        LinkedTaskItem as LinkedTaskItem,
+        LinkedTaskStepItem as LinkedTaskStepItem,
+        LinkedTaskFlowRunItem as LinkedTaskFlowRunItem,
+        LocationItem as LocationItem,
+        MetricItem as MetricItem,
+        MonthlyInterval as MonthlyInterval,
+        PaginationItem as PaginationItem,
+        Permission as Permission,
+        PermissionsRule as PermissionsRule,
+        PersonalAccessTokenAuth as PersonalAccessTokenAuth,
+        ProjectItem as ProjectItem,
+        Resource as Resource,
+        RevisionItem as RevisionItem,
+        SafeExtension as SafeExtension,
+        ScheduleItem as ScheduleItem,
+        SiteAuthConfiguration as SiteAuthConfiguration,
+        SiteOIDCConfiguration as SiteOIDCConfiguration,
+        SiteItem as SiteItem,
+        ServerInfoItem as ServerInfoItem,
+        SubscriptionItem as SubscriptionItem,
+        TableauItem as TableauItem,
+        TableItem as TableItem,
+        TableauAuth as TableauAuth,
+        Target as Target,
+        TaskItem as TaskItem,
+        UserItem as UserItem,
+        ViewItem as ViewItem,
+        VirtualConnectionItem as VirtualConnectionItem,
+        WebhookItem as WebhookItem,
+        WeeklyInterval as WeeklyInterval,
+        WorkbookItem as WorkbookItem,
+    )
+    from tableauserverclient.server import (
+        AdaptiveChunkSize as AdaptiveChunkSize,
+        AsyncServer as AsyncServer,
+        ChangeFeed as ChangeFeed,
+        ChunkProgress as ChunkProgress,
+        CSVRequestOptions as CSVRequestOptions,
+        DiskResponseCache as DiskResponseCache,
+        ExcelRequestOptions as ExcelRequestOptions,
+        ImageRequestOptions as ImageRequestOptions,
+        PDFRequestOptions as PDFRequestOptions,
+        PPTXRequestOptions as PPTXRequestOptions,
+        RequestOptions as RequestOptions,
+        MissingRequiredFieldError as MissingRequiredFieldError,
+        FailedSignInError as FailedSignInError,
+        NotSignedInError as NotSignedInError,
+        ServerResponseError as ServerResponseError,
+        Filter as Filter,
+        Pager as Pager,
+        RateLimiter as RateLimiter,
+        ResponseCache as ResponseCache,
+        RetryPolicy as RetryPolicy,
+        Server as Server,
+        Sort as Sort,
+    )
+
+_EXPORTS = {
+    "tableauserverclient.bin._version": ("get_versions",),
+    "tableauserverclient.models": (
+        "BackgroundJobItem",
+        "CollectionItem",
+        "ColumnItem",
+        "ConnectionCredentials",
+        "ConnectionItem",
+        "CustomViewItem",
+        "DQWItem",
+        "DailyInterval",
+        "DataAlertItem",
+        "DatabaseItem",
+        "DataFreshnessPolicyItem",
+        "DatasourceItem",
+        "ExtensionsServer",
+        "ExtensionsSiteSettings",
+        "FavoriteItem",
+        "FlowItem",
+        "FlowRunItem",
+        "FileuploadItem",
+        "GroupItem",
+        "GroupSetItem",
+        "HourlyInterval",
+        "IntervalItem",
+        "JobItem",
+        "JWTAuth",
+        "LinkedTaskItem",
+        "LinkedTaskStepItem",
+        "LinkedTaskFlowRunItem",
+        "LocationItem",
+        "MetricItem",
+        "MonthlyInterval",
+        "PaginationItem",
+        "Permission",
+        "PermissionsRule",
+        "PersonalAccessTokenAuth",
+        "ProjectItem",
+        "Resource",
+        "RevisionItem",
+        "SafeExtension",
+        "ScheduleItem",
+        "SiteAuthConfiguration",
+        "SiteOIDCConfiguration",
+        "SiteItem",
+        "ServerInfoItem",
+        "SubscriptionItem",
+        "TableauItem",
+        "TableItem",
+        "TableauAuth",
+        "Target",
+        "TaskItem",
+        "UserItem",
+        "ViewItem",
+        "VirtualConnectionItem",
+        "WebhookItem",
+        "WeeklyInterval",
+        "WorkbookItem",
+    ),
+    "tableauserverclient.server": (
+        "AdaptiveChunkSize",
+        "AsyncServer",
+        "ChangeFeed",
+        "ChunkProgress",
+        "CSVRequestOptions",
+        "DiskResponseCache",
+        "ExcelRequestOptions",
+        "ImageRequestOptions",
+        "PDFRequestOptions",
+        "PPTXRequestOptions",
+        "RequestOptions",
+        "MissingRequiredFieldError",
+        "FailedSignInError",
+        "NotSignedInError",
+        "ServerResponseError",
+        "Filter",
+        "Pager",
+        "RateLimiter",
+        "ResponseCache",
+        "RetryPolicy",
+        "Server",
+        "Sort",
+    ),
+}
+
+__all__ = ["DEFAULT_NAMESPACE", *(name for names in _EXPORTS.values() for name in names)]
 
-__all__ = [
-    "BackgroundJobItem",
-    "CollectionItem",
-    "ColumnItem",
-    "ConnectionCredentials",
-    "ConnectionItem",
-    "CSVRequestOptions",
-    "CustomViewItem",
-    "DailyInterval",
-    "DataAlertItem",
-    "DatabaseItem",
-    "DataFreshnessPolicyItem",
-    "DatasourceItem",
-    "DEFAULT_NAMESPACE",
-    "DQWItem",
-    "ExcelRequestOptions",
-    "ExtensionsServer",
-    "ExtensionsSiteSettings",
-    "FailedSignInError",
-    "FavoriteItem",
-    "FileuploadItem",
-    "Filter",
-    "FlowItem",
-    "FlowRunItem",
-    "get_versions",
-    "GroupItem",
-    "GroupSetItem",
-    "HourlyInterval",
-    "ImageRequestOptions",
-    "IntervalItem",
-    "JobItem",
-    "JWTAuth",
-    "LinkedTaskFlowRunItem",
-    "LinkedTaskItem",
-    "LinkedTaskStepItem",
-    "LocationItem",
-    "MetricItem",
-    "MissingRequiredFieldError",
-    "MonthlyInterval",
-    "NotSignedInError",
-    "Pager",
-    "PaginationItem",
-    "PDFRequestOptions",
-    "PPTXRequestOptions",
-    "Permission",
-    "PermissionsRule",
-    "PersonalAccessTokenAuth",
-    "ProjectItem",
-    "RequestOptions",
-    "Resource",
-    "RevisionItem",
-    "SafeExtension",
-    "ScheduleItem",
-    "Server",
-    "ServerInfoItem",
-    "ServerResponseError",
-    "SiteItem",
-    "SiteAuthConfiguration",
-    "SiteOIDCConfiguration",
-    "Sort",
-    "SubscriptionItem",
-    "TableauAuth",
-    "TableauItem",
-    "TableItem",
-    "Target",
-    "TaskItem",
-    "UserItem",
-    "ViewItem",
-    "VirtualConnectionItem",
-    "WebhookItem",
-    "WeeklyInterval",
-    "WorkbookItem",
-]
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -1,4 +1,5 @@
 import os
+import sys
 
 ALLOWED_FILE_EXTENSIONS = ["tds", "tdsx", "tde", "hyper", "parquet"]
 
@@ -7,6 +8,15 @@ BYTES_PER_MB = 1024 * 1024
 DELAY_SLEEP_SECONDS = 0.1
 
 
+def _user_cache_dir() -> str:
+    """The directory the platform keeps the current user's caches in."""
+    if os.name == "nt":
+        return os.getenv("LOCALAPPDATA") or os.path.expanduser("~")
+    if sys.platform == "darwin":
+        return os.path.expanduser("~/Library/Caches")
+    return os.getenv("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+
+
 class Config:
     # The maximum size of a file that can be published in a single request is 64MB
     @property
@@ -18,10 +28,49 @@ class Config:
     def CHUNK_SIZE_MB(self):
         return int(os.getenv("TSC_CHUNK_SIZE_MB", 5 * 10))  # 5MB felt too slow, upped it to 50
 
+    # Size chunks from the measured throughput of the previous ones, starting from CHUNK_SIZE_MB
+    @property
+    def CHUNK_SIZE_ADAPTIVE(self):
+        return os.getenv("TSC_CHUNK_SIZE_ADAPTIVE", "false").lower() == "true"
+
+    # Bounds for adaptive chunk sizes. A chunk is sent in one request, so it is never larger than FILESIZE_LIMIT_MB
+    @property
+    def CHUNK_SIZE_MIN_MB(self):
+        return int(os.getenv("TSC_CHUNK_SIZE_MIN_MB", 1))
+
+    @property
+    def CHUNK_SIZE_MAX_MB(self):
+        return min(int(os.getenv("TSC_CHUNK_SIZE_MAX_MB", self.FILESIZE_LIMIT_MB)), self.FILESIZE_LIMIT_MB)
+
+    # Where resumable uploads keep their checkpoints. Only the current user may be able to write to it
+    @property
+    def UPLOAD_CHECKPOINT_DIR(self):
+        return os.getenv("TSC_UPLOAD_CHECKPOINT_DIR", os.path.join(_user_cache_dir(), "tableauserverclient", "uploads"))
+
     # Default page size
     @property
     def PAGE_SIZE(self):
         return int(os.getenv("TSC_PAGE_SIZE", 100))
 
+    # Decode the fields of listed items on first access instead of while parsing
+    @property
+    def LAZY_DECODING(self):
+        return os.getenv("TSC_LAZY_DECODING", "false").lower() == "true"
+
+    # The XML parser for response bodies, "defusedxml" or "lxml"
+    @property
+    def XML_BACKEND(self):
+        return os.getenv("TSC_XML_BACKEND", "defusedxml").lower()
+
+    # Share of responses whose bodies are logged at the TRACE level, from 0 to 1
+    @property
+    def LOG_BODY_SAMPLE_RATE(self):
+        return float(os.getenv("TSC_LOG_BODY_SAMPLE_RATE", 1.0))
+
+    # Longest body, in bytes, that is logged at the TRACE level before it is cut off
+    @property
+    def LOG_BODY_MAX_BYTES(self):
+        return int(os.getenv("TSC_LOG_BODY_MAX_BYTES", 4096))
+
 
 config = Config()
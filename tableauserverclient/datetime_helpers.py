@@ -1,4 +1,5 @@
 import datetime
+from functools import lru_cache
 
 
 ZERO = datetime.timedelta(0)
@@ -28,10 +29,38 @@ utc = UTC()
 TABLEAU_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 
+# Distinct timestamps remembered by parse_datetime. Listings repeat many values, such as the
+# times of jobs queued together, and datetimes are immutable so the parsed values can be shared.
+PARSE_CACHE_SIZE = 4096
+
+
 def parse_datetime(date):
     if date is None:
         return None
 
+    return _parse_tableau_datetime(date)
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_tableau_datetime(date: str):
+    # Timestamps from the server have the exact form 2016-08-03T20:34:04Z. Without the Z that is an
+    # ISO date, which fromisoformat reads several times faster than strptime. Anything else, or a
+    # value fromisoformat rejects, goes through strptime so it parses or fails as it did before.
+    if (
+        len(date) == 20
+        and date[4] == "-"
+        and date[7] == "-"
+        and date[10] == "T"
+        and date[13] == ":"
+        and date[16] == ":"
+        and date[19] == "Z"
+        and date.isascii()
+    ):
+        try:
+            return datetime.datetime.fromisoformat(date[:19]).replace(tzinfo=utc)
+        except ValueError:
+            pass
+
     try:
         return datetime.datetime.strptime(date, TABLEAU_DATE_FORMAT).replace(tzinfo=utc)
     except ValueError:
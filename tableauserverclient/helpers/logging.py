@@ -1,4 +1,128 @@
+"""
+Logging for TSC.
+
+Every request logs one DEBUG record, "GET <url> returned 200 in 12.3 ms",
+with the same details in a structured form on the record's tsc_request
+attribute: method, url, status, elapsed_ms and bytes (from the
+Content-Length header). Nothing about the request is formatted unless DEBUG
+is enabled.
+
+Request and response bodies are only logged at the TRACE level, below
+DEBUG, which is off unless asked for with logger.setLevel(TRACE). Bodies are
+cut off at TSC_LOG_BODY_MAX_BYTES and have passwords, auth tokens, personal
+access token secrets and JWTs redacted, and that work is only done when a
+handler formats the record. With TSC_LOG_BODY_SAMPLE_RATE below 1, only that
+share of bodies is logged. Streamed and binary responses are never read for
+logging.
+"""
+
 import logging
+import random
+import re
+import time
+from typing import Any, Optional
+
+from tableauserverclient.config import config
 
 # TODO change: this defaults to logging *everything* to stdout
 logger = logging.getLogger("TSC")
+
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+# Names of attributes, elements and JSON keys that hold secrets: passwords, the token a sign in or switch site
+# returns and later requests send as X-Tableau-Auth, personal access token secrets and JWTs. Names that only end
+# with one, such as personalAccessTokenSecret or newPassword, count too.
+_SECRET_NAME = r"[\w:.-]*(?:password|token|secret|jwt|x-tableau-auth)"
+# Each alternative keeps the name and replaces the value. A value cut off by max_bytes runs to the end of the text.
+_SECRET_RE = re.compile(
+    rf"""(?P<attribute>\b{_SECRET_NAME}\s*=\s*)(?:"[^"]*"?|'[^']*'?)"""
+    rf"""|(?P<element><{_SECRET_NAME}(?:\s[^>]*)?>)[^<]*"""
+    rf"""|(?P<key>"{_SECRET_NAME}"\s*:\s*)(?:"(?:[^"\\]|\\.)*"?)""",
+    re.IGNORECASE,
+)
+
+
+def _redact_match(match: "re.Match[str]") -> str:
+    if match.group("attribute") is not None:
+        return f'{match.group("attribute")}"[redacted]"'
+    if match.group("element") is not None:
+        return f"{match.group('element')}[redacted]"
+    return f'{match.group("key")}"[redacted]"'
+
+
+def redact_secrets(text: str) -> str:
+    """
+    Replaces the values of secrets in an XML or JSON body with [redacted].
+    It works on text rather than a parsed document, so bodies that are cut
+    off are redacted too.
+    """
+    return _SECRET_RE.sub(_redact_match, text)
+
+
+class RedactedBody:
+    """
+    A request or response body as it appears in a log message: decoded, cut
+    off after max_bytes and with secrets redacted. The work is done when
+    the message is formatted, so a record that no handler emits costs
+    nothing.
+    """
+
+    __slots__ = ("content", "encoding", "max_bytes")
+
+    def __init__(self, content: bytes, encoding: Optional[str], max_bytes: int) -> None:
+        self.content = content
+        self.encoding = encoding
+        self.max_bytes = max_bytes
+
+    def __str__(self) -> str:
+        text = redact_secrets(self.content[: self.max_bytes].decode(self.encoding or "utf-8", errors="replace"))
+        if len(self.content) > self.max_bytes:
+            text += f"... [{len(self.content) - self.max_bytes} more bytes]"
+        return text
+
+
+def log_body_sampled() -> bool:
+    """True if TRACE is enabled and this body is in the sample to log."""
+    if not logger.isEnabledFor(TRACE):
+        return False
+    rate = config.LOG_BODY_SAMPLE_RATE
+    return rate >= 1 or random.random() < rate
+
+
+def log_request_body(method: str, url: str, content: bytes) -> None:
+    if log_body_sampled():
+        logger.log(
+            TRACE, "%s %s request body: %s", method, url, RedactedBody(content, "utf-8", config.LOG_BODY_MAX_BYTES)
+        )
+
+
+def log_response(method: str, url: str, response: Any, started: float, streamed: bool) -> None:
+    """
+    Logs the structured record of a finished request, and at the TRACE level
+    its body, unless the response is streamed or binary.
+    """
+    if not logger.isEnabledFor(logging.DEBUG):
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    length = response.headers.get("Content-Length")
+    details = {
+        "method": method,
+        "url": url,
+        "status": response.status_code,
+        "elapsed_ms": round(elapsed_ms, 1),
+        "bytes": int(length) if length is not None and length.isdigit() else None,
+    }
+    logger.debug(
+        "%s %s returned %s in %.1f ms", method, url, response.status_code, elapsed_ms, extra={"tsc_request": details}
+    )
+    content_type = response.headers.get("Content-Type")
+    if streamed or content_type == "application/octet-stream" or not log_body_sampled() or not response.content:
+        return
+    logger.log(
+        TRACE,
+        "%s %s response body: %s",
+        method,
+        url,
+        RedactedBody(response.content, response.encoding, config.LOG_BODY_MAX_BYTES),
+    )
@@ -0,0 +1,254 @@
+"""
+Parsing of XML response bodies.
+
+Responses are parsed with defusedxml by default. Setting the
+TSC_XML_BACKEND environment variable to "lxml" parses them with lxml
+instead, which is about three times faster on the responses in the test
+suite, when lxml is installed. Without lxml the default is used.
+
+The lxml parser is configured to match defusedxml's protections: entities
+are not resolved, nothing is fetched from the network, no external DTD is
+loaded, and a document that declares entities is rejected with the same
+EntitiesForbidden error. Comments and processing instructions are dropped,
+so elements have the same children as they would with ElementTree. Syntax
+errors raise ElementTree's ParseError for both backends.
+
+Streamed list responses are always read with defusedxml's iterparse.
+
+JSON responses are wrapped in JsonElement, which answers the ElementTree
+calls the model parsers make, so they build the same items from either.
+"""
+
+import json
+import logging
+import re
+import threading
+from functools import lru_cache
+from collections.abc import Iterator
+from typing import Any, Callable, Optional, Union, cast
+from xml.etree.ElementTree import Element, ParseError
+
+from defusedxml import EntitiesForbidden
+from defusedxml.ElementTree import fromstring as defused_fromstring
+
+from tableauserverclient.config import config
+from tableauserverclient.namespace import NEW_NAMESPACE
+
+logger = logging.getLogger("tableau.helpers.parsing")
+
+# What model from_response methods accept: the raw body, or the root element if it was already parsed
+ResponseBody = Union[bytes, str, Element]
+
+DEFUSEDXML = "defusedxml"
+LXML = "lxml"
+
+
+def _lxml_fromstring() -> Callable[[Union[bytes, str]], Any]:
+    from lxml import etree
+
+    # Parsers are not safe to share between threads, and requests may be parsed on a prefetch pool
+    local = threading.local()
+
+    def parser() -> Any:
+        if not hasattr(local, "parser"):
+            local.parser = etree.XMLParser(
+                resolve_entities=False,
+                no_network=True,
+                load_dtd=False,
+                huge_tree=False,
+                remove_comments=True,
+                remove_pis=True,
+            )
+        return local.parser
+
+    def fromstring(text: Union[bytes, str]) -> Any:
+        if isinstance(text, str):
+            # lxml refuses str input that carries an encoding declaration
+            text = text.encode("utf-8")
+        try:
+            root = etree.fromstring(text, parser())
+        except etree.XMLSyntaxError as e:
+            raise ParseError(str(e)) from e
+        dtd = root.getroottree().docinfo.internalDTD
+        if dtd is not None:
+            for entity in dtd.iterentities():
+                raise EntitiesForbidden(entity.name, entity.content, None, entity.system_url, None, None)
+        return root
+
+    return fromstring
+
+
+@lru_cache(maxsize=None)
+def _backend(name: str) -> Callable[[Union[bytes, str]], Any]:
+    if name == LXML:
+        try:
+            return _lxml_fromstring()
+        except ImportError:
+            logger.warning("TSC_XML_BACKEND is lxml but lxml is not installed, parsing with defusedxml.")
+    elif name != DEFUSEDXML:
+        raise ValueError(f"Unknown XML backend {name!r}, expected {DEFUSEDXML!r} or {LXML!r}.")
+    return defused_fromstring
+
+
+def fromstring(text: Union[bytes, str]) -> Element:
+    """Parses an XML document with the configured backend and returns its root element."""
+    return _backend(config.XML_BACKEND)(text)
+
+
+def parse_response(resp: ResponseBody) -> Element:
+    """
+    Parses the body of a response into its root element. An element that has
+    already been parsed is returned as is, so an endpoint can parse a page
+    once and hand the result to both PaginationItem and the item parser.
+    """
+    if isinstance(resp, (bytes, str)):
+        return fromstring(resp)
+    return resp
+
+
+# One step of the paths the model parsers use, such as t:workbook or t:datasource[@id]
+_PATH_STEP_RE = re.compile(r"^(?:\w+:)?(\w+)(?:\[@(\w+)\])?$")
+
+
+def _json_attribute(value: Any) -> Optional[str]:
+    """Renders a JSON scalar the way the same attribute reads in XML."""
+    if value is None or isinstance(value, (dict, list)):
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class JsonElement:
+    """
+    Read-only view of a JSON response object with the ElementTree API the
+    model parsers use: get, attrib, text, iteration and find/findall with
+    paths such as ".//t:owner", "./t:tags", "t:pagination",
+    ".//t:intervals/t:interval" and ".//t:workbook[@id]".
+
+    The REST API renders XML as JSON by turning attributes into keys and
+    child elements into nested objects, or lists of objects when an element
+    repeats. This reverses that mapping: scalar values are attributes, and
+    objects and lists are child elements named by their key. Namespace
+    prefixes in paths are ignored.
+    """
+
+    __slots__ = ("_name", "_value")
+
+    def __init__(self, name: str, value: Any) -> None:
+        self._name = name
+        self._value = value
+
+    def __repr__(self):
+        return f"<JsonElement {self._name}>"
+
+    @property
+    def tag(self) -> str:
+        return f"{{{NEW_NAMESPACE}}}{self._name}"
+
+    @property
+    def text(self) -> Optional[str]:
+        # Elements that only hold text, such as <notes>, are plain values in JSON
+        return None if isinstance(self._value, dict) else _json_attribute(self._value)
+
+    @property
+    def attrib(self) -> dict[str, str]:
+        if not isinstance(self._value, dict):
+            return {}
+        return {
+            key: attribute for key, value in self._value.items() if (attribute := _json_attribute(value)) is not None
+        }
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if not isinstance(self._value, dict):
+            return default
+        attribute = _json_attribute(self._value.get(key))
+        return default if attribute is None else attribute
+
+    def __iter__(self) -> Iterator["JsonElement"]:
+        if not isinstance(self._value, dict):
+            return
+        for key, value in self._value.items():
+            if isinstance(value, list):
+                for entry in value:
+                    yield JsonElement(key, entry)
+            else:
+                # Scalars are attributes too, they are children so text elements such as <summary> can be found
+                yield JsonElement(key, value)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def iter(self) -> Iterator["JsonElement"]:
+        yield self
+        for child in self:
+            yield from child.iter()
+
+    def find(self, path: str, namespaces: Optional[dict[str, str]] = None) -> Optional["JsonElement"]:
+        return next(self._select(path), None)
+
+    def findall(self, path: str, namespaces: Optional[dict[str, str]] = None) -> list["JsonElement"]:
+        return list(self._select(path))
+
+    def _select(self, path: str) -> Iterator["JsonElement"]:
+        if path.startswith(".//"):
+            descendants, path = True, path[3:]
+        else:
+            descendants, path = False, path[2:] if path.startswith("./") else path
+
+        elements: Iterator[JsonElement] = iter((self,))
+        for index, step in enumerate(path.split("/")):
+            match = _PATH_STEP_RE.match(step)
+            if match is None:
+                raise SyntaxError(f"Unsupported path {path!r}")
+            name, required = match.groups()
+            elements = _step(elements, name, required, descendants and index == 0)
+        return elements
+
+
+def _step(
+    elements: Iterator[JsonElement], name: str, required: Optional[str], descendants: bool
+) -> Iterator[JsonElement]:
+    for parent in elements:
+        if not isinstance(parent._value, dict):
+            continue
+        # Match on keys and only wrap the values that match, most of a response is never looked at
+        values = _descendant_values(parent._value, name) if descendants else _entries(parent._value.get(name))
+        for value in values:
+            element = JsonElement(name, value)
+            if required is None or element.get(required) is not None:
+                yield element
+
+
+def _entries(value: Any) -> list[Any]:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _descendant_values(document: dict, name: str) -> Iterator[Any]:
+    # Document order, as ElementTree returns descendants. Most values are scalars, so those are only compared
+    for key, value in document.items():
+        if isinstance(value, dict):
+            if key == name:
+                yield value
+            yield from _descendant_values(value, name)
+        elif isinstance(value, list):
+            for entry in value:
+                if key == name:
+                    yield entry
+                if isinstance(entry, dict):
+                    yield from _descendant_values(entry, name)
+        elif key == name:
+            yield value
+
+
+# Namespace map passed to the model parsers for JSON responses, which JsonElement ignores
+JSON_NAMESPACES = {"t": NEW_NAMESPACE}
+
+
+def parse_json(body: Union[bytes, str, dict]) -> Element:
+    """Wraps a JSON response, raw or already loaded, as the root of a response document."""
+    document = json.loads(body) if isinstance(body, (bytes, str)) else body
+    # Typed as the element it stands in for, so it can be passed to from_response like a parsed XML document
+    return cast(Element, JsonElement("tsResponse", document))
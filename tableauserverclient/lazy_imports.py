@@ -0,0 +1,78 @@
+"""
+Lazy exports for the package __init__ modules.
+
+Importing tableauserverclient used to import every model and endpoint
+module, and requests with them, before a script could do anything. The
+packages now list the modules their names come from, and each name is
+imported from its module the first time it is looked up on the package
+(PEP 562). "import tableauserverclient as TSC" imports almost nothing, and
+TSC.Server or "from tableauserverclient.models import UserItem" import only
+what they need. Subpackages and submodules, such as TSC.server or
+TSC.datetime_helpers, are imported the same way. Each package derives
+__all__ from its exports, and repeats the imports under TYPE_CHECKING as
+"from module import Name as Name" so type checkers and editors still see
+every name as exported.
+"""
+
+import functools
+import importlib
+import pkgutil
+import sys
+from typing import Any, Callable
+
+
+def lazy_exports(
+    package: str, exports: dict[str, tuple[str, ...]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Builds the module __getattr__ and __dir__ of a package.
+
+    Parameters
+    ----------
+    package : str
+        The __name__ of the package.
+
+    exports : dict[str, tuple[str, ...]]
+        The names the package exports, keyed by the module that defines them.
+
+    Returns
+    -------
+    tuple[Callable[[str], Any], Callable[[], list[str]]]
+        The __getattr__ and __dir__ functions to assign in the package.
+    """
+    modules = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = modules.get(name)
+        if module is None:
+            return import_submodule(package, name)
+        value = getattr(importlib.import_module(module), name)
+        # Later lookups find the name directly and do not come back here
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(modules) | set(submodules(package)))
+
+    return __getattr__, __dir__
+
+
+def import_submodule(package: str, name: str) -> Any:
+    """
+    Imports a subpackage or submodule such as TSC.server or TSC.helpers,
+    which an eager __init__ used to import as a side effect. Importing it
+    also sets it on the package, so this runs once per name.
+    """
+    if not name.startswith("__"):
+        try:
+            return importlib.import_module(f"{package}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{package}.{name}":
+                # A module the submodule imports is missing, which is not the same as there being no submodule
+                raise
+    raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+
+@functools.lru_cache
+def submodules(package: str) -> tuple[str, ...]:
+    return tuple(module.name for module in pkgutil.iter_modules(sys.modules[package].__path__))
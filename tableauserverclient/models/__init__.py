@@ -1,120 +1,189 @@
-from tableauserverclient.models.collection_item import CollectionItem
-from tableauserverclient.models.column_item import ColumnItem
-from tableauserverclient.models.connection_credentials import ConnectionCredentials
-from tableauserverclient.models.connection_item import ConnectionItem
-from tableauserverclient.models.custom_view_item import CustomViewItem
-from tableauserverclient.models.data_acceleration_report_item import DataAccelerationReportItem
-from tableauserverclient.models.data_alert_item import DataAlertItem
-from tableauserverclient.models.database_item import DatabaseItem
-from tableauserverclient.models.data_freshness_policy_item import DataFreshnessPolicyItem
-from tableauserverclient.models.datasource_item import DatasourceItem
-from tableauserverclient.models.dqw_item import DQWItem
-from tableauserverclient.models.exceptions import UnpopulatedPropertyError
-from tableauserverclient.models.extensions_item import ExtensionsServer, ExtensionsSiteSettings, SafeExtension
-from tableauserverclient.models.favorites_item import FavoriteItem
-from tableauserverclient.models.fileupload_item import FileuploadItem
-from tableauserverclient.models.flow_item import FlowItem
-from tableauserverclient.models.flow_run_item import FlowRunItem
-from tableauserverclient.models.group_item import GroupItem
-from tableauserverclient.models.groupset_item import GroupSetItem
-from tableauserverclient.models.interval_item import (
-    IntervalItem,
-    DailyInterval,
-    WeeklyInterval,
-    MonthlyInterval,
-    HourlyInterval,
-)
-from tableauserverclient.models.job_item import JobItem, BackgroundJobItem
-from tableauserverclient.models.linked_tasks_item import (
-    LinkedTaskItem,
-    LinkedTaskStepItem,
-    LinkedTaskFlowRunItem,
-)
-from tableauserverclient.models.location_item import LocationItem
-from tableauserverclient.models.metric_item import MetricItem
-from tableauserverclient.models.oidc_item import SiteOIDCConfiguration
-from tableauserverclient.models.pagination_item import PaginationItem
-from tableauserverclient.models.permissions_item import PermissionsRule, Permission
-from tableauserverclient.models.project_item import ProjectItem
-from tableauserverclient.models.revision_item import RevisionItem
-from tableauserverclient.models.schedule_item import ScheduleItem
-from tableauserverclient.models.server_info_item import ServerInfoItem
-from tableauserverclient.models.site_item import SiteItem, SiteAuthConfiguration
-from tableauserverclient.models.subscription_item import SubscriptionItem
-from tableauserverclient.models.table_item import TableItem
-from tableauserverclient.models.tableau_auth import Credentials, TableauAuth, PersonalAccessTokenAuth, JWTAuth
-from tableauserverclient.models.tableau_types import Resource, TableauItem, plural_type
-from tableauserverclient.models.tag_item import TagItem
-from tableauserverclient.models.target import Target
-from tableauserverclient.models.task_item import TaskItem
-from tableauserverclient.models.user_item import UserItem
-from tableauserverclient.models.view_item import ViewItem
-from tableauserverclient.models.virtual_connection_item import VirtualConnectionItem
-from tableauserverclient.models.webhook_item import WebhookItem
-from tableauserverclient.models.workbook_item import WorkbookItem
-from tableauserverclient.models.extract_item import ExtractItem
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "CollectionItem",
-    "ColumnItem",
-    "ConnectionCredentials",
-    "ConnectionItem",
-    "Credentials",
-    "CustomViewItem",
-    "DataAccelerationReportItem",
-    "DataAlertItem",
-    "DatabaseItem",
-    "DataFreshnessPolicyItem",
-    "DatasourceItem",
-    "DQWItem",
-    "UnpopulatedPropertyError",
-    "FavoriteItem",
-    "FileuploadItem",
-    "FlowItem",
-    "FlowRunItem",
-    "GroupItem",
-    "GroupSetItem",
-    "IntervalItem",
-    "JobItem",
-    "DailyInterval",
-    "WeeklyInterval",
-    "MonthlyInterval",
-    "HourlyInterval",
-    "BackgroundJobItem",
-    "LocationItem",
-    "MetricItem",
-    "SiteOIDCConfiguration",
-    "PaginationItem",
-    "Permission",
-    "PermissionsRule",
-    "ProjectItem",
-    "RevisionItem",
-    "ScheduleItem",
-    "ServerInfoItem",
-    "SiteAuthConfiguration",
-    "SiteItem",
-    "SiteOIDCConfiguration",
-    "SubscriptionItem",
-    "TableItem",
-    "TableauAuth",
-    "PersonalAccessTokenAuth",
-    "JWTAuth",
-    "Resource",
-    "TableauItem",
-    "plural_type",
-    "TagItem",
-    "Target",
-    "TaskItem",
-    "UserItem",
-    "ViewItem",
-    "VirtualConnectionItem",
-    "WebhookItem",
-    "WorkbookItem",
-    "LinkedTaskItem",
-    "LinkedTaskStepItem",
-    "LinkedTaskFlowRunItem",
-    "ExtractItem",
-    "ExtensionsServer",
-    "ExtensionsSiteSettings",
-    "SafeExtension",
-]
+from tableauserverclient.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    # Imported as themselves, which marks them as exported for type checkers that cannot read __all__
+    from tableauserverclient.models.collection_item import CollectionItem as CollectionItem
+    from tableauserverclient.models.column_item import ColumnItem as ColumnItem
+    from tableauserverclient.models.connection_credentials import ConnectionCredentials as ConnectionCredentials
+    from tableauserverclient.models.connection_item import ConnectionItem as ConnectionItem
+    from tableauserverclient.models.custom_view_item import CustomViewItem as CustomViewItem
+    from tableauserverclient.models.data_acceleration_report_item import (
+        DataAccelerationReportItem as DataAccelerationReportItem,
+    )
+    from tableauserverclient.models.data_alert_item import DataAlertItem as DataAlertItem
+    from tableauserverclient.models.database_item import DatabaseItem as DatabaseItem
+    from tableauserverclient.models.data_freshness_policy_item import DataFreshnessPolicyItem as DataFreshnessPolicyItem
+    from tableauserverclient.models.datasource_item import DatasourceItem as DatasourceItem
+    from tableauserverclient.models.dqw_item import DQWItem as DQWItem
+    from tableauserverclient.models.exceptions import UnpopulatedPropertyError as UnpopulatedPropertyError
+    from tableauserverclient.models.extensions_item import (
+        ExtensionsServer as ExtensionsServer,
+        ExtensionsSiteSettings as ExtensionsSiteSettings,
+        SafeExtension as SafeExtension,
+    )
+    from tableauserverclient.models.favorites_item import FavoriteItem as FavoriteItem
+    from tableauserverclient.models.fileupload_item import FileuploadItem as FileuploadItem
+    from tableauserverclient.models.flow_item import FlowItem as FlowItem
+    from tableauserverclient.models.flow_run_item import FlowRunItem as FlowRunItem
+    from tableauserverclient.models.group_item import GroupItem as GroupItem
+    from tableauserverclient.models.groupset_item import GroupSetItem as GroupSetItem
+    from tableauserverclient.models.interval_item import (
+        IntervalItem as IntervalItem,
+        DailyInterval as DailyInterval,
+        WeeklyInterval as WeeklyInterval,
+        MonthlyInterval as MonthlyInterval,
+        HourlyInterval as HourlyInterval,
+    )
+    from tableauserverclient.models.job_item import (
+        JobItem as JobItem,
+        BackgroundJobItem as BackgroundJobItem,
+    )
+    from tableauserverclient.models.linked_tasks_item import (
+        LinkedTaskItem as LinkedTaskItem,
+        LinkedTaskStepItem as LinkedTaskStepItem,
+        LinkedTaskFlowRunItem as LinkedTaskFlowRunItem,
+    )
+    from tableauserverclient.models.location_item import LocationItem as LocationItem
+    from tableauserverclient.models.metric_item import MetricItem as MetricItem
+    from tableauserverclient.models.oidc_item import SiteOIDCConfiguration as SiteOIDCConfiguration
+    from tableauserverclient.models.pagination_item import PaginationItem as PaginationItem
+    from tableauserverclient.models.permissions_item import (
+        PermissionsRule as PermissionsRule,
+        Permission as Permission,
+    )
+    from tableauserverclient.models.project_item import ProjectItem as ProjectItem
+    from tableauserverclient.models.records import (
+        DatasourceRecord as DatasourceRecord,
+        GroupRecord as GroupRecord,
+        ModelRecord as ModelRecord,
+        ProjectRecord as ProjectRecord,
+        SiteRecord as SiteRecord,
+        UserRecord as UserRecord,
+        ViewRecord as ViewRecord,
+        WorkbookRecord as WorkbookRecord,
+    )
+    from tableauserverclient.models.revision_item import RevisionItem as RevisionItem
+    from tableauserverclient.models.schedule_item import ScheduleItem as ScheduleItem
+    from tableauserverclient.models.server_info_item import ServerInfoItem as ServerInfoItem
+    from tableauserverclient.models.site_item import (
+        SiteItem as SiteItem,
+        SiteAuthConfiguration as SiteAuthConfiguration,
+    )
+    from tableauserverclient.models.subscription_item import SubscriptionItem as SubscriptionItem
+    from tableauserverclient.models.table_item import TableItem as TableItem
+    from tableauserverclient.models.tableau_auth import (
+        Credentials as Credentials,
+        TableauAuth as TableauAuth,
+        PersonalAccessTokenAuth as PersonalAccessTokenAuth,
+        JWTAuth as JWTAuth,
+    )
+    from tableauserverclient.models.tableau_types import (
+        Resource as Resource,
+        TableauItem as TableauItem,
+        plural_type as plural_type,
+    )
+    from tableauserverclient.models.tag_item import TagItem as TagItem
+    from tableauserverclient.models.target import Target as Target
+    from tableauserverclient.models.task_item import TaskItem as TaskItem
+    from tableauserverclient.models.user_item import UserItem as UserItem
+    from tableauserverclient.models.view_item import ViewItem as ViewItem
+    from tableauserverclient.models.virtual_connection_item import VirtualConnectionItem as VirtualConnectionItem
+    from tableauserverclient.models.webhook_item import WebhookItem as WebhookItem
+    from tableauserverclient.models.workbook_item import WorkbookItem as WorkbookItem
+    from tableauserverclient.models.extract_item import ExtractItem as ExtractItem
+
+_EXPORTS = {
+    "tableauserverclient.models.collection_item": ("CollectionItem",),
+    "tableauserverclient.models.column_item": ("ColumnItem",),
+    "tableauserverclient.models.connection_credentials": ("ConnectionCredentials",),
+    "tableauserverclient.models.connection_item": ("ConnectionItem",),
+    "tableauserverclient.models.custom_view_item": ("CustomViewItem",),
+    "tableauserverclient.models.data_acceleration_report_item": ("DataAccelerationReportItem",),
+    "tableauserverclient.models.data_alert_item": ("DataAlertItem",),
+    "tableauserverclient.models.database_item": ("DatabaseItem",),
+    "tableauserverclient.models.data_freshness_policy_item": ("DataFreshnessPolicyItem",),
+    "tableauserverclient.models.datasource_item": ("DatasourceItem",),
+    "tableauserverclient.models.dqw_item": ("DQWItem",),
+    "tableauserverclient.models.exceptions": ("UnpopulatedPropertyError",),
+    "tableauserverclient.models.extensions_item": (
+        "ExtensionsServer",
+        "ExtensionsSiteSettings",
+        "SafeExtension",
+    ),
+    "tableauserverclient.models.favorites_item": ("FavoriteItem",),
+    "tableauserverclient.models.fileupload_item": ("FileuploadItem",),
+    "tableauserverclient.models.flow_item": ("FlowItem",),
+    "tableauserverclient.models.flow_run_item": ("FlowRunItem",),
+    "tableauserverclient.models.group_item": ("GroupItem",),
+    "tableauserverclient.models.groupset_item": ("GroupSetItem",),
+    "tableauserverclient.models.interval_item": (
+        "IntervalItem",
+        "DailyInterval",
+        "WeeklyInterval",
+        "MonthlyInterval",
+        "HourlyInterval",
+    ),
+    "tableauserverclient.models.job_item": (
+        "JobItem",
+        "BackgroundJobItem",
+    ),
+    "tableauserverclient.models.linked_tasks_item": (
+        "LinkedTaskItem",
+        "LinkedTaskStepItem",
+        "LinkedTaskFlowRunItem",
+    ),
+    "tableauserverclient.models.location_item": ("LocationItem",),
+    "tableauserverclient.models.metric_item": ("MetricItem",),
+    "tableauserverclient.models.oidc_item": ("SiteOIDCConfiguration",),
+    "tableauserverclient.models.pagination_item": ("PaginationItem",),
+    "tableauserverclient.models.permissions_item": (
+        "PermissionsRule",
+        "Permission",
+    ),
+    "tableauserverclient.models.project_item": ("ProjectItem",),
+    "tableauserverclient.models.records": (
+        "DatasourceRecord",
+        "GroupRecord",
+        "ModelRecord",
+        "ProjectRecord",
+        "SiteRecord",
+        "UserRecord",
+        "ViewRecord",
+        "WorkbookRecord",
+    ),
+    "tableauserverclient.models.revision_item": ("RevisionItem",),
+    "tableauserverclient.models.schedule_item": ("ScheduleItem",),
+    "tableauserverclient.models.server_info_item": ("ServerInfoItem",),
+    "tableauserverclient.models.site_item": (
+        "SiteItem",
+        "SiteAuthConfiguration",
+    ),
+    "tableauserverclient.models.subscription_item": ("SubscriptionItem",),
+    "tableauserverclient.models.table_item": ("TableItem",),
+    "tableauserverclient.models.tableau_auth": (
+        "Credentials",
+        "TableauAuth",
+        "PersonalAccessTokenAuth",
+        "JWTAuth",
+    ),
+    "tableauserverclient.models.tableau_types": (
+        "Resource",
+        "TableauItem",
+        "plural_type",
+    ),
+    "tableauserverclient.models.tag_item": ("TagItem",),
+    "tableauserverclient.models.target": ("Target",),
+    "tableauserverclient.models.task_item": ("TaskItem",),
+    "tableauserverclient.models.user_item": ("UserItem",),
+    "tableauserverclient.models.view_item": ("ViewItem",),
+    "tableauserverclient.models.virtual_connection_item": ("VirtualConnectionItem",),
+    "tableauserverclient.models.webhook_item": ("WebhookItem",),
+    "tableauserverclient.models.workbook_item": ("WorkbookItem",),
+    "tableauserverclient.models.extract_item": ("ExtractItem",),
+}
+
+__all__ = [*(name for names in _EXPORTS.values() for name in names)]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
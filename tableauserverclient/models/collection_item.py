@@ -2,11 +2,11 @@ from datetime import datetime
 from typing import Optional
 from xml.etree.ElementTree import Element
 
-from defusedxml.ElementTree import fromstring
 from typing_extensions import Self
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.user_item import UserItem
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class CollectionItem:
@@ -23,7 +23,7 @@ class CollectionItem:
 
     @classmethod
     def from_response(cls, response: bytes, ns) -> list[Self]:
-        parsed_response = fromstring(response)
+        parsed_response = parse_response(response)
 
         collection_elements = parsed_response.findall(".//t:collection", namespaces=ns)
         if not collection_elements:
@@ -1,6 +1,5 @@
-from defusedxml.ElementTree import fromstring
-
 from .property_decorators import property_not_empty
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class ColumnItem:
@@ -50,7 +49,7 @@ class ColumnItem:
     @classmethod
     def from_response(cls, resp, ns):
         all_column_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_column_xml = parsed_response.findall(".//t:column", namespaces=ns)
 
         for column_xml in all_column_xml:
@@ -1,11 +1,11 @@
 import logging
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from .connection_credentials import ConnectionCredentials
 from .property_decorators import property_is_boolean
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class ConnectionItem:
@@ -111,7 +111,7 @@ class ConnectionItem:
     @classmethod
     def from_response(cls, resp, ns) -> list["ConnectionItem"]:
         all_connection_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_connection_xml = parsed_response.findall(".//t:connection", namespaces=ns)
         for connection_xml in all_connection_xml:
             connection_item = cls()
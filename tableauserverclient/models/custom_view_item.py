@@ -1,7 +1,5 @@
 from datetime import datetime
 
-from defusedxml import ElementTree
-from defusedxml.ElementTree import fromstring, tostring
 from typing import Callable, Optional
 from collections.abc import Iterator
 
@@ -10,6 +8,7 @@ from tableauserverclient.models.user_item import UserItem
 from tableauserverclient.models.view_item import ViewItem
 from tableauserverclient.models.workbook_item import WorkbookItem
 from tableauserverclient.datetime_helpers import parse_datetime
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class CustomViewItem:
@@ -180,7 +179,7 @@ class CustomViewItem:
 
     @classmethod
     def list_from_response(cls, resp, ns, workbook_id="") -> list["CustomViewItem"]:
-        return cls.from_xml_element(fromstring(resp), ns, workbook_id)
+        return cls.from_xml_element(parse_response(resp), ns, workbook_id)
 
     """
     <customView
@@ -201,9 +200,9 @@ class CustomViewItem:
         all_view_xml = parsed_response.findall(".//t:customView", namespaces=ns)
         for custom_view_xml in all_view_xml:
             cv_item = cls()
-            view_elem: ElementTree = custom_view_xml.find(".//t:view", namespaces=ns)
-            workbook_elem: str = custom_view_xml.find(".//t:workbook", namespaces=ns)
-            owner_elem: str = custom_view_xml.find(".//t:owner", namespaces=ns)
+            view_elem = custom_view_xml.find(".//t:view", namespaces=ns)
+            workbook_elem = custom_view_xml.find(".//t:workbook", namespaces=ns)
+            owner_elem = custom_view_xml.find(".//t:owner", namespaces=ns)
             cv_item._created_at = parse_datetime(custom_view_xml.get("createdAt", None))
             cv_item._updated_at = parse_datetime(custom_view_xml.get("updatedAt", None))
             cv_item._content_url = custom_view_xml.get("contentUrl", None)
@@ -211,22 +210,17 @@ class CustomViewItem:
             cv_item._name = custom_view_xml.get("name", None)
             cv_item._shared = string_to_bool(custom_view_xml.get("shared", None))
 
+            # The nested items are parsed from the elements found above, not from a serialized copy of the subtree
             if owner_elem is not None:
-                parsed_owners = UserItem.from_response_as_owner(tostring(custom_view_xml), ns)
-                if parsed_owners and len(parsed_owners) > 0:
-                    cv_item._owner = parsed_owners[0]
+                cv_item._owner = UserItem.from_xml(owner_elem, ns)
 
             if view_elem is not None:
-                parsed_views = ViewItem.from_response(tostring(custom_view_xml), ns)
-                if parsed_views and len(parsed_views) > 0:
-                    cv_item._view = parsed_views[0]
+                cv_item._view = ViewItem.from_xml(view_elem, ns)
 
             if workbook_id:
                 cv_item._workbook = WorkbookItem(workbook_id)
             elif workbook_elem is not None:
-                parsed_workbooks = WorkbookItem.from_response(tostring(custom_view_xml), ns)
-                if parsed_workbooks and len(parsed_workbooks) > 0:
-                    cv_item._workbook = parsed_workbooks[0]
+                cv_item._workbook = WorkbookItem.from_xml(workbook_elem, ns)
 
             all_view_items.append(cv_item)
         return all_view_items
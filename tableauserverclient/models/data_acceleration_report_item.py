@@ -1,4 +1,4 @@
-from defusedxml.ElementTree import fromstring
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class DataAccelerationReportItem:
@@ -73,7 +73,7 @@ class DataAccelerationReportItem:
     @classmethod
     def from_response(cls, resp, ns):
         comparison_records = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_comparison_records_xml = parsed_response.findall(".//t:comparisonRecord", namespaces=ns)
         for comparison_record_xml in all_comparison_records_xml:
             (
@@ -1,13 +1,13 @@
 from datetime import datetime
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from .property_decorators import (
     property_not_empty,
     property_is_enum,
     property_is_boolean,
 )
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class DataAlertItem:
@@ -176,7 +176,7 @@ class DataAlertItem:
     @classmethod
     def from_response(cls, resp, ns) -> list["DataAlertItem"]:
         all_alert_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_alert_xml = parsed_response.findall(".//t:dataAlert", namespaces=ns)
 
         for alert_xml in all_alert_xml:
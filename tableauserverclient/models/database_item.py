@@ -1,6 +1,5 @@
 import logging
 
-from defusedxml.ElementTree import fromstring
 
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import (
@@ -8,6 +7,7 @@ from .property_decorators import (
     property_not_empty,
     property_is_boolean,
 )
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class DatabaseItem:
@@ -264,7 +264,7 @@ class DatabaseItem:
     @classmethod
     def from_response(cls, resp, ns):
         all_database_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_database_xml = parsed_response.findall(".//t:database", namespaces=ns)
 
         for database_xml in all_database_xml:
@@ -276,10 +276,10 @@ class DatabaseItem:
 
     @staticmethod
     def _parse_element(database_xml, ns):
-        database_values = database_xml.attrib.copy()
+        database_values = dict(database_xml.attrib)
         contact = database_xml.find(".//t:contact", namespaces=ns)
         if contact is not None:
-            database_values["contact"] = contact.attrib.copy()
+            database_values["contact"] = dict(contact.attrib)
         return database_values
 
 
@@ -1,9 +1,8 @@
 import copy
 import datetime
 import xml.etree.ElementTree as ET
-from typing import Optional
+from typing import Optional, Union
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.helpers.strings import nullable_str_to_bool, nullable_str_to_int
@@ -19,9 +18,11 @@ from tableauserverclient.models.property_decorators import (
 from tableauserverclient.models.revision_item import RevisionItem
 from tableauserverclient.models.tag_item import TagItem
 from tableauserverclient.models.user_item import UserItem
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, ResponseBody, parse_json, parse_response
+from tableauserverclient.models.lazy import Field, LazyDecoding, attribute, child, use_lazy_decoding
 
 
-class DatasourceItem:
+class DatasourceItem(LazyDecoding):
     """
     Represents a Tableau datasource item.
 
@@ -346,8 +347,8 @@ class DatasourceItem:
         self._revisions = revisions
 
     def _parse_common_elements(self, datasource_xml, ns):
-        if not isinstance(datasource_xml, ET.Element):
-            datasource_xml = fromstring(datasource_xml).find(".//t:datasource", namespaces=ns)
+        if isinstance(datasource_xml, (bytes, str)):
+            datasource_xml = parse_response(datasource_xml).find(".//t:datasource", namespaces=ns)
         if datasource_xml is not None:
             (
                 ask_data_enablement,
@@ -440,7 +441,9 @@ class DatasourceItem:
             self._ask_data_enablement = ask_data_enablement
         if certification_note:
             self.certification_note = certification_note
-        self.certified = certified  # Always True/False, not conditional
+        if certified is not None:
+            # Always True/False when parsed
+            self.certified = certified
         if content_url:
             self._content_url = content_url
         if created_at:
@@ -490,95 +493,70 @@ class DatasourceItem:
             self._owner = owner
 
     @classmethod
-    def from_response(cls, resp: bytes, ns: dict) -> list["DatasourceItem"]:
+    def from_json(cls, body: Union[bytes, str, dict]) -> list["DatasourceItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
+    @classmethod
+    def from_response(cls, resp: ResponseBody, ns: dict, lazy: Optional[bool] = None) -> list["DatasourceItem"]:
         all_datasource_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_datasource_xml = parsed_response.findall(".//t:datasource", namespaces=ns)
+        lazy = use_lazy_decoding(lazy)
 
         for datasource_xml in all_datasource_xml:
-            datasource_item = cls.from_xml(datasource_xml, ns)
+            datasource_item = cls.from_xml(datasource_xml, ns, lazy)
             all_datasource_items.append(datasource_item)
         return all_datasource_items
 
     @classmethod
-    def from_xml(cls, datasource_xml, ns):
+    def from_xml(cls, datasource_xml, ns, lazy: Optional[bool] = None):
+        if use_lazy_decoding(lazy):
+            return cls._from_xml_lazy(datasource_xml, ns)
         datasource_item = cls()
         datasource_item._set_values(*cls._parse_element(datasource_xml, ns))
         return datasource_item
 
-    @staticmethod
-    def _parse_element(datasource_xml: ET.Element, ns: dict) -> tuple:
-        id_ = datasource_xml.get("id", None)
-        name = datasource_xml.get("name", None)
-        datasource_type = datasource_xml.get("type", None)
-        description = datasource_xml.get("description", None)
-        content_url = datasource_xml.get("contentUrl", None)
-        created_at = parse_datetime(datasource_xml.get("createdAt", None))
-        updated_at = parse_datetime(datasource_xml.get("updatedAt", None))
-        certification_note = datasource_xml.get("certificationNote", None)
-        certified = str(datasource_xml.get("isCertified", None)).lower() == "true"
-        encrypt_extracts = datasource_xml.get("encryptExtracts", None)
-        has_extracts = datasource_xml.get("hasExtracts", None)
-        use_remote_query_agent = datasource_xml.get("useRemoteQueryAgent", None)
-        webpage_url = datasource_xml.get("webpageUrl", None)
-        size = datasource_xml.get("size", None)
-        connected_workbooks_count = nullable_str_to_int(datasource_xml.get("connectedWorkbooksCount", None))
-        favorites_total = nullable_str_to_int(datasource_xml.get("favoritesTotal", None))
-        has_alert = nullable_str_to_bool(datasource_xml.get("hasAlert", None))
-        is_published = nullable_str_to_bool(datasource_xml.get("isPublished", None))
-        server_name = datasource_xml.get("serverName", None)
-
-        tags = None
-        tags_elem = datasource_xml.find(".//t:tags", namespaces=ns)
-        if tags_elem is not None:
-            tags = TagItem.from_xml_element(tags_elem, ns)
-
-        project_id = None
-        project_name = None
-        project = None
-        project_elem = datasource_xml.find(".//t:project", namespaces=ns)
-        if project_elem is not None:
-            project = ProjectItem.from_xml(project_elem, ns)
-            project_id = project_elem.get("id", None)
-            project_name = project_elem.get("name", None)
-
-        owner_id = None
-        owner = None
-        owner_elem = datasource_xml.find(".//t:owner", namespaces=ns)
-        if owner_elem is not None:
-            owner = UserItem.from_xml(owner_elem, ns)
-            owner_id = owner_elem.get("id", None)
-
-        ask_data_enablement = None
-        ask_data_elem = datasource_xml.find(".//t:askData", namespaces=ns)
-        if ask_data_elem is not None:
-            ask_data_enablement = ask_data_elem.get("enablement", None)
-
-        return (
-            ask_data_enablement,
-            certified,
-            certification_note,
-            content_url,
-            created_at,
-            datasource_type,
-            description,
-            encrypt_extracts,
-            has_extracts,
-            id_,
-            name,
-            owner_id,
-            project_id,
-            project_name,
-            tags,
-            updated_at,
-            use_remote_query_agent,
-            webpage_url,
-            size,
-            connected_workbooks_count,
-            favorites_total,
-            has_alert,
-            is_published,
-            server_name,
-            project,
-            owner,
-        )
+    @classmethod
+    def _parse_element(cls, datasource_xml: ET.Element, ns: dict) -> tuple:
+        return cls._parse_fields(datasource_xml, ns)
+
+
+def _is_true(value: str) -> bool:
+    return value.lower() == "true"
+
+
+# The parameters of _set_values, parsed all at once by _parse_element and one at a time for lazy items
+DatasourceItem._define_fields(
+    {
+        "ask_data_enablement": Field(child("askData", lambda e, ns: e.get("enablement")), ("_ask_data_enablement",)),
+        "certified": Field(attribute("isCertified", _is_true, False), ("_certified",)),
+        "certification_note": Field(attribute("certificationNote"), ("_certification_note",)),
+        "content_url": Field(attribute("contentUrl"), ("_content_url",)),
+        "created_at": Field(attribute("createdAt", parse_datetime), ("_created_at",)),
+        "datasource_type": Field(attribute("type"), ("_datasource_type",)),
+        "description": Field(attribute("description"), ("_description",)),
+        # _set_values converts these three from the strings
+        "encrypt_extracts": Field(attribute("encryptExtracts"), ("_encrypt_extracts",)),
+        "has_extracts": Field(attribute("hasExtracts"), ("_has_extracts",)),
+        "id_": Field(attribute("id"), ("_id",)),
+        "name": Field(attribute("name"), ("name",)),
+        "owner_id": Field(child("owner", lambda e, ns: e.get("id")), ("owner_id",)),
+        "project_id": Field(child("project", lambda e, ns: e.get("id")), ("_project_id",)),
+        "project_name": Field(child("project", lambda e, ns: e.get("name")), ("_project_name",)),
+        "tags": Field(child("tags", TagItem.from_xml_element), ("tags", "_initial_tags")),
+        "updated_at": Field(attribute("updatedAt", parse_datetime), ("_updated_at",)),
+        "use_remote_query_agent": Field(attribute("useRemoteQueryAgent"), ("_use_remote_query_agent",)),
+        "webpage_url": Field(attribute("webpageUrl"), ("_webpage_url",)),
+        "size": Field(attribute("size"), ("_size",)),
+        "connected_workbooks_count": Field(
+            attribute("connectedWorkbooksCount", nullable_str_to_int), ("_connected_workbooks_count",)
+        ),
+        "favorites_total": Field(attribute("favoritesTotal", nullable_str_to_int), ("_favorites_total",)),
+        "has_alert": Field(attribute("hasAlert", nullable_str_to_bool), ("_has_alert",)),
+        "is_published": Field(attribute("isPublished", nullable_str_to_bool), ("_is_published",)),
+        "server_name": Field(attribute("serverName"), ("_server_name",)),
+        "project": Field(child("project", ProjectItem.from_xml), ("_project",)),
+        "owner": Field(child("owner", UserItem.from_xml), ("_owner",)),
+    }
+)
@@ -1,6 +1,5 @@
-from defusedxml.ElementTree import fromstring
-
 from tableauserverclient.datetime_helpers import parse_datetime
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class DQWItem:
@@ -99,7 +98,7 @@ class DQWItem:
 
     @classmethod
     def from_response(cls, resp, ns):
-        return cls.from_xml_element(fromstring(resp), ns)
+        return cls.from_xml_element(parse_response(resp), ns)
 
     @classmethod
     def from_xml_element(cls, parsed_response, ns):
@@ -1,9 +1,9 @@
 from typing import overload
 from typing_extensions import Self
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.models.property_decorators import property_is_boolean
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class ExtensionsServer:
@@ -32,7 +32,7 @@ class ExtensionsServer:
 
     @classmethod
     def from_response(cls: type[Self], response, ns) -> Self:
-        xml = fromstring(response)
+        xml = parse_response(response)
         obj = cls()
         element = xml.find(".//t:extensionsServerSettings", namespaces=ns)
         if element is None:
@@ -138,7 +138,7 @@ class ExtensionsSiteSettings:
 
     @classmethod
     def from_response(cls: type[Self], response, ns) -> Self:
-        xml = fromstring(response)
+        xml = parse_response(response)
         element = xml.find(".//t:extensionsSiteSettings", namespaces=ns)
         obj = cls()
         if element is None:
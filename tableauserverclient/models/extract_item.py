@@ -1,6 +1,6 @@
 from typing import Optional, List
-from defusedxml.ElementTree import fromstring
 import xml.etree.ElementTree as ET
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 
 class ExtractItem:
@@ -51,9 +51,9 @@ class ExtractItem:
         return self._datasource_id
 
     @classmethod
-    def from_response(cls, resp: str, ns: dict) -> List["ExtractItem"]:
+    def from_response(cls, resp: ResponseBody, ns: dict) -> List["ExtractItem"]:
         """Create ExtractItem objects from XML response."""
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         return cls.from_xml_element(parsed_response, ns)
 
     @classmethod
@@ -1,7 +1,6 @@
 import logging
 
 from typing import TypedDict, Union
-from defusedxml.ElementTree import fromstring
 from tableauserverclient.models.collection_item import CollectionItem
 from tableauserverclient.models.datasource_item import DatasourceItem
 from tableauserverclient.models.flow_item import FlowItem
@@ -11,6 +10,7 @@ from tableauserverclient.models.view_item import ViewItem
 from tableauserverclient.models.workbook_item import WorkbookItem
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class FavoriteType(TypedDict):
@@ -35,7 +35,7 @@ class FavoriteItem:
             "views": [],
             "workbooks": [],
         }
-        parsed_response = fromstring(xml)
+        parsed_response = parse_response(xml)
 
         collections_xml = parsed_response.findall(".//t:favorite/t:collection", namespace)
         datasources_xml = parsed_response.findall(".//t:favorite/t:datasource", namespace)
@@ -1,4 +1,4 @@
-from defusedxml.ElementTree import fromstring
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class FileuploadItem:
@@ -16,7 +16,7 @@ class FileuploadItem:
 
     @classmethod
     def from_response(cls, resp, ns):
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         fileupload_elem = parsed_response.find(".//t:fileUpload", namespaces=ns)
         fileupload_item = cls()
         fileupload_item._upload_session_id = fileupload_elem.get("uploadSessionId", None)
@@ -1,9 +1,7 @@
 import copy
 import datetime
-import xml.etree.ElementTree as ET
 from typing import Iterable, Optional
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.connection_item import ConnectionItem
@@ -12,6 +10,7 @@ from tableauserverclient.models.exceptions import UnpopulatedPropertyError
 from tableauserverclient.models.permissions_item import Permission
 from tableauserverclient.models.property_decorators import property_not_nullable
 from tableauserverclient.models.tag_item import TagItem
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class FlowItem:
@@ -150,8 +149,8 @@ class FlowItem:
         self._data_quality_warnings = dqw
 
     def _parse_common_elements(self, flow_xml, ns):
-        if not isinstance(flow_xml, ET.Element):
-            flow_xml = fromstring(flow_xml).find(".//t:flow", namespaces=ns)
+        if isinstance(flow_xml, (bytes, str)):
+            flow_xml = parse_response(flow_xml).find(".//t:flow", namespaces=ns)
         if flow_xml is not None:
             (
                 _,
@@ -217,7 +216,7 @@ class FlowItem:
     @classmethod
     def from_response(cls, resp, ns) -> list["FlowItem"]:
         all_flow_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_flow_xml = parsed_response.findall(".//t:flow", namespaces=ns)
 
         for flow_xml in all_flow_xml:
@@ -2,9 +2,9 @@ import itertools
 from datetime import datetime
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class FlowRunItem:
@@ -73,7 +73,7 @@ class FlowRunItem:
     @classmethod
     def from_response(cls: type["FlowRunItem"], resp: bytes, ns: Optional[dict]) -> list["FlowRunItem"]:
         all_flowrun_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_flowrun_xml = itertools.chain(
             parsed_response.findall(".//t:flowRun[@id]", namespaces=ns),
             parsed_response.findall(".//t:flowRuns[@id]", namespaces=ns),
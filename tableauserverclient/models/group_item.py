@@ -1,12 +1,12 @@
-from typing import Callable, Optional, TYPE_CHECKING
+from typing import Callable, Optional, TYPE_CHECKING, Union
 
-from defusedxml.ElementTree import fromstring
 from typing_extensions import Self
 
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_empty, property_is_enum
 from .reference_item import ResourceReference
 from .user_item import UserItem
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, parse_json, parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Pager
@@ -129,31 +129,37 @@ class GroupItem:
     def user_count(self) -> Optional[int]:
         return self._user_count
 
+    @classmethod
+    def from_json(cls, body: Union[bytes, str, dict]) -> list["GroupItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
     @classmethod
     def from_response(cls, resp, ns) -> list["GroupItem"]:
-        all_group_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_group_xml = parsed_response.findall(".//t:group", namespaces=ns)
-        for group_xml in all_group_xml:
-            name = group_xml.get("name", None)
-            group_item = cls(name)
-            group_item._id = group_xml.get("id", None)
-            group_item._user_count = int(count) if (count := group_xml.get("userCount", None)) else None
-
-            # Domain name is returned in a domain element for some calls
-            domain_elem = group_xml.find(".//t:domain", namespaces=ns)
-            if domain_elem is not None:
-                group_item.domain_name = domain_elem.get("name", None)
-
-            # Import element is returned for both local and AD groups (2020.3+)
-            import_elem = group_xml.find(".//t:import", namespaces=ns)
-            if import_elem is not None:
-                group_item.domain_name = import_elem.get("domainName", None)
-                group_item.license_mode = import_elem.get("grantLicenseMode", None)
-                group_item.minimum_site_role = import_elem.get("siteRole", None)
-
-            all_group_items.append(group_item)
-        return all_group_items
+        return [cls.from_xml(group_xml, ns) for group_xml in all_group_xml]
+
+    @classmethod
+    def from_xml(cls, group_xml, ns) -> "GroupItem":
+        name = group_xml.get("name", None)
+        group_item = cls(name)
+        group_item._id = group_xml.get("id", None)
+        group_item._user_count = int(count) if (count := group_xml.get("userCount", None)) else None
+
+        # Domain name is returned in a domain element for some calls
+        domain_elem = group_xml.find(".//t:domain", namespaces=ns)
+        if domain_elem is not None:
+            group_item.domain_name = domain_elem.get("name", None)
+
+        # Import element is returned for both local and AD groups (2020.3+)
+        import_elem = group_xml.find(".//t:import", namespaces=ns)
+        if import_elem is not None:
+            group_item.domain_name = import_elem.get("domainName", None)
+            group_item.license_mode = import_elem.get("grantLicenseMode", None)
+            group_item.minimum_site_role = import_elem.get("siteRole", None)
+
+        return group_item
 
     @staticmethod
     def as_reference(id_: str) -> ResourceReference:
@@ -1,11 +1,11 @@
 from typing import Optional
 import xml.etree.ElementTree as ET
 
-from defusedxml.ElementTree import fromstring
 from typing_extensions import Self
 
 from tableauserverclient.models.group_item import GroupItem
 from tableauserverclient.models.reference_item import ResourceReference
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 
 class GroupSetItem:
@@ -34,8 +34,8 @@ class GroupSetItem:
         self._name = value
 
     @classmethod
-    def from_response(cls, response: bytes, ns: dict[str, str]) -> list["GroupSetItem"]:
-        parsed_response = fromstring(response)
+    def from_response(cls, response: ResponseBody, ns: dict[str, str]) -> list["GroupSetItem"]:
+        parsed_response = parse_response(response)
         all_groupset_xml = parsed_response.findall(".//t:groupSet", namespaces=ns)
         return [cls.from_xml(xml, ns) for xml in all_groupset_xml]
 
@@ -1,10 +1,10 @@
 import datetime
-from typing import Optional
+from typing import Optional, Union
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.flow_run_item import FlowRunItem
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, parse_json, parse_response
 
 
 class JobItem:
@@ -206,7 +206,7 @@ class JobItem:
 
     @classmethod
     def from_response(cls, xml, ns) -> list["JobItem"]:
-        parsed_response = fromstring(xml)
+        parsed_response = parse_response(xml)
         all_tasks_xml = parsed_response.findall(".//t:job", namespaces=ns)
 
         all_tasks = [JobItem._parse_element(x, ns) for x in all_tasks_xml]
@@ -335,9 +335,14 @@ class BackgroundJobItem:
     def priority(self) -> int:
         return self._priority
 
+    @classmethod
+    def from_json(cls, body: Union[bytes, str, dict]) -> list["BackgroundJobItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
     @classmethod
     def from_response(cls, xml, ns) -> list["BackgroundJobItem"]:
-        parsed_response = fromstring(xml)
+        parsed_response = parse_response(xml)
         all_tasks_xml = parsed_response.findall(".//t:backgroundJob", namespaces=ns)
         return [cls._parse_element(x, ns) for x in all_tasks_xml]
 
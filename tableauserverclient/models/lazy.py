@@ -0,0 +1,229 @@
+"""
+Lazy decoding of parsed model items.
+
+Building a WorkbookItem or DatasourceItem from its element converts every
+attribute up front: timestamps go through strptime, and the owner, project
+and tags are looked up in the subtree and built into items of their own.
+Listings that only read a few fields, such as IDs and names, pay for all of
+it. A lazily decoded item keeps its element instead and decodes each field
+the first time it is read.
+
+Both ways of parsing go through the same table of fields. Each entry is a
+parameter of the model's `_set_values`, with the parser for its value and
+the attributes `_set_values` fills in from it. `_parse_element` runs every
+parser, and a lazy item runs one parser and passes its value to
+`_set_values` alone, so an attribute read from a lazy item has the value
+the eager parser gives it. QuerySet.to_columns reads rows the same way with a
+RowReader, without an item per element.
+
+Lazy decoding is off by default. Set the TSC_LAZY_DECODING environment
+variable to "true" to use it for every listing, or pass lazy=True to
+from_response or from_xml. A lazy item keeps its element until every field
+has been decoded, so it holds more memory than an eager item when most of
+its fields are never read.
+"""
+
+import copy
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, NamedTuple, Optional
+from xml.etree.ElementTree import Element
+
+from tableauserverclient.config import config
+from tableauserverclient.datetime_helpers import parse_datetime
+
+# Parses the value of one field from the item element and the namespace map
+Parser = Callable[[Element, dict[str, str]], Any]
+
+# Marks an attribute a new item does not have
+_MISSING = object()
+
+
+class Field(NamedTuple):
+    """A parameter of _set_values: how its value is parsed, and the instance attributes it fills in."""
+
+    parse: Parser
+    attributes: tuple[str, ...]
+
+
+class Attribute:
+    """Parses an XML attribute of the item element, or returns `default` if it is absent or empty."""
+
+    __slots__ = ("name", "convert", "default")
+
+    def __init__(self, name: str, convert: Optional[Callable[[str], Any]], default: Any) -> None:
+        self.name = name
+        self.convert = convert
+        self.default = default
+
+    def __call__(self, xml: Element, ns: dict[str, str]) -> Any:
+        value = xml.get(self.name)
+        if not value:
+            return self.default
+        return value if self.convert is None else self.convert(value)
+
+
+def attribute(name: str, convert: Optional[Callable[[str], Any]] = None, default: Any = None) -> Parser:
+    return Attribute(name, convert, default)
+
+
+def child(
+    tag: str,
+    convert: Callable[[Element, dict[str, str]], Any],
+    default: Optional[Callable[[], Any]] = None,
+) -> Parser:
+    """
+    Parses the first descendant with the given tag. `default` builds the
+    value used when there is no such element, so mutable defaults are not
+    shared between items.
+    """
+    path = f".//t:{tag}"
+
+    def parse(xml: Element, ns: dict[str, str]) -> Any:
+        element = xml.find(path, namespaces=ns)
+        if element is None:
+            return None if default is None else default()
+        return convert(element, ns)
+
+    return parse
+
+
+def use_lazy_decoding(lazy: Optional[bool]) -> bool:
+    return config.LAZY_DECODING if lazy is None else lazy
+
+
+class RowReader:
+    """
+    Reads attributes of items from their elements without building an item
+    for each. The fields the attributes are filled in from are parsed and
+    passed to `_set_values` of one item that is reused for every element, so
+    the values are those an item parsed from the element has. Built with
+    LazyDecoding._row_reader.
+
+    With `timestamps`, datetime fields are read as the ISO 8601 strings the
+    server sent, in UTC without the trailing Z, for NumPy to convert in one
+    step. The names of those fields are in `timestamps`.
+    """
+
+    def __init__(self, model: type["LazyDecoding"], names: Sequence[str], parameters: list[str], timestamps: bool):
+        self.names = list(names)
+        self._timestamps: dict[int, Attribute] = {}
+        if timestamps:
+            for index, parameter in enumerate(parameters):
+                parse = model._fields[parameter].parse
+                if isinstance(parse, Attribute) and parse.convert is parse_datetime:
+                    self._timestamps[index] = parse
+        self.timestamps = frozenset(self.names[index] for index in self._timestamps)
+        decoded = {parameters[index] for index in range(len(parameters)) if index not in self._timestamps}
+
+        self._item = model()
+        self._attributes = vars(self._item)
+        self._parsers = [(parameter, model._fields[parameter].parse) for parameter in decoded]
+        # _set_values leaves an attribute alone when the element has no value for it, so each element starts from the
+        # values a new item has
+        self._defaults = {
+            name: self._attributes.get(name, _MISSING)
+            for parameter in decoded
+            for name in model._fields[parameter].attributes
+        }
+        self._values: dict[str, Any] = dict.fromkeys(model._fields)
+
+    def __call__(self, xml: Element, ns: dict[str, str]) -> tuple:
+        attributes = self._attributes
+        for name, value in self._defaults.items():
+            if value is _MISSING:
+                attributes.pop(name, None)
+            else:
+                attributes[name] = copy.copy(value)
+        values = self._values
+        for parameter, parse in self._parsers:
+            values[parameter] = parse(xml, ns)
+        self._item._set_values(**values)
+        row = [getattr(self._item, name) for name in self.names]
+        for index, parse in self._timestamps.items():
+            value = xml.get(parse.name)
+            row[index] = value[:-1] if value and value.endswith("Z") else value or None
+        return tuple(row)
+
+
+class LazyDecoding:
+    """
+    Mixin for models that can be decoded lazily. The model's `_set_values`
+    must leave an attribute alone when it is passed None for its parameter.
+    """
+
+    # The parameters of _set_values in order, set with _define_fields
+    _fields: ClassVar[dict[str, Field]] = {}
+    # The parameter each attribute is filled in from
+    _decoded_by: ClassVar[dict[str, str]] = {}
+
+    if TYPE_CHECKING:
+
+        def _set_values(self, *args: Any, **kwargs: Any) -> None: ...
+
+    @classmethod
+    def _define_fields(cls, fields: dict[str, Field]) -> None:
+        cls._fields = fields
+        cls._decoded_by = {name: parameter for parameter, field in fields.items() for name in field.attributes}
+
+    @classmethod
+    def _parse_fields(cls, xml: Element, ns: dict[str, str]) -> tuple:
+        """The values of every field, in the order _set_values takes them."""
+        return tuple(field.parse(xml, ns) for field in cls._fields.values())
+
+    @classmethod
+    def _from_xml_lazy(cls, xml: Element, ns: dict[str, str]) -> Any:
+        item = cls()
+        attributes = vars(item)
+        # Removing the values from __init__ makes the first read fall through to __getattr__. They are kept for
+        # the fields _set_values leaves alone, as it does when the element has no value for them.
+        defaults = {name: attributes.pop(name) for name in cls._decoded_by if name in attributes}
+        attributes["_lazy_source"] = (xml, ns, defaults)
+        return item
+
+    @classmethod
+    def _row_reader(cls, names: Sequence[str], timestamps: bool = False) -> Optional[RowReader]:
+        """
+        A RowReader for the attributes `names`, or None if one of them is not
+        filled in from a field, such as a property computed from others.
+        """
+        parameters = []
+        for name in names:
+            parameter = cls._decoded_by.get(name) or cls._decoded_by.get(f"_{name}")
+            if parameter is None:
+                return None
+            parameters.append(parameter)
+        return RowReader(cls, names, parameters, timestamps)
+
+    def _decode(self, parameter: str) -> None:
+        attributes = vars(self)
+        xml, ns, defaults = attributes["_lazy_source"]
+        field = self._fields[parameter]
+        # Attributes set before they were read keep the value they were set to
+        kept = {name: attributes[name] for name in field.attributes if name in attributes}
+        for name in field.attributes:
+            if name in defaults:
+                attributes[name] = defaults[name]
+        values: dict[str, Any] = dict.fromkeys(self._fields)
+        values[parameter] = field.parse(xml, ns)
+        self._set_values(**values)
+        attributes.update(kept)
+
+    def _decode_all(self) -> None:
+        """Decodes every field that has not been read yet and drops the element, so vars() holds all values."""
+        attributes = vars(self)
+        if "_lazy_source" not in attributes:
+            return
+        for name, parameter in self._decoded_by.items():
+            if name not in attributes:
+                self._decode(parameter)
+        del attributes["_lazy_source"]
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers, which would otherwise accept any attribute on the models
+
+        def __getattr__(self, name: str) -> Any:
+            parameter = type(self)._decoded_by.get(name)
+            if parameter is None or "_lazy_source" not in self.__dict__:
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+            self._decode(parameter)
+            return self.__dict__[name]
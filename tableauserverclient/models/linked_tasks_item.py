@@ -1,10 +1,10 @@
 import datetime as dt
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.schedule_item import ScheduleItem
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 
 class LinkedTaskItem:
@@ -14,8 +14,8 @@ class LinkedTaskItem:
         self.schedule: Optional[ScheduleItem] = None
 
     @classmethod
-    def from_response(cls, resp: bytes, namespace) -> list["LinkedTaskItem"]:
-        parsed_response = fromstring(resp)
+    def from_response(cls, resp: ResponseBody, namespace) -> list["LinkedTaskItem"]:
+        parsed_response = parse_response(resp)
         return [
             cls._parse_element(x, namespace)
             for x in parsed_response.findall(".//t:linkedTasks[@id]", namespaces=namespace)
@@ -86,7 +86,7 @@ class LinkedTaskJobItem:
 
     @classmethod
     def from_response(cls, resp: bytes, namespace) -> "LinkedTaskJobItem":
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         job = cls()
         job_xml = parsed_response.find(".//t:linkedTaskJob[@id]", namespaces=namespace)
         if job_xml is None:
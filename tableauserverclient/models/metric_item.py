@@ -6,6 +6,7 @@ from tableauserverclient.datetime_helpers import parse_datetime
 from .property_decorators import property_is_boolean, property_is_datetime
 from .tag_item import TagItem
 from .permissions_item import Permission
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 
 class MetricItem:
@@ -124,11 +125,11 @@ class MetricItem:
     @classmethod
     def from_response(
         cls,
-        resp: bytes,
+        resp: ResponseBody,
         ns,
     ) -> list["MetricItem"]:
         all_metric_items = list()
-        parsed_response = ET.fromstring(resp)
+        parsed_response = parse_response(resp)
         all_metric_xml = parsed_response.findall(".//t:metric", namespaces=ns)
         for metric_xml in all_metric_xml:
             all_metric_items.append(cls.from_xml(metric_xml, ns))
@@ -1,5 +1,5 @@
 from typing import Optional
-from defusedxml.ElementTree import fromstring
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class SiteOIDCConfiguration:
@@ -45,7 +45,7 @@ class SiteOIDCConfiguration:
         """
         Parses the raw XML bytes and returns a SiteOIDCConfiguration object.
         """
-        root = fromstring(raw_xml)
+        root = parse_response(raw_xml)
         elem = root.find("t:siteOIDCConfiguration", namespaces=ns)
         if elem is None:
             raise ValueError("No siteOIDCConfiguration element found in the XML.")
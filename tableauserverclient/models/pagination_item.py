@@ -1,4 +1,6 @@
-from defusedxml.ElementTree import fromstring
+from typing import Union
+
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, parse_json, parse_response
 
 
 class PaginationItem:
@@ -22,10 +24,19 @@ class PaginationItem:
     def total_available(self) -> int:
         return self._total_available
 
+    @classmethod
+    def from_json(cls, body: Union[bytes, str, dict]) -> "PaginationItem":
+        """Parses a JSON response, raw or already loaded, into the same pagination as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
     @classmethod
     def from_response(cls, resp, ns) -> "PaginationItem":
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         pagination_xml = parsed_response.find("t:pagination", namespaces=ns)
+        return cls.from_xml(pagination_xml)
+
+    @classmethod
+    def from_xml(cls, pagination_xml) -> "PaginationItem":
         pagination_item = cls()
         if pagination_xml is not None:
             pagination_item._page_number = int(pagination_xml.get("pageNumber", "-1"))
@@ -1,7 +1,6 @@
 import xml.etree.ElementTree as ET
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.models.exceptions import UnknownGranteeTypeError, UnpopulatedPropertyError
 from tableauserverclient.models.group_item import GroupItem
@@ -10,6 +9,7 @@ from tableauserverclient.models.reference_item import ResourceReference
 from tableauserverclient.models.user_item import UserItem
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class Permission:
@@ -105,7 +105,7 @@ class PermissionsRule:
 
     @classmethod
     def from_response(cls, resp, ns=None) -> list["PermissionsRule"]:
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
 
         rules = []
         permissions_rules_list_xml = parsed_response.findall(".//t:granteeCapabilities", namespaces=ns)
@@ -1,11 +1,11 @@
 import xml.etree.ElementTree as ET
-from typing import Optional, overload
+from typing import Optional, overload, Union
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
 from tableauserverclient.models.property_decorators import property_is_enum
 from tableauserverclient.models.user_item import UserItem
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, ResponseBody, parse_json, parse_response
 
 
 class ProjectItem:
@@ -292,9 +292,14 @@ class ProjectItem:
         )
 
     @classmethod
-    def from_response(cls, resp: bytes, ns: Optional[dict]) -> list["ProjectItem"]:
+    def from_json(cls, body: Union[bytes, str, dict]) -> list["ProjectItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
+    @classmethod
+    def from_response(cls, resp: ResponseBody, ns: Optional[dict]) -> list["ProjectItem"]:
         all_project_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_project_xml = parsed_response.findall(".//t:project", namespaces=ns)
 
         for project_xml in all_project_xml:
@@ -1,9 +1,9 @@
 from datetime import datetime
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 
 class RevisionItem:
@@ -56,9 +56,9 @@ class RevisionItem:
         )
 
     @classmethod
-    def from_response(cls, resp: bytes, ns, resource_item) -> list["RevisionItem"]:
+    def from_response(cls, resp: ResponseBody, ns, resource_item) -> list["RevisionItem"]:
         all_revision_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_revision_xml = parsed_response.findall(".//t:revision", namespaces=ns)
         for revision_xml in all_revision_xml:
             revision_item = cls()
@@ -1,8 +1,6 @@
-import xml.etree.ElementTree as ET
 from datetime import datetime
 from typing import Optional, Union, TYPE_CHECKING
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from .interval_item import (
@@ -15,6 +13,7 @@ from .interval_item import (
 from .property_decorators import (
     property_is_enum,
 )
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from requests import Response
@@ -184,8 +183,8 @@ class ScheduleItem:
         return self._warnings
 
     def _parse_common_tags(self, schedule_xml, ns):
-        if not isinstance(schedule_xml, ET.Element):
-            schedule_xml = fromstring(schedule_xml).find(".//t:schedule", namespaces=ns)
+        if isinstance(schedule_xml, (bytes, str)):
+            schedule_xml = parse_response(schedule_xml).find(".//t:schedule", namespaces=ns)
         if schedule_xml is not None:
             (
                 _,
@@ -259,7 +258,7 @@ class ScheduleItem:
 
     @classmethod
     def from_response(cls, resp, ns):
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         return cls.from_element(parsed_response, ns)
 
     @classmethod
@@ -392,7 +391,7 @@ class ScheduleItem:
 
     @staticmethod
     def parse_add_to_schedule_response(response, ns):
-        parsed_response = fromstring(response.content)
+        parsed_response = parse_response(response.content)
         warnings = ScheduleItem._read_warnings(parsed_response, ns)
         all_task_xml = parsed_response.findall(".//t:task", namespaces=ns)
 
@@ -414,5 +413,5 @@ class ScheduleItem:
 
 
 def parse_batch_schedule_state(response: "Response", ns) -> list[str]:
-    xml = fromstring(response.content)
+    xml = parse_response(response.content)
     return [text for tag in xml.findall(".//t:scheduleLuid", namespaces=ns) if (text := tag.text)]
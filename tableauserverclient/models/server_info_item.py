@@ -2,8 +2,8 @@ import logging
 import warnings
 import xml
 
-from defusedxml.ElementTree import fromstring
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class ServerInfoItem:
@@ -60,7 +60,7 @@ class ServerInfoItem:
     @classmethod
     def from_response(cls, resp, ns):
         try:
-            parsed_response = fromstring(resp)
+            parsed_response = parse_response(resp)
         except xml.etree.ElementTree.ParseError as error:
             logger.exception(f"Unexpected response for ServerInfo: {resp}")
             return cls("Unknown", "Unknown", "Unknown")
@@ -1,7 +1,5 @@
 import warnings
-import xml.etree.ElementTree as ET
 
-from defusedxml.ElementTree import fromstring
 
 from .property_decorators import (
     property_is_enum,
@@ -15,6 +13,7 @@ from .property_decorators import (
 VALID_CONTENT_URL_RE = r"^[a-zA-Z0-9_\-]*$"
 
 from typing import Optional, Union, TYPE_CHECKING
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Server
@@ -670,8 +669,8 @@ class SiteItem:
         self.user_quota = value
 
     def _parse_common_tags(self, site_xml, ns):
-        if not isinstance(site_xml, ET.Element):
-            site_xml = fromstring(site_xml).find(".//t:site", namespaces=ns)
+        if isinstance(site_xml, (bytes, str)):
+            site_xml = parse_response(site_xml).find(".//t:site", namespaces=ns)
         if site_xml is not None:
             (
                 _,
@@ -949,122 +948,123 @@ class SiteItem:
 
     @classmethod
     def from_response(cls, resp, ns) -> list["SiteItem"]:
-        all_site_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_site_xml = parsed_response.findall(".//t:site", namespaces=ns)
-        for site_xml in all_site_xml:
-            (
-                id,
-                name,
-                content_url,
-                status_reason,
-                admin_mode,
-                state,
-                subscribe_others_enabled,
-                disable_subscriptions,
-                revision_history_enabled,
-                user_quota,
-                storage_quota,
-                revision_limit,
-                num_users,
-                storage,
-                data_acceleration_mode,
-                flows_enabled,
-                cataloging_enabled,
-                editing_flows_enabled,
-                scheduling_flows_enabled,
-                allow_subscription_attachments,
-                guest_access_enabled,
-                cache_warmup_enabled,
-                commenting_enabled,
-                extract_encryption_mode,
-                request_access_enabled,
-                run_now_enabled,
-                tier_explorer_capacity,
-                tier_creator_capacity,
-                tier_viewer_capacity,
-                data_alerts_enabled,
-                commenting_mentions_enabled,
-                catalog_obfuscation_enabled,
-                flow_auto_save_enabled,
-                web_extraction_enabled,
-                metrics_content_type_enabled,
-                notify_site_admins_on_throttle,
-                authoring_enabled,
-                custom_subscription_email_enabled,
-                custom_subscription_email,
-                custom_subscription_footer_enabled,
-                custom_subscription_footer,
-                ask_data_mode,
-                named_sharing_enabled,
-                mobile_biometrics_enabled,
-                sheet_image_enabled,
-                derived_permissions_enabled,
-                user_visibility_mode,
-                use_default_time_zone,
-                time_zone,
-                auto_suspend_refresh_enabled,
-                auto_suspend_refresh_inactivity_window,
-                attribute_capture_enabled,
-            ) = cls._parse_element(site_xml, ns)
+        return [cls.from_xml(site_xml, ns) for site_xml in all_site_xml]
 
-            site_item = cls(name, content_url)
-            site_item._set_values(
-                id,
-                name,
-                content_url,
-                status_reason,
-                admin_mode,
-                state,
-                subscribe_others_enabled,
-                disable_subscriptions,
-                revision_history_enabled,
-                user_quota,
-                storage_quota,
-                revision_limit,
-                num_users,
-                storage,
-                data_acceleration_mode,
-                flows_enabled,
-                cataloging_enabled,
-                editing_flows_enabled,
-                scheduling_flows_enabled,
-                allow_subscription_attachments,
-                guest_access_enabled,
-                cache_warmup_enabled,
-                commenting_enabled,
-                extract_encryption_mode,
-                request_access_enabled,
-                run_now_enabled,
-                tier_explorer_capacity,
-                tier_creator_capacity,
-                tier_viewer_capacity,
-                data_alerts_enabled,
-                commenting_mentions_enabled,
-                catalog_obfuscation_enabled,
-                flow_auto_save_enabled,
-                web_extraction_enabled,
-                metrics_content_type_enabled,
-                notify_site_admins_on_throttle,
-                authoring_enabled,
-                custom_subscription_email_enabled,
-                custom_subscription_email,
-                custom_subscription_footer_enabled,
-                custom_subscription_footer,
-                ask_data_mode,
-                named_sharing_enabled,
-                mobile_biometrics_enabled,
-                sheet_image_enabled,
-                derived_permissions_enabled,
-                user_visibility_mode,
-                use_default_time_zone,
-                time_zone,
-                auto_suspend_refresh_enabled,
-                auto_suspend_refresh_inactivity_window,
-                attribute_capture_enabled,
-            )
-            all_site_items.append(site_item)
-        return all_site_items
+    @classmethod
+    def from_xml(cls, site_xml, ns) -> "SiteItem":
+        (
+            id,
+            name,
+            content_url,
+            status_reason,
+            admin_mode,
+            state,
+            subscribe_others_enabled,
+            disable_subscriptions,
+            revision_history_enabled,
+            user_quota,
+            storage_quota,
+            revision_limit,
+            num_users,
+            storage,
+            data_acceleration_mode,
+            flows_enabled,
+            cataloging_enabled,
+            editing_flows_enabled,
+            scheduling_flows_enabled,
+            allow_subscription_attachments,
+            guest_access_enabled,
+            cache_warmup_enabled,
+            commenting_enabled,
+            extract_encryption_mode,
+            request_access_enabled,
+            run_now_enabled,
+            tier_explorer_capacity,
+            tier_creator_capacity,
+            tier_viewer_capacity,
+            data_alerts_enabled,
+            commenting_mentions_enabled,
+            catalog_obfuscation_enabled,
+            flow_auto_save_enabled,
+            web_extraction_enabled,
+            metrics_content_type_enabled,
+            notify_site_admins_on_throttle,
+            authoring_enabled,
+            custom_subscription_email_enabled,
+            custom_subscription_email,
+            custom_subscription_footer_enabled,
+            custom_subscription_footer,
+            ask_data_mode,
+            named_sharing_enabled,
+            mobile_biometrics_enabled,
+            sheet_image_enabled,
+            derived_permissions_enabled,
+            user_visibility_mode,
+            use_default_time_zone,
+            time_zone,
+            auto_suspend_refresh_enabled,
+            auto_suspend_refresh_inactivity_window,
+            attribute_capture_enabled,
+        ) = cls._parse_element(site_xml, ns)
+
+        site_item = cls(name, content_url)
+        site_item._set_values(
+            id,
+            name,
+            content_url,
+            status_reason,
+            admin_mode,
+            state,
+            subscribe_others_enabled,
+            disable_subscriptions,
+            revision_history_enabled,
+            user_quota,
+            storage_quota,
+            revision_limit,
+            num_users,
+            storage,
+            data_acceleration_mode,
+            flows_enabled,
+            cataloging_enabled,
+            editing_flows_enabled,
+            scheduling_flows_enabled,
+            allow_subscription_attachments,
+            guest_access_enabled,
+            cache_warmup_enabled,
+            commenting_enabled,
+            extract_encryption_mode,
+            request_access_enabled,
+            run_now_enabled,
+            tier_explorer_capacity,
+            tier_creator_capacity,
+            tier_viewer_capacity,
+            data_alerts_enabled,
+            commenting_mentions_enabled,
+            catalog_obfuscation_enabled,
+            flow_auto_save_enabled,
+            web_extraction_enabled,
+            metrics_content_type_enabled,
+            notify_site_admins_on_throttle,
+            authoring_enabled,
+            custom_subscription_email_enabled,
+            custom_subscription_email,
+            custom_subscription_footer_enabled,
+            custom_subscription_footer,
+            ask_data_mode,
+            named_sharing_enabled,
+            mobile_biometrics_enabled,
+            sheet_image_enabled,
+            derived_permissions_enabled,
+            user_visibility_mode,
+            use_default_time_zone,
+            time_zone,
+            auto_suspend_refresh_enabled,
+            auto_suspend_refresh_inactivity_window,
+            attribute_capture_enabled,
+        )
+        return site_item
 
     @staticmethod
     def _parse_element(site_xml, ns):
@@ -1218,7 +1218,7 @@ class SiteAuthConfiguration:
     @classmethod
     def from_response(cls, resp: bytes, ns: dict) -> list["SiteAuthConfiguration"]:
         all_auth_configs = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_auth_xml = parsed_response.findall(".//t:siteAuthConfiguration", namespaces=ns)
         for auth_xml in all_auth_xml:
             auth_config = cls()
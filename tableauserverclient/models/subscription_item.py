@@ -1,10 +1,10 @@
 from typing import TYPE_CHECKING
 
-from defusedxml.ElementTree import fromstring
 
 from .property_decorators import property_is_boolean
 from .target import Target
-from tableauserverclient.models import ScheduleItem
+from .schedule_item import ScheduleItem
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 if TYPE_CHECKING:
     from .target import Target
@@ -79,8 +79,8 @@ class SubscriptionItem:
         self._suspended = value
 
     @classmethod
-    def from_response(cls: type, xml: bytes, ns) -> list["SubscriptionItem"]:
-        parsed_response = fromstring(xml)
+    def from_response(cls: type, xml: ResponseBody, ns) -> list["SubscriptionItem"]:
+        parsed_response = parse_response(xml)
         all_subscriptions_xml = parsed_response.findall(".//t:subscription", namespaces=ns)
 
         all_subscriptions = [SubscriptionItem._parse_element(x, ns) for x in all_subscriptions_xml]
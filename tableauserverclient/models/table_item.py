@@ -1,8 +1,8 @@
 from typing import Callable, Optional, TYPE_CHECKING
-from defusedxml.ElementTree import fromstring
 
 from .exceptions import UnpopulatedPropertyError
 from .property_decorators import property_not_empty, property_is_boolean
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.models import DQWItem
@@ -138,7 +138,7 @@ class TableItem:
     @classmethod
     def from_response(cls, resp, ns):
         all_table_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_table_xml = parsed_response.findall(".//t:table", namespaces=ns)
 
         for table_xml in all_table_xml:
@@ -150,11 +150,11 @@ class TableItem:
 
     @staticmethod
     def _parse_element(table_xml, ns):
-        table_values = table_xml.attrib.copy()
+        table_values = dict(table_xml.attrib)
 
         contact = table_xml.find(".//t:contact", namespaces=ns)
         if contact is not None:
-            table_values["contact"] = contact.attrib.copy()
+            table_values["contact"] = dict(contact.attrib)
 
         return table_values
 
@@ -1,12 +1,11 @@
 import xml.etree.ElementTree as ET
-
-from defusedxml.ElementTree import fromstring
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class TagItem:
     @classmethod
     def from_response(cls, resp: bytes, ns) -> set[str]:
-        return cls.from_xml_element(fromstring(resp), ns)
+        return cls.from_xml_element(parse_response(resp), ns)
 
     @classmethod
     def from_xml_element(cls, parsed_response: ET.Element, ns) -> set[str]:
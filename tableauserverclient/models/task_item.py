@@ -1,11 +1,11 @@
 from datetime import datetime
 from typing import Optional
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.schedule_item import ScheduleItem
 from tableauserverclient.models.target import Target
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class TaskItem:
@@ -79,7 +79,7 @@ class TaskItem:
 
     @classmethod
     def from_response(cls, xml, ns, task_type=Type.ExtractRefresh) -> list["TaskItem"]:
-        parsed_response = fromstring(xml)
+        parsed_response = parse_response(xml)
         all_tasks_xml = parsed_response.findall(f".//t:task/t:{task_type}", namespaces=ns)
 
         all_tasks = (TaskItem._parse_element(x, ns) for x in all_tasks_xml)
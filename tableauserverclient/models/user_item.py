@@ -2,9 +2,8 @@ import io
 import xml.etree.ElementTree as ET
 from datetime import datetime
 from enum import IntEnum
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Union
 
-from defusedxml.ElementTree import fromstring
 from typing_extensions import Self
 
 from tableauserverclient.datetime_helpers import parse_datetime
@@ -15,6 +14,7 @@ from .property_decorators import (
     property_not_empty,
 )
 from .reference_item import ResourceReference
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, parse_json, parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Pager
@@ -260,8 +260,8 @@ class UserItem:
         self._groups = groups
 
     def _parse_common_tags(self, user_xml, ns) -> "UserItem":
-        if not isinstance(user_xml, ET.Element):
-            user_xml = fromstring(user_xml).find(".//t:user", namespaces=ns)
+        if isinstance(user_xml, (bytes, str)):
+            user_xml = parse_response(user_xml).find(".//t:user", namespaces=ns)
         if user_xml is not None:
             (
                 _,
@@ -320,15 +320,18 @@ class UserItem:
         if idp_configuration_id:
             self._idp_configuration_id = idp_configuration_id
 
+    @classmethod
+    def from_json(cls, body: Union[bytes, str, dict]) -> list["UserItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
     @classmethod
     def from_response(cls, resp, ns) -> list["UserItem"]:
-        element_name = ".//t:user"
-        return cls._parse_xml(element_name, resp, ns)
+        return cls.from_xml_element(parse_response(resp), ns)
 
     @classmethod
     def from_response_as_owner(cls, resp, ns) -> list["UserItem"]:
-        element_name = ".//t:owner"
-        return cls._parse_xml(element_name, resp, ns)
+        return cls.from_xml_element(parse_response(resp), ns, ".//t:owner")
 
     @classmethod
     def from_xml(cls, xml: ET.Element, ns: Optional[dict] = None) -> "UserItem":
@@ -337,9 +340,8 @@ class UserItem:
         return item
 
     @classmethod
-    def _parse_xml(cls, element_name, resp, ns):
+    def from_xml_element(cls, parsed_response, ns, element_name=".//t:user") -> list["UserItem"]:
         all_user_items = []
-        parsed_response = fromstring(resp)
         all_user_xml = parsed_response.findall(element_name, namespaces=ns)
         for user_xml in all_user_xml:
             (
@@ -1,10 +1,8 @@
 import copy
 from datetime import datetime
-from requests import Response
-from typing import TYPE_CHECKING, Callable, Optional, overload
+from typing import TYPE_CHECKING, Callable, Optional, overload, Union
 from collections.abc import Iterator
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
@@ -13,6 +11,7 @@ from tableauserverclient.models.permissions_item import PermissionsRule
 from tableauserverclient.models.project_item import ProjectItem
 from tableauserverclient.models.tag_item import TagItem
 from tableauserverclient.models.user_item import UserItem
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, ResponseBody, parse_json, parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.models.workbook_item import WorkbookItem
@@ -258,8 +257,13 @@ class ViewItem:
         self._permissions = permissions
 
     @classmethod
-    def from_response(cls, resp: "Response", ns, workbook_id="") -> list["ViewItem"]:
-        return cls.from_xml_element(fromstring(resp), ns, workbook_id)
+    def from_json(cls, body: Union[bytes, str, dict], workbook_id="") -> list["ViewItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES, workbook_id)
+
+    @classmethod
+    def from_response(cls, resp: ResponseBody, ns, workbook_id="") -> list["ViewItem"]:
+        return cls.from_xml_element(parse_response(resp), ns, workbook_id)
 
     @classmethod
     def from_xml_element(cls, parsed_response, ns, workbook_id="") -> list["ViewItem"]:
@@ -4,12 +4,12 @@ from typing import Callable, Optional
 from collections.abc import Iterable
 from xml.etree.ElementTree import Element
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.connection_item import ConnectionItem
 from tableauserverclient.models.exceptions import UnpopulatedPropertyError
 from tableauserverclient.models.permissions_item import PermissionsRule
+from tableauserverclient.helpers.parsing import ResponseBody, parse_response
 
 
 class VirtualConnectionItem:
@@ -54,8 +54,8 @@ class VirtualConnectionItem:
         return self._connections()
 
     @classmethod
-    def from_response(cls, response: bytes, ns: dict[str, str]) -> list["VirtualConnectionItem"]:
-        parsed_response = fromstring(response)
+    def from_response(cls, response: ResponseBody, ns: dict[str, str]) -> list["VirtualConnectionItem"]:
+        parsed_response = parse_response(response)
         return [cls.from_xml(xml, ns) for xml in parsed_response.findall(".//t:virtualConnection[@name]", ns)]
 
     @classmethod
@@ -1,8 +1,8 @@
 import re
 import xml.etree.ElementTree as ET
 from typing import Optional
+from tableauserverclient.helpers.parsing import parse_response
 
-from defusedxml.ElementTree import fromstring
 
 NAMESPACE_RE = re.compile(r"^{.*}")
 
@@ -83,7 +83,7 @@ class WebhookItem:
     @classmethod
     def from_response(cls: type["WebhookItem"], resp: bytes, ns) -> list["WebhookItem"]:
         all_webhooks_items = list()
-        parsed_response = fromstring(resp)
+        parsed_response = parse_response(resp)
         all_webhooks_xml = parsed_response.findall(".//t:webhook", namespaces=ns)
         for webhook_xml in all_webhooks_xml:
             values = cls._parse_element(webhook_xml, ns)
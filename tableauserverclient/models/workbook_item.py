@@ -1,10 +1,8 @@
 import copy
 import datetime
 import uuid
-import xml.etree.ElementTree as ET
-from typing import Callable, Optional, overload
+from typing import Callable, Optional, overload, Union
 
-from defusedxml.ElementTree import fromstring
 
 from tableauserverclient.datetime_helpers import parse_datetime
 from tableauserverclient.models.location_item import LocationItem
@@ -21,9 +19,11 @@ from .revision_item import RevisionItem
 from .tag_item import TagItem
 from .view_item import ViewItem
 from .data_freshness_policy_item import DataFreshnessPolicyItem
+from tableauserverclient.helpers.parsing import JSON_NAMESPACES, ResponseBody, parse_json, parse_response
+from tableauserverclient.models.lazy import Field, LazyDecoding, attribute, child, use_lazy_decoding
 
 
-class WorkbookItem:
+class WorkbookItem(LazyDecoding):
     """
     The workbook resources for Tableau are defined in the WorkbookItem class.
     The class corresponds to the workbook resources you can access using the
@@ -181,6 +181,7 @@ class WorkbookItem:
         )
 
     def __repr__(self):
+        self._decode_all()
         return self.__str__() + "  { " + ", ".join(" % s: % s" % item for item in vars(self).items()) + "}"
 
     @property
@@ -391,8 +392,8 @@ class WorkbookItem:
         self._revisions = revisions
 
     def _parse_common_tags(self, workbook_xml, ns):
-        if not isinstance(workbook_xml, ET.Element):
-            workbook_xml = fromstring(workbook_xml).find(".//t:workbook", namespaces=ns)
+        if isinstance(workbook_xml, (bytes, str)):
+            workbook_xml = parse_response(workbook_xml).find(".//t:workbook", namespaces=ns)
         if workbook_xml is not None:
             (
                 _,
@@ -533,117 +534,35 @@ class WorkbookItem:
             self._last_published_at = last_published_at
 
     @classmethod
-    def from_response(cls, resp: str, ns: dict[str, str]) -> list["WorkbookItem"]:
+    def from_json(cls, body: Union[bytes, str, dict]) -> list["WorkbookItem"]:
+        """Parses a JSON response, raw or already loaded, into the same items as from_response."""
+        return cls.from_response(parse_json(body), JSON_NAMESPACES)
+
+    @classmethod
+    def from_response(cls, resp: ResponseBody, ns: dict[str, str], lazy: Optional[bool] = None) -> list["WorkbookItem"]:
+        return cls.from_xml_element(parse_response(resp), ns, lazy)
+
+    @classmethod
+    def from_xml_element(cls, parsed_response, ns: dict[str, str], lazy: Optional[bool] = None) -> list["WorkbookItem"]:
         all_workbook_items = list()
-        parsed_response = fromstring(resp)
         all_workbook_xml = parsed_response.findall(".//t:workbook", namespaces=ns)
+        lazy = use_lazy_decoding(lazy)
         for workbook_xml in all_workbook_xml:
-            workbook_item = cls.from_xml(workbook_xml, ns)
+            workbook_item = cls.from_xml(workbook_xml, ns, lazy)
             all_workbook_items.append(workbook_item)
         return all_workbook_items
 
     @classmethod
-    def from_xml(cls, workbook_xml, ns):
+    def from_xml(cls, workbook_xml, ns, lazy: Optional[bool] = None):
+        if use_lazy_decoding(lazy):
+            return cls._from_xml_lazy(workbook_xml, ns)
         workbook_item = cls()
         workbook_item._set_values(*cls._parse_element(workbook_xml, ns))
         return workbook_item
 
-    @staticmethod
-    def _parse_element(workbook_xml, ns):
-        id = workbook_xml.get("id", None)
-        name = workbook_xml.get("name", None)
-        content_url = workbook_xml.get("contentUrl", None)
-        webpage_url = workbook_xml.get("webpageUrl", None)
-        created_at = parse_datetime(workbook_xml.get("createdAt", None))
-        description = workbook_xml.get("description", None)
-        updated_at = parse_datetime(workbook_xml.get("updatedAt", None))
-        sheet_count = string_to_int(workbook_xml.get("sheetCount", None))
-        has_extracts = string_to_bool(workbook_xml.get("hasExtracts", ""))
-        encrypt_extracts = string_to_bool(e) if (e := workbook_xml.get("encryptExtracts", None)) is not None else None
-        default_view_id = workbook_xml.get("defaultViewId", None)
-        share_description = workbook_xml.get("shareDescription", None)
-        last_published_at = parse_datetime(workbook_xml.get("lastPublishedAt", None))
-
-        size = workbook_xml.get("size", None)
-        if size:
-            size = int(size)
-
-        show_tabs = string_to_bool(workbook_xml.get("showTabs", ""))
-
-        project_id = None
-        project_name = None
-        project = None
-        project_tag = workbook_xml.find(".//t:project", namespaces=ns)
-        if project_tag is not None:
-            project = ProjectItem.from_xml(project_tag, ns)
-            project_id = project_tag.get("id", None)
-            project_name = project_tag.get("name", None)
-
-        owner_id = None
-        owner = None
-        owner_tag = workbook_xml.find(".//t:owner", namespaces=ns)
-        if owner_tag is not None:
-            owner = UserItem.from_xml(owner_tag, ns)
-            owner_id = owner_tag.get("id", None)
-
-        tags = None
-        tags_elem = workbook_xml.find(".//t:tags", namespaces=ns)
-        if tags_elem is not None:
-            all_tags = TagItem.from_xml_element(tags_elem, ns)
-            tags = all_tags
-
-        views = None
-        views_elem = workbook_xml.find(".//t:views", namespaces=ns)
-        if views_elem is not None:
-            views = ViewItem.from_xml_element(views_elem, ns)
-
-        location = None
-        location_elem = workbook_xml.find(".//t:location", namespaces=ns)
-        if location_elem is not None:
-            location = LocationItem.from_xml(location_elem, ns)
-
-        data_acceleration_config = {
-            "acceleration_enabled": None,
-            "accelerate_now": None,
-            "last_updated_at": None,
-            "acceleration_status": None,
-        }
-        data_acceleration_elem = workbook_xml.find(".//t:dataAccelerationConfig", namespaces=ns)
-        if data_acceleration_elem is not None:
-            data_acceleration_config = parse_data_acceleration_config(data_acceleration_elem)
-
-        data_freshness_policy = None
-        data_freshness_policy_elem = workbook_xml.find(".//t:dataFreshnessPolicy", namespaces=ns)
-        if data_freshness_policy_elem is not None:
-            data_freshness_policy = DataFreshnessPolicyItem.from_xml_element(data_freshness_policy_elem, ns)
-
-        return (
-            id,
-            name,
-            content_url,
-            webpage_url,
-            created_at,
-            description,
-            updated_at,
-            size,
-            show_tabs,
-            project_id,
-            project_name,
-            owner_id,
-            tags,
-            views,
-            data_acceleration_config,
-            data_freshness_policy,
-            sheet_count,
-            has_extracts,
-            project,
-            owner,
-            location,
-            encrypt_extracts,
-            default_view_id,
-            share_description,
-            last_published_at,
-        )
+    @classmethod
+    def _parse_element(cls, workbook_xml, ns):
+        return cls._parse_fields(workbook_xml, ns)
 
 
 def parse_data_acceleration_config(data_acceleration_elem):
@@ -670,6 +589,15 @@ def parse_data_acceleration_config(data_acceleration_elem):
     return data_acceleration_config
 
 
+def _default_data_acceleration_config():
+    return {
+        "acceleration_enabled": None,
+        "accelerate_now": None,
+        "last_updated_at": None,
+        "acceleration_status": None,
+    }
+
+
 # Used to convert string represented boolean to a boolean type
 def string_to_bool(s: str) -> bool:
     return s.lower() == "true"
@@ -685,3 +613,44 @@ def string_to_int(s: str) -> int: ...
 
 def string_to_int(s):
     return int(s) if s is not None else None
+
+
+# The parameters of _set_values, parsed all at once by _parse_element and one at a time for lazy items
+WorkbookItem._define_fields(
+    {
+        "id": Field(attribute("id"), ("_id",)),
+        "name": Field(attribute("name"), ("name",)),
+        "content_url": Field(attribute("contentUrl"), ("_content_url",)),
+        "webpage_url": Field(attribute("webpageUrl"), ("_webpage_url",)),
+        "created_at": Field(attribute("createdAt", parse_datetime), ("_created_at",)),
+        "description": Field(attribute("description"), ("_description",)),
+        "updated_at": Field(attribute("updatedAt", parse_datetime), ("_updated_at",)),
+        "size": Field(attribute("size", int), ("_size",)),
+        "show_tabs": Field(attribute("showTabs", string_to_bool, False), ("_show_tabs",)),
+        "project_id": Field(child("project", lambda e, ns: e.get("id")), ("_project_id",)),
+        "project_name": Field(child("project", lambda e, ns: e.get("name")), ("_project_name",)),
+        "owner_id": Field(child("owner", lambda e, ns: e.get("id")), ("owner_id",)),
+        "tags": Field(child("tags", TagItem.from_xml_element), ("tags", "_initial_tags")),
+        "views": Field(child("views", ViewItem.from_xml_element), ("_views",)),
+        "data_acceleration_config": Field(
+            child(
+                "dataAccelerationConfig",
+                lambda e, ns: parse_data_acceleration_config(e),
+                default=_default_data_acceleration_config,
+            ),
+            ("_data_acceleration_config",),
+        ),
+        "data_freshness_policy": Field(
+            child("dataFreshnessPolicy", DataFreshnessPolicyItem.from_xml_element), ("_data_freshness_policy",)
+        ),
+        "sheet_count": Field(attribute("sheetCount", int), ("_sheet_count",)),
+        "has_extracts": Field(attribute("hasExtracts", string_to_bool, False), ("_has_extracts",)),
+        "project": Field(child("project", ProjectItem.from_xml), ("_project",)),
+        "owner": Field(child("owner", UserItem.from_xml), ("_owner",)),
+        "location": Field(child("location", LocationItem.from_xml), ("_location",)),
+        "encrypt_extracts": Field(attribute("encryptExtracts", string_to_bool), ("_encrypt_extracts",)),
+        "default_view_id": Field(attribute("defaultViewId"), ("_default_view_id",)),
+        "share_description": Field(attribute("shareDescription"), ("_share_description",)),
+        "last_published_at": Field(attribute("lastPublishedAt", parse_datetime), ("_last_published_at",)),
+    }
+)
@@ -1,7 +1,5 @@
 import re
 
-from defusedxml.ElementTree import fromstring
-
 OLD_NAMESPACE = "http://tableausoftware.com/api"
 NEW_NAMESPACE = "http://tableau.com/api"
 NAMESPACE_RE = re.compile(r"\{(.*?)\}")
@@ -26,6 +24,9 @@ class Namespace:
         if not xml.startswith(b"<?xml"):
             return  # Not an xml file, don't detect anything
 
+        # Imported here, the parsing helpers need the namespace constants above
+        from tableauserverclient.helpers.parsing import fromstring
+
         root = fromstring(xml)
         matches = NAMESPACE_RE.match(root.tag)
         if matches:
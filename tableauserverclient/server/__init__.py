@@ -1,94 +1,128 @@
-# These two imports must come first
-from tableauserverclient.server.request_factory import RequestFactory
-from tableauserverclient.server.request_options import (
-    CSVRequestOptions,
-    ExcelRequestOptions,
-    ImageRequestOptions,
-    PDFRequestOptions,
-    PPTXRequestOptions,
-    RequestOptions,
-)
-from tableauserverclient.server.filter import Filter
-from tableauserverclient.server.sort import Sort
-from tableauserverclient.server.server import Server
-from tableauserverclient.server.pager import Pager
-from tableauserverclient.server.endpoint.exceptions import FailedSignInError, NotSignedInError
+from typing import TYPE_CHECKING
 
-from tableauserverclient.server.endpoint import (
-    Auth,
-    CustomViews,
-    DataAccelerationReport,
-    DataAlerts,
-    Databases,
-    Datasources,
-    QuerysetEndpoint,
-    MissingRequiredFieldError,
-    Endpoint,
-    Favorites,
-    Fileuploads,
-    FlowRuns,
-    Flows,
-    FlowTasks,
-    Groups,
-    Jobs,
-    Metadata,
-    Metrics,
-    Projects,
-    Schedules,
-    ServerInfo,
-    ServerResponseError,
-    Sites,
-    Subscriptions,
-    Tables,
-    Tasks,
-    Users,
-    Views,
-    Webhooks,
-    Workbooks,
-)
+from tableauserverclient.lazy_imports import lazy_exports
 
-__all__ = [
-    "RequestFactory",
-    "CSVRequestOptions",
-    "ExcelRequestOptions",
-    "ImageRequestOptions",
-    "PDFRequestOptions",
-    "PPTXRequestOptions",
-    "RequestOptions",
-    "Filter",
-    "Sort",
-    "Server",
-    "Pager",
-    "FailedSignInError",
-    "NotSignedInError",
-    "Auth",
-    "CustomViews",
-    "DataAccelerationReport",
-    "DataAlerts",
-    "Databases",
-    "Datasources",
-    "QuerysetEndpoint",
-    "MissingRequiredFieldError",
-    "Endpoint",
-    "Favorites",
-    "Fileuploads",
-    "FlowRuns",
-    "Flows",
-    "FlowTasks",
-    "Groups",
-    "Jobs",
-    "Metadata",
-    "Metrics",
-    "Projects",
-    "Schedules",
-    "ServerInfo",
-    "ServerResponseError",
-    "Sites",
-    "Subscriptions",
-    "Tables",
-    "Tasks",
-    "Users",
-    "Views",
-    "Webhooks",
-    "Workbooks",
-]
+if TYPE_CHECKING:
+    # Imported as themselves, which marks them as exported for type checkers that cannot read __all__
+    from tableauserverclient.server.request_factory import RequestFactory as RequestFactory
+    from tableauserverclient.server.request_options import (
+        CSVRequestOptions as CSVRequestOptions,
+        ExcelRequestOptions as ExcelRequestOptions,
+        ImageRequestOptions as ImageRequestOptions,
+        PDFRequestOptions as PDFRequestOptions,
+        PPTXRequestOptions as PPTXRequestOptions,
+        RequestOptions as RequestOptions,
+    )
+    from tableauserverclient.server.filter import Filter as Filter
+    from tableauserverclient.server.sort import Sort as Sort
+    from tableauserverclient.server.server import Server as Server
+    from tableauserverclient.server.pager import Pager as Pager
+    from tableauserverclient.server.change_feed import ChangeFeed as ChangeFeed
+    from tableauserverclient.server.rate_limiter import RateLimiter as RateLimiter
+    from tableauserverclient.server.response_cache import ResponseCache as ResponseCache
+    from tableauserverclient.server.disk_response_cache import DiskResponseCache as DiskResponseCache
+    from tableauserverclient.server.retry_policy import RetryPolicy as RetryPolicy
+    from tableauserverclient.server.async_server import AsyncServer as AsyncServer
+    from tableauserverclient.server.chunk_sizing import (
+        AdaptiveChunkSize as AdaptiveChunkSize,
+        ChunkProgress as ChunkProgress,
+    )
+    from tableauserverclient.server.endpoint.exceptions import (
+        FailedSignInError as FailedSignInError,
+        NotSignedInError as NotSignedInError,
+    )
+    from tableauserverclient.server.endpoint import (
+        Auth as Auth,
+        CustomViews as CustomViews,
+        DataAccelerationReport as DataAccelerationReport,
+        DataAlerts as DataAlerts,
+        Databases as Databases,
+        Datasources as Datasources,
+        QuerysetEndpoint as QuerysetEndpoint,
+        MissingRequiredFieldError as MissingRequiredFieldError,
+        Endpoint as Endpoint,
+        Favorites as Favorites,
+        Fileuploads as Fileuploads,
+        FlowRuns as FlowRuns,
+        Flows as Flows,
+        FlowTasks as FlowTasks,
+        Groups as Groups,
+        Jobs as Jobs,
+        Metadata as Metadata,
+        Metrics as Metrics,
+        Projects as Projects,
+        Schedules as Schedules,
+        ServerInfo as ServerInfo,
+        ServerResponseError as ServerResponseError,
+        Sites as Sites,
+        Subscriptions as Subscriptions,
+        Tables as Tables,
+        Tasks as Tasks,
+        Users as Users,
+        Views as Views,
+        Webhooks as Webhooks,
+        Workbooks as Workbooks,
+    )
+
+_EXPORTS = {
+    "tableauserverclient.server.request_factory": ("RequestFactory",),
+    "tableauserverclient.server.request_options": (
+        "CSVRequestOptions",
+        "ExcelRequestOptions",
+        "ImageRequestOptions",
+        "PDFRequestOptions",
+        "PPTXRequestOptions",
+        "RequestOptions",
+    ),
+    "tableauserverclient.server.filter": ("Filter",),
+    "tableauserverclient.server.sort": ("Sort",),
+    "tableauserverclient.server.server": ("Server",),
+    "tableauserverclient.server.pager": ("Pager",),
+    "tableauserverclient.server.change_feed": ("ChangeFeed",),
+    "tableauserverclient.server.rate_limiter": ("RateLimiter",),
+    "tableauserverclient.server.response_cache": ("ResponseCache",),
+    "tableauserverclient.server.disk_response_cache": ("DiskResponseCache",),
+    "tableauserverclient.server.retry_policy": ("RetryPolicy",),
+    "tableauserverclient.server.async_server": ("AsyncServer",),
+    "tableauserverclient.server.chunk_sizing": ("AdaptiveChunkSize", "ChunkProgress"),
+    "tableauserverclient.server.endpoint.exceptions": (
+        "FailedSignInError",
+        "NotSignedInError",
+    ),
+    "tableauserverclient.server.endpoint": (
+        "Auth",
+        "CustomViews",
+        "DataAccelerationReport",
+        "DataAlerts",
+        "Databases",
+        "Datasources",
+        "QuerysetEndpoint",
+        "MissingRequiredFieldError",
+        "Endpoint",
+        "Favorites",
+        "Fileuploads",
+        "FlowRuns",
+        "Flows",
+        "FlowTasks",
+        "Groups",
+        "Jobs",
+        "Metadata",
+        "Metrics",
+        "Projects",
+        "Schedules",
+        "ServerInfo",
+        "ServerResponseError",
+        "Sites",
+        "Subscriptions",
+        "Tables",
+        "Tasks",
+        "Users",
+        "Views",
+        "Webhooks",
+        "Workbooks",
+    ),
+}
+
+__all__ = [*(name for names in _EXPORTS.values() for name in names)]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
@@ -0,0 +1,231 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial, wraps
+from itertools import islice
+from typing import Any, Callable, Generic, Optional, TypeVar, Union
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator, Sequence
+
+from tableauserverclient.config import config
+from tableauserverclient.models.records import to_record
+from tableauserverclient.server.endpoint import Endpoint
+from tableauserverclient.server.pager import Pager
+from tableauserverclient.server.query import QuerySet
+from tableauserverclient.server.request_options import RequestOptions
+from tableauserverclient.server.server import Server
+
+T = TypeVar("T")
+
+# Endpoint methods that only build a QuerySet and never touch the network
+_QUERYSET_BUILDERS = frozenset(("all", "filter", "order_by", "paginate", "changed_since", "fields", "only_fields"))
+
+
+def _take(iterator: Iterator[T], count: int) -> list[T]:
+    return list(islice(iterator, count))
+
+
+class AsyncServer:
+    """
+    Asyncio facade over a Server. Every endpoint method is available as an
+    awaitable with the same arguments, and QuerySets and Pagers can be
+    consumed with `async for`. Requests are built and responses are parsed by
+    the same endpoint code as the synchronous client; the blocking HTTP calls
+    run on a dedicated thread pool so they do not stall the event loop.
+
+    At most `max_concurrency` requests are in flight at once. Further calls
+    wait for a free slot, so it is safe to gather thousands of calls.
+
+    Parameters
+    ----------
+    server : str or Server
+        Either an existing Server, or the address of the server to create one
+        for. When an address is given, the remaining keyword arguments are
+        passed on to Server.
+
+    max_concurrency : int, optional
+        The maximum number of requests in flight at the same time. Defaults
+        to 8.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> import tableauserverclient as TSC
+
+    >>> async def main():
+    >>>     async with TSC.AsyncServer('https://MY-SERVER', max_concurrency=16) as server:
+    >>>         await server.auth.sign_in(TSC.PersonalAccessTokenAuth('name', 'secret', 'site'))
+    >>>         users = await asyncio.gather(*(server.users.get_by_id(id) for id in user_ids))
+    >>>         async for workbook in server.workbooks.filter(project_name='Finance'):
+    >>>             print(workbook.name)
+
+    >>> asyncio.run(main())
+    """
+
+    def __init__(self, server: Union[str, Server], *, max_concurrency: int = 8, **server_kwargs) -> None:
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1.")
+        if isinstance(server, Server):
+            if server_kwargs:
+                raise ValueError("Server options can only be given together with a server address.")
+            self._server = server
+        else:
+            self._server = Server(server, **server_kwargs)
+        self._max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="tsc-async")
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def __repr__(self):
+        return f"<AsyncServer {self._server!r} max_concurrency={self._max_concurrency}>"
+
+    async def __aenter__(self) -> "AsyncServer":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._server, name)
+        if isinstance(attr, Endpoint):
+            return AsyncEndpoint(attr, self)
+        if callable(attr):
+            return self._awaitable(attr)
+        return attr
+
+    @property
+    def server(self) -> Server:
+        """The synchronous Server this facade wraps."""
+        return self._server
+
+    @property
+    def max_concurrency(self) -> int:
+        return self._max_concurrency
+
+    def close(self) -> None:
+        """Shut down the worker threads. Requests already running are allowed to finish."""
+        self._executor.shutdown(wait=False)
+
+    def pager(self, endpoint: Any, request_opts: Optional[RequestOptions] = None, **kwargs) -> "AsyncQuerySet[Any]":
+        """Async equivalent of Pager. Accepts either a synchronous or an async endpoint."""
+        if isinstance(endpoint, AsyncEndpoint):
+            endpoint = endpoint.endpoint
+        return AsyncQuerySet(Pager(endpoint, request_opts, **kwargs), self)
+
+    async def run(self, func: Callable[..., T], *args, **kwargs) -> T:
+        """Run a blocking call on the worker pool, subject to the concurrency limit."""
+        if self._semaphore is None:
+            # Created lazily so it binds to the running event loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def _awaitable(self, func: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            return await self.run(func, *args, **kwargs)
+
+        return wrapper
+
+
+class AsyncEndpoint:
+    """
+    Wraps an endpoint so that its methods return awaitables. Methods that
+    build a QuerySet (all, filter, order_by, ...) return an AsyncQuerySet
+    instead, which is iterated with `async for`.
+    """
+
+    def __init__(self, endpoint: Endpoint, server: AsyncServer) -> None:
+        self.endpoint = endpoint
+        self._server = server
+
+    def __repr__(self):
+        return f"<AsyncEndpoint {self.endpoint.__class__.__name__}>"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self.endpoint, name)
+        if not callable(attr):
+            return attr
+        if name in _QUERYSET_BUILDERS:
+
+            @wraps(attr)
+            def build(*args, **kwargs):
+                return AsyncQuerySet(attr(*args, **kwargs), self._server)
+
+            return build
+        return self._server._awaitable(attr)
+
+
+class AsyncQuerySet(Generic[T]):
+    """
+    Async iteration over a QuerySet or Pager. Pages are fetched on the
+    worker pool of the owning AsyncServer, one page worth of items per hop.
+    Chaining methods such as filter and order_by are passed through to the
+    wrapped QuerySet. records, to_columns, to_arrow and to_pandas page on the
+    worker pool as well.
+    """
+
+    def __init__(self, iterable: Iterable[T], server: AsyncServer) -> None:
+        self._iterable = iterable
+        self._server = server
+
+    def __repr__(self):
+        return f"<AsyncQuerySet {self._iterable!r}>"
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        attr = getattr(self._iterable, name)
+        if not callable(attr):
+            return attr
+
+        @wraps(attr)
+        def chain(*args, **kwargs):
+            result = attr(*args, **kwargs)
+            return self if result is self._iterable else result
+
+        return chain
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self._iterate(self._iterable)
+
+    async def _iterate(self, iterable: Iterable[Any]) -> AsyncIterator[Any]:
+        batch_size = self._batch_size()
+        # Creating the iterator does not make a request, the first batch does
+        iterator = iter(iterable)
+        while batch := await self._server.run(_take, iterator, batch_size):
+            for item in batch:
+                yield item
+
+    async def to_list(self) -> list[T]:
+        return [item async for item in self]
+
+    def records(self) -> AsyncIterator[Any]:
+        """Async iteration over the items as compact records, as QuerySet.records."""
+        return self._iterate(map(to_record, self._iterable))
+
+    async def to_columns(self, fields: Sequence[str], numpy: Optional[bool] = None) -> dict[str, Any]:
+        """Async equivalent of QuerySet.to_columns."""
+        return await self._server.run(self._query_set("to_columns").to_columns, fields, numpy)
+
+    async def to_arrow(self, fields: Sequence[str]) -> Any:
+        """Async equivalent of QuerySet.to_arrow."""
+        return await self._server.run(self._query_set("to_arrow").to_arrow, fields)
+
+    async def to_pandas(self, fields: Sequence[str]) -> Any:
+        """Async equivalent of QuerySet.to_pandas."""
+        return await self._server.run(self._query_set("to_pandas").to_pandas, fields)
+
+    def _query_set(self, name: str) -> QuerySet:
+        if not isinstance(self._iterable, QuerySet):
+            raise AttributeError(f"'{type(self._iterable).__name__}' object has no attribute '{name}'")
+        return self._iterable
+
+    def _batch_size(self) -> int:
+        if isinstance(self._iterable, QuerySet):
+            return self._iterable.request_options.pagesize
+        if isinstance(self._iterable, Pager):
+            return self._iterable._options.pagesize
+        return config.PAGE_SIZE
@@ -0,0 +1,109 @@
+from typing import NamedTuple, Optional
+
+from tableauserverclient.config import BYTES_PER_MB, config
+
+# How long adaptive sizing aims for each chunk to take to send
+CHUNK_TARGET_SECONDS = 5.0
+
+
+class ChunkProgress(NamedTuple):
+    """
+    What a progress callback is told after each chunk of a chunked upload.
+
+    Attributes
+    ----------
+    upload_id : str
+        The upload session the chunk was appended to.
+
+    number : int
+        The number of the chunk, starting from 0.
+
+    size : int
+        The bytes in the chunk.
+
+    elapsed : float
+        Seconds from sending the chunk to the server acknowledging it,
+        including any retries.
+
+    uploaded : int
+        The bytes sent so far, this chunk included.
+
+    next_size : int
+        The size asked for the chunks read from now on.
+    """
+
+    upload_id: str
+    number: int
+    size: int
+    elapsed: float
+    uploaded: int
+    next_size: int
+
+    @property
+    def throughput(self) -> float:
+        """Bytes per second for this chunk."""
+        return self.size / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+class AdaptiveChunkSize:
+    """
+    Sizes the chunks of an upload from how fast the previous chunks went.
+    After each chunk the size moves towards what the measured throughput
+    would send in `target_seconds`, so fast links send fewer, larger chunks
+    and slow or unreliable links send smaller ones that cost less to resend.
+    The size changes by at most a factor of 2 per chunk and stays between
+    `min_mb` and `max_mb`, and never exceeds TSC_FILESIZE_LIMIT_MB, the most
+    the server takes in one request.
+
+    Parameters
+    ----------
+    min_mb : int, optional
+        The smallest chunk in MB. Defaults to TSC_CHUNK_SIZE_MIN_MB, or 1.
+
+    max_mb : int, optional
+        The largest chunk in MB. Two chunks are held in memory at a time.
+        Defaults to TSC_CHUNK_SIZE_MAX_MB, or TSC_FILESIZE_LIMIT_MB.
+
+    target_seconds : float, optional
+        How long each chunk should take to send. Defaults to 5 seconds.
+
+    initial_mb : int, optional
+        The size of the first chunk in MB. Defaults to TSC_CHUNK_SIZE_MB.
+    """
+
+    def __init__(
+        self,
+        min_mb: Optional[int] = None,
+        max_mb: Optional[int] = None,
+        target_seconds: float = CHUNK_TARGET_SECONDS,
+        initial_mb: Optional[int] = None,
+    ) -> None:
+        limit = config.FILESIZE_LIMIT_MB
+        self.min_size = min(min_mb or config.CHUNK_SIZE_MIN_MB, limit) * BYTES_PER_MB
+        self.max_size = min(max_mb or config.CHUNK_SIZE_MAX_MB, limit) * BYTES_PER_MB
+        if self.min_size > self.max_size:
+            raise ValueError("min_mb must not be larger than max_mb.")
+        if target_seconds <= 0:
+            raise ValueError("target_seconds must be a positive number of seconds.")
+        self.target_seconds = target_seconds
+        self.initial_size = self._bounded((initial_mb or config.CHUNK_SIZE_MB) * BYTES_PER_MB)
+
+    def __repr__(self):
+        return (
+            f"<AdaptiveChunkSize min={self.min_size // BYTES_PER_MB}MB max={self.max_size // BYTES_PER_MB}MB "
+            f"target={self.target_seconds}s>"
+        )
+
+    def _bounded(self, size: float) -> int:
+        # Whole MB, which keeps the buffers the same size while the throughput wobbles
+        return int(min(max(size, self.min_size), self.max_size)) // BYTES_PER_MB * BYTES_PER_MB
+
+    def next_size(self, size: int, sent: int, elapsed: float) -> int:
+        """
+        The size for the next chunk after one of `size` bytes, of which
+        `sent` were in the file, took `elapsed` seconds.
+        """
+        if elapsed <= 0:
+            return self._bounded(size * 2)
+        wanted = sent / elapsed * self.target_seconds
+        return self._bounded(min(max(wanted, size / 2), size * 2))
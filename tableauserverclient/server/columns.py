@@ -0,0 +1,61 @@
+import datetime
+import importlib
+from collections.abc import Iterable, Sequence
+from typing import Any, Optional
+
+from tableauserverclient.datetime_helpers import utc
+
+
+def import_optional(module: str, feature: str) -> Any:
+    """Imports an optional dependency, or raises ImportError naming the feature that needs it."""
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        package = module.split(".")[0]
+        raise ImportError(f"{feature} requires {package}, install it with `pip install {package}`.") from e
+
+
+def build_columns(items: Iterable[Any], fields: Sequence[str]) -> dict[str, list[Any]]:
+    """
+    Reads the given attributes of each item into one list per attribute.
+    Items are consumed as they are produced, so only the columns are kept.
+    """
+    columns: dict[str, list[Any]] = {field: [] for field in fields}
+    appenders = [(field, columns[field].append) for field in fields]
+    for item in items:
+        for field, append in appenders:
+            append(getattr(item, field))
+    return columns
+
+
+def is_datetime_column(values: Sequence[Any]) -> bool:
+    """True if the column holds datetimes and Nones, with at least one datetime."""
+    found = False
+    for value in values:
+        if value is None:
+            continue
+        if not isinstance(value, datetime.datetime):
+            return False
+        found = True
+    return found
+
+
+def to_datetime64(values: Sequence[Optional[datetime.datetime]], numpy: Any) -> Any:
+    """
+    Converts a column of datetimes to a datetime64[s] array, with missing
+    values as NaT. NumPy has no time zones, so aware values are converted to
+    naive UTC first, the zone every Tableau timestamp is reported in.
+    """
+    naive = [
+        None if value is None else value if value.tzinfo is None else value.astimezone(utc).replace(tzinfo=None)
+        for value in values
+    ]
+    return numpy.array(naive, dtype="datetime64[s]")
+
+
+def timestamps_to_datetime64(values: Sequence[Optional[str]], numpy: Any) -> Any:
+    """
+    Converts a column of ISO 8601 timestamps in UTC, without a zone, to a
+    datetime64[s] array in one step. None becomes NaT.
+    """
+    return numpy.array(values, dtype="datetime64[s]")
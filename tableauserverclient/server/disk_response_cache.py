@@ -0,0 +1,249 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Optional, Union
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from tableauserverclient.helpers.logging import logger
+from tableauserverclient.server.response_cache import BaseResponseCache, CacheKey, resource_path
+
+if TYPE_CHECKING:
+    from os import PathLike
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    scope TEXT NOT NULL,
+    url TEXT NOT NULL,
+    query TEXT NOT NULL,
+    path TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    encoding TEXT,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    accessed REAL NOT NULL,
+    PRIMARY KEY (scope, url, query)
+);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed);
+"""
+
+
+def resource_name(url: str) -> str:
+    """
+    The kind of resource a REST API URL points to, used to pick a TTL. For
+    /api/3.19/sites/<site id>/projects/<id> that is "projects", and for
+    /api/3.19/schedules it is "schedules".
+    """
+    parts = urlsplit(url).path.strip("/").split("/")
+    if "api" not in parts:
+        return ""
+    # Skip past /api/<version>
+    rest = parts[parts.index("api") + 2 :]
+    if len(rest) > 2 and rest[0] == "sites":
+        return rest[2]
+    return rest[0] if rest else ""
+
+
+def _ancestors(path: str) -> list[str]:
+    parts = path.split("/")
+    return ["/".join(parts[:i]) for i in range(1, len(parts) + 1)]
+
+
+class DiskResponseCache(BaseResponseCache):
+    """
+    Persistent cache for responses to GET requests, stored in a SQLite
+    database. Short-lived processes can reuse listings that another process
+    fetched a moment earlier instead of listing every project, group or
+    schedule again on startup.
+
+    The raw response body is stored with its status and headers, and a
+    response object is rebuilt on a hit, so cached and fresh responses are
+    parsed by the same code. Several processes and threads can use the same
+    file at once; SQLite serializes the writes.
+
+    Each kind of resource can have its own TTL. Once the stored bodies exceed
+    `max_bytes`, the least recently used responses are dropped. A PUT, POST,
+    PATCH or DELETE through a server using the cache drops the affected
+    responses for every process. Changes made by other clients are only
+    picked up when the TTL runs out. Jobs, tasks and flow runs are never
+    cached.
+
+    Parameters
+    ----------
+    path : str or PathLike
+        The SQLite database file. It is created if it does not exist.
+
+    ttl : float, optional
+        Seconds a response stays valid unless `ttls` says otherwise. Defaults
+        to 300.
+
+    ttls : Mapping[str, float], optional
+        TTLs by resource name, such as {"projects": 600, "users": 0}. The name
+        is the collection in the URL, for example "projects" for
+        .../sites/<site id>/projects/<id>. A TTL of 0 disables caching for
+        that resource.
+
+    max_bytes : int, optional
+        Upper bound on the total size of stored bodies. Defaults to 256 MB.
+
+    Examples
+    --------
+    >>> cache = TSC.DiskResponseCache('~/.cache/tsc.sqlite3', ttls={'projects': 600, 'users': 60})
+    >>> server = TSC.Server('https://MY-SERVER', response_cache=cache)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "PathLike[str]"],
+        ttl: float = 300,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_bytes: int = 256 * 1024 * 1024,
+    ) -> None:
+        if ttl < 0 or any(value < 0 for value in (ttls or {}).values()):
+            raise ValueError("TTLs must not be negative.")
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be positive.")
+        super().__init__()
+        self.path = os.path.expanduser(os.fspath(path))
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        connection = self._connection()
+        # WAL lets readers in other processes carry on while one process writes
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(_SCHEMA)
+
+    def __repr__(self):
+        return f"<DiskResponseCache path={self.path!r} ttl={self.ttl} max_bytes={self.max_bytes}>"
+
+    def __len__(self) -> int:
+        return self._connection().execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads or across a fork
+        connection = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def ttl_for(self, url: str) -> float:
+        return self.ttls.get(resource_name(url), self.ttl)
+
+    def get(self, key: CacheKey) -> Optional[Response]:
+        connection = self._connection()
+        now = time.time()
+        try:
+            row = connection.execute(
+                "SELECT status, headers, encoding, body FROM responses "
+                "WHERE scope = ? AND url = ? AND query = ? AND expires > ?",
+                (key.scope, key.url, key.query, now),
+            ).fetchone()
+            if row is not None:
+                connection.execute(
+                    "UPDATE responses SET accessed = ? WHERE scope = ? AND url = ? AND query = ?",
+                    (now, key.scope, key.url, key.query),
+                )
+        except sqlite3.Error as e:
+            # Treat an unreadable cache as a miss and go to the server
+            logger.info(f"Could not read from response cache {self.path}: {e}")
+            row = None
+        if row is None:
+            self._count(misses=1)
+            return None
+        self._count(hits=1)
+
+        status, headers, encoding, body = row
+        response = Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.encoding = encoding
+        response.url = key.url
+        response._content = body
+        return response
+
+    def set(self, key: CacheKey, response: Response) -> None:
+        ttl = self.ttl_for(key.url)
+        body = response.content
+        if ttl <= 0 or response.status_code != 200 or len(body) > self.max_bytes:
+            return
+        now = time.time()
+        connection = self._connection()
+        try:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key.scope,
+                    key.url,
+                    key.query,
+                    resource_path(key.url),
+                    response.status_code,
+                    json.dumps(dict(response.headers)),
+                    response.encoding,
+                    body,
+                    len(body),
+                    now + ttl,
+                    now,
+                ),
+            )
+            evicted = self._evict(connection, now)
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            # A cache that can't be written to should not break the request
+            logger.info(f"Could not write to response cache {self.path}: {e}")
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            return
+        self._count(evictions=evicted)
+
+    def _evict(self, connection: sqlite3.Connection, now: float) -> int:
+        connection.execute("DELETE FROM responses WHERE expires <= ?", (now,))
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+        stale = []
+        for rowid, size in connection.execute("SELECT rowid, size FROM responses ORDER BY accessed"):
+            stale.append((rowid,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+        connection.executemany("DELETE FROM responses WHERE rowid = ?", stale)
+        return len(stale)
+
+    def invalidate(self, url: str) -> None:
+        path = resource_path(url)
+        ancestors = _ancestors(path)
+        placeholders = ", ".join("?" for _ in ancestors)
+        try:
+            # Everything at or above the changed path, and everything below it. "0" sorts right after "/".
+            cursor = self._connection().execute(
+                f"DELETE FROM responses WHERE path IN ({placeholders}) OR (path > ? AND path < ?)",
+                (*ancestors, path + "/", path + "0"),
+            )
+        except sqlite3.Error as e:
+            # The change itself went through, so it is not failed over the cache. Stale responses stay
+            # until their TTL runs out, which is worth a warning rather than the info a missed read gets.
+            logger.warning(f"Could not invalidate {path} in response cache {self.path}: {e}")
+            return
+        self._count(invalidations=max(cursor.rowcount, 0))
+
+    def clear(self) -> None:
+        try:
+            self._connection().execute("DELETE FROM responses")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not clear response cache {self.path}: {e}")
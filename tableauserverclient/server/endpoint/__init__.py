@@ -1,73 +1,97 @@
-from tableauserverclient.server.endpoint.auth_endpoint import Auth
-from tableauserverclient.server.endpoint.custom_views_endpoint import CustomViews
-from tableauserverclient.server.endpoint.data_acceleration_report_endpoint import DataAccelerationReport
-from tableauserverclient.server.endpoint.data_alert_endpoint import DataAlerts
-from tableauserverclient.server.endpoint.databases_endpoint import Databases
-from tableauserverclient.server.endpoint.datasources_endpoint import Datasources
-from tableauserverclient.server.endpoint.endpoint import Endpoint, QuerysetEndpoint
-from tableauserverclient.server.endpoint.exceptions import ServerResponseError, MissingRequiredFieldError
-from tableauserverclient.server.endpoint.extensions_endpoint import Extensions
-from tableauserverclient.server.endpoint.favorites_endpoint import Favorites
-from tableauserverclient.server.endpoint.fileuploads_endpoint import Fileuploads
-from tableauserverclient.server.endpoint.flow_runs_endpoint import FlowRuns
-from tableauserverclient.server.endpoint.flows_endpoint import Flows
-from tableauserverclient.server.endpoint.flow_task_endpoint import FlowTasks
-from tableauserverclient.server.endpoint.groups_endpoint import Groups
-from tableauserverclient.server.endpoint.groupsets_endpoint import GroupSets
-from tableauserverclient.server.endpoint.jobs_endpoint import Jobs
-from tableauserverclient.server.endpoint.linked_tasks_endpoint import LinkedTasks
-from tableauserverclient.server.endpoint.metadata_endpoint import Metadata
-from tableauserverclient.server.endpoint.metrics_endpoint import Metrics
-from tableauserverclient.server.endpoint.oidc_endpoint import OIDC
-from tableauserverclient.server.endpoint.projects_endpoint import Projects
-from tableauserverclient.server.endpoint.schedules_endpoint import Schedules
-from tableauserverclient.server.endpoint.server_info_endpoint import ServerInfo
-from tableauserverclient.server.endpoint.sites_endpoint import Sites
-from tableauserverclient.server.endpoint.subscriptions_endpoint import Subscriptions
-from tableauserverclient.server.endpoint.tables_endpoint import Tables
-from tableauserverclient.server.endpoint.resource_tagger import Tags
-from tableauserverclient.server.endpoint.tasks_endpoint import Tasks
-from tableauserverclient.server.endpoint.users_endpoint import Users
-from tableauserverclient.server.endpoint.views_endpoint import Views
-from tableauserverclient.server.endpoint.virtual_connections_endpoint import VirtualConnections
-from tableauserverclient.server.endpoint.webhooks_endpoint import Webhooks
-from tableauserverclient.server.endpoint.workbooks_endpoint import Workbooks
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "Auth",
-    "CustomViews",
-    "DataAccelerationReport",
-    "DataAlerts",
-    "Databases",
-    "Datasources",
-    "QuerysetEndpoint",
-    "MissingRequiredFieldError",
-    "Endpoint",
-    "Extensions",
-    "Favorites",
-    "Fileuploads",
-    "FlowRuns",
-    "Flows",
-    "FlowTasks",
-    "Groups",
-    "GroupSets",
-    "Jobs",
-    "LinkedTasks",
-    "Metadata",
-    "Metrics",
-    "OIDC",
-    "Projects",
-    "Schedules",
-    "ServerInfo",
-    "ServerResponseError",
-    "Sites",
-    "Subscriptions",
-    "Tables",
-    "Tags",
-    "Tasks",
-    "Users",
-    "Views",
-    "VirtualConnections",
-    "Webhooks",
-    "Workbooks",
-]
+from tableauserverclient.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    # Imported as themselves, which marks them as exported for type checkers that cannot read __all__
+    from tableauserverclient.server.endpoint.auth_endpoint import Auth as Auth
+    from tableauserverclient.server.endpoint.custom_views_endpoint import CustomViews as CustomViews
+    from tableauserverclient.server.endpoint.data_acceleration_report_endpoint import (
+        DataAccelerationReport as DataAccelerationReport,
+    )
+    from tableauserverclient.server.endpoint.data_alert_endpoint import DataAlerts as DataAlerts
+    from tableauserverclient.server.endpoint.databases_endpoint import Databases as Databases
+    from tableauserverclient.server.endpoint.datasources_endpoint import Datasources as Datasources
+    from tableauserverclient.server.endpoint.endpoint import (
+        Endpoint as Endpoint,
+        QuerysetEndpoint as QuerysetEndpoint,
+    )
+    from tableauserverclient.server.endpoint.exceptions import (
+        ServerResponseError as ServerResponseError,
+        MissingRequiredFieldError as MissingRequiredFieldError,
+    )
+    from tableauserverclient.server.endpoint.extensions_endpoint import Extensions as Extensions
+    from tableauserverclient.server.endpoint.favorites_endpoint import Favorites as Favorites
+    from tableauserverclient.server.endpoint.fileuploads_endpoint import Fileuploads as Fileuploads
+    from tableauserverclient.server.endpoint.flow_runs_endpoint import FlowRuns as FlowRuns
+    from tableauserverclient.server.endpoint.flows_endpoint import Flows as Flows
+    from tableauserverclient.server.endpoint.flow_task_endpoint import FlowTasks as FlowTasks
+    from tableauserverclient.server.endpoint.groups_endpoint import Groups as Groups
+    from tableauserverclient.server.endpoint.groupsets_endpoint import GroupSets as GroupSets
+    from tableauserverclient.server.endpoint.jobs_endpoint import Jobs as Jobs
+    from tableauserverclient.server.endpoint.linked_tasks_endpoint import LinkedTasks as LinkedTasks
+    from tableauserverclient.server.endpoint.metadata_endpoint import Metadata as Metadata
+    from tableauserverclient.server.endpoint.metrics_endpoint import Metrics as Metrics
+    from tableauserverclient.server.endpoint.oidc_endpoint import OIDC as OIDC
+    from tableauserverclient.server.endpoint.projects_endpoint import Projects as Projects
+    from tableauserverclient.server.endpoint.schedules_endpoint import Schedules as Schedules
+    from tableauserverclient.server.endpoint.server_info_endpoint import ServerInfo as ServerInfo
+    from tableauserverclient.server.endpoint.sites_endpoint import Sites as Sites
+    from tableauserverclient.server.endpoint.subscriptions_endpoint import Subscriptions as Subscriptions
+    from tableauserverclient.server.endpoint.tables_endpoint import Tables as Tables
+    from tableauserverclient.server.endpoint.resource_tagger import Tags as Tags
+    from tableauserverclient.server.endpoint.tasks_endpoint import Tasks as Tasks
+    from tableauserverclient.server.endpoint.users_endpoint import Users as Users
+    from tableauserverclient.server.endpoint.views_endpoint import Views as Views
+    from tableauserverclient.server.endpoint.virtual_connections_endpoint import (
+        VirtualConnections as VirtualConnections,
+    )
+    from tableauserverclient.server.endpoint.webhooks_endpoint import Webhooks as Webhooks
+    from tableauserverclient.server.endpoint.workbooks_endpoint import Workbooks as Workbooks
+
+_EXPORTS = {
+    "tableauserverclient.server.endpoint.auth_endpoint": ("Auth",),
+    "tableauserverclient.server.endpoint.custom_views_endpoint": ("CustomViews",),
+    "tableauserverclient.server.endpoint.data_acceleration_report_endpoint": ("DataAccelerationReport",),
+    "tableauserverclient.server.endpoint.data_alert_endpoint": ("DataAlerts",),
+    "tableauserverclient.server.endpoint.databases_endpoint": ("Databases",),
+    "tableauserverclient.server.endpoint.datasources_endpoint": ("Datasources",),
+    "tableauserverclient.server.endpoint.endpoint": (
+        "Endpoint",
+        "QuerysetEndpoint",
+    ),
+    "tableauserverclient.server.endpoint.exceptions": (
+        "ServerResponseError",
+        "MissingRequiredFieldError",
+    ),
+    "tableauserverclient.server.endpoint.extensions_endpoint": ("Extensions",),
+    "tableauserverclient.server.endpoint.favorites_endpoint": ("Favorites",),
+    "tableauserverclient.server.endpoint.fileuploads_endpoint": ("Fileuploads",),
+    "tableauserverclient.server.endpoint.flow_runs_endpoint": ("FlowRuns",),
+    "tableauserverclient.server.endpoint.flows_endpoint": ("Flows",),
+    "tableauserverclient.server.endpoint.flow_task_endpoint": ("FlowTasks",),
+    "tableauserverclient.server.endpoint.groups_endpoint": ("Groups",),
+    "tableauserverclient.server.endpoint.groupsets_endpoint": ("GroupSets",),
+    "tableauserverclient.server.endpoint.jobs_endpoint": ("Jobs",),
+    "tableauserverclient.server.endpoint.linked_tasks_endpoint": ("LinkedTasks",),
+    "tableauserverclient.server.endpoint.metadata_endpoint": ("Metadata",),
+    "tableauserverclient.server.endpoint.metrics_endpoint": ("Metrics",),
+    "tableauserverclient.server.endpoint.oidc_endpoint": ("OIDC",),
+    "tableauserverclient.server.endpoint.projects_endpoint": ("Projects",),
+    "tableauserverclient.server.endpoint.schedules_endpoint": ("Schedules",),
+    "tableauserverclient.server.endpoint.server_info_endpoint": ("ServerInfo",),
+    "tableauserverclient.server.endpoint.sites_endpoint": ("Sites",),
+    "tableauserverclient.server.endpoint.subscriptions_endpoint": ("Subscriptions",),
+    "tableauserverclient.server.endpoint.tables_endpoint": ("Tables",),
+    "tableauserverclient.server.endpoint.resource_tagger": ("Tags",),
+    "tableauserverclient.server.endpoint.tasks_endpoint": ("Tasks",),
+    "tableauserverclient.server.endpoint.users_endpoint": ("Users",),
+    "tableauserverclient.server.endpoint.views_endpoint": ("Views",),
+    "tableauserverclient.server.endpoint.virtual_connections_endpoint": ("VirtualConnections",),
+    "tableauserverclient.server.endpoint.webhooks_endpoint": ("Webhooks",),
+    "tableauserverclient.server.endpoint.workbooks_endpoint": ("Workbooks",),
+}
+
+__all__ = [*(name for names in _EXPORTS.values() for name in names)]
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
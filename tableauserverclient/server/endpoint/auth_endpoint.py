@@ -1,3 +1,4 @@
+import copy
 import logging
 from typing import TYPE_CHECKING
 import warnings
@@ -42,6 +43,10 @@ class Auth(Endpoint):
 
         Creates a context manager that will sign out of the server upon exit.
 
+        The credentials are kept on the server object so that, if the session
+        expires, the next request that is rejected with a 401 signs in again
+        and is sent once more with the new token.
+
         Parameters
         ----------
         auth_req : Credentials
@@ -88,6 +93,7 @@ class Auth(Endpoint):
         user_id = parsed_response.find(".//t:user", namespaces=self.parent_srv.namespace).get("id", None)
         auth_token = parsed_response.find("t:credentials", namespaces=self.parent_srv.namespace).get("token", None)
         self.parent_srv._set_auth(site_id, user_id, auth_token, site_url)
+        self.parent_srv._credentials = auth_req
         logger.info(f"Signed into {self.parent_srv.server_address} as user with id {user_id}")
         return Auth.contextmgr(self.sign_out)
 
@@ -110,6 +116,8 @@ class Auth(Endpoint):
         # If there are no auth tokens you're already signed out. No-op
         if not self.parent_srv.is_signed_in():
             return
+        # Signing in again just to sign out is pointless if the session already expired
+        self.parent_srv._credentials = None
         self.post_request(url, "")
         self.parent_srv._clear_auth()
         logger.info("Signed out")
@@ -160,6 +168,11 @@ class Auth(Endpoint):
         user_id = parsed_response.find(".//t:user", namespaces=self.parent_srv.namespace).get("id", None)
         auth_token = parsed_response.find("t:credentials", namespaces=self.parent_srv.namespace).get("token", None)
         self.parent_srv._set_auth(site_id, user_id, auth_token, site_url)
+        if self.parent_srv._credentials is not None:
+            # Signing in again after a session expiry should land on the new site
+            credentials = copy.copy(self.parent_srv._credentials)
+            credentials.site_id = site_item.content_url
+            self.parent_srv._credentials = credentials
         logger.info(f"Signed into {self.parent_srv.server_address} as user with id {user_id}")
         return Auth.contextmgr(self.sign_out)
 
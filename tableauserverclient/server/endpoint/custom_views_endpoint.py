@@ -8,6 +8,7 @@ from collections.abc import Iterator
 
 from tableauserverclient.config import BYTES_PER_MB, config
 from tableauserverclient.filesys_helpers import get_file_object_size
+from tableauserverclient.server.multipart import FilePart
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.models import CustomViewItem, PaginationItem
@@ -20,6 +21,7 @@ from tableauserverclient.server import (
 )
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.server.query import QuerySet
@@ -82,8 +84,9 @@ class CustomViews(QuerysetEndpoint[CustomViewItem]):
         logger.info("Querying all custom views on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_view_items = CustomViewItem.list_from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_view_items = CustomViewItem.list_from_response(parsed_response, self.parent_srv.namespace)
         return all_view_items, pagination_item
 
     @api(version="3.18")
@@ -358,13 +361,13 @@ class CustomViews(QuerysetEndpoint[CustomViewItem]):
         else:
             if isinstance(file, io_types_r):
                 file.seek(0)
-                contents = file.read()
+                contents = FilePart(file)
                 if view_item.name is None:
                     raise MissingRequiredFieldError("Custom view item missing name.")
                 filename = view_item.name
             elif isinstance(file, (str, Path)):
                 filename = Path(file).name
-                contents = Path(file).read_bytes()
+                contents = FilePart(file)
 
             xml_request, content_type = RequestFactory.CustomView.publish_req(view_item, filename, contents)
 
@@ -6,6 +6,7 @@ from tableauserverclient.server import RequestFactory
 from tableauserverclient.models import DataAlertItem, PaginationItem, UserItem
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 from typing import Optional, TYPE_CHECKING, Union
 
@@ -28,8 +29,9 @@ class DataAlerts(Endpoint):
         logger.info("Querying all dataAlerts on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_dataAlert_items = DataAlertItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_dataAlert_items = DataAlertItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_dataAlert_items, pagination_item
 
     # Get 1 dataAlert
@@ -13,6 +13,7 @@ from tableauserverclient.server import RequestFactory
 from tableauserverclient.models import DatabaseItem, TableItem, PaginationItem, Resource
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.models.dqw_item import DQWItem
@@ -54,8 +55,9 @@ class Databases(Endpoint, TaggingMixin):
         logger.info("Querying all databases on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_database_items = DatabaseItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_database_items = DatabaseItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_database_items, pagination_item
 
     # Get 1 database
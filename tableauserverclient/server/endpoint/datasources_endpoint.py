@@ -19,6 +19,8 @@ if TYPE_CHECKING:
     from .schedules_endpoint import AddResponse
 
 from tableauserverclient.server.endpoint.dqw_endpoint import _DataQualityWarningEndpoint
+from tableauserverclient.server.streaming import StreamedPage
+from tableauserverclient.server.multipart import FilePart
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, parameter_added_in
 from tableauserverclient.server.endpoint.exceptions import InternalServerError, MissingRequiredFieldError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
@@ -95,6 +97,9 @@ HyperAction = Union[HyperActionTable, HyperActionRow]
 
 
 class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]):
+    _item_model = DatasourceItem
+    _item_tag = "datasource"
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
@@ -133,11 +138,34 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
         """
         logger.info("Querying all datasources on site")
         url = self.baseurl
-        server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_datasource_items = DatasourceItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(url, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_datasource_items = DatasourceItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_datasource_items, pagination_item
 
+    @api(version="2.0")
+    def get_streamed(self, req_options: Optional[RequestOptions] = None) -> StreamedPage[DatasourceItem]:
+        """
+        Queries one page of datasources like `get`, but parses the response while
+        it downloads. Iterating the result yields each datasource as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[DatasourceItem]
+            The datasources of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming datasources on site")
+        return self._get_streamed(self.baseurl, req_options, "datasource", DatasourceItem.from_xml)
+
     # Get 1 datasource by id
     @api(version="2.0")
     def get_by_id(self, datasource_id: str) -> DatasourceItem:
@@ -513,6 +541,7 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
         connection_credentials: Optional[ConnectionCredentials] = None,
         connections: Optional[Sequence[ConnectionItem]] = None,
         as_job: Literal[False] = False,
+        resume: bool = False,
     ) -> DatasourceItem:
         pass
 
@@ -525,6 +554,7 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
         connection_credentials: Optional[ConnectionCredentials] = None,
         connections: Optional[Sequence[ConnectionItem]] = None,
         as_job: Literal[True] = True,
+        resume: bool = False,
     ) -> JobItem:
         pass
 
@@ -540,6 +570,7 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
         connection_credentials=None,
         connections=None,
         as_job=False,
+        resume=False,
     ):
         """
         Publishes a data source to a server, or appends data to an existing
@@ -579,6 +610,12 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
             item. If False, the publish operation is synchronous and returns a
             datasource item.
 
+        resume : bool, default False
+            For files published in chunks, saves the progress of the upload
+            after every chunk. If the upload fails, publishing the same file
+            path again with resume=True carries on after the last chunk the
+            server acknowledged instead of sending the whole file again.
+
         Returns
         -------
         Union[DatasourceItem, JobItem]
@@ -639,7 +676,7 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
                     filename, config.FILESIZE_LIMIT_MB, config.CHUNK_SIZE_MB
                 )
             )
-            upload_session_id = self.parent_srv.fileuploads.upload(file)
+            upload_session_id = self.parent_srv.fileuploads.upload(file, resume=resume)
             url = f"{url}&uploadSessionId={upload_session_id}"
             xml_request, content_type = RequestFactory.Datasource.publish_req_chunked(
                 datasource_item, connection_credentials, connections
@@ -647,13 +684,10 @@ class Datasources(QuerysetEndpoint[DatasourceItem], TaggingMixin[DatasourceItem]
         else:
             logger.info(f"Publishing {filename} to server")
 
-            if isinstance(file, (Path, str)):
-                with open(file, "rb") as f:
-                    file_contents = f.read()
-            elif isinstance(file, io_types_r):
-                file_contents = file.read()
-            else:
+            if not isinstance(file, (Path, str, *io_types_r)):
                 raise TypeError("file should be a filepath or file object.")
+            # Read while the request is sent, so the file is never in memory as a whole
+            file_contents = FilePart(file)
 
             xml_request, content_type = RequestFactory.Datasource.publish_req(
                 datasource_item,
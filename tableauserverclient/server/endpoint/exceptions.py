@@ -1,6 +1,7 @@
-from defusedxml.ElementTree import fromstring
 from typing import Mapping, Optional, TypeVar
 
+from tableauserverclient.helpers.parsing import fromstring, parse_json
+
 
 def split_pascal_case(s: str) -> str:
     return "".join([f" {c}" if c.isupper() else c for c in s]).strip()
@@ -26,8 +27,15 @@ class XMLError(TableauError):
 
     @classmethod
     def from_response(cls, resp, ns, url):
+        # Servers in JSON mode send errors as JSON, with the same structure as the XML
+        if resp.lstrip()[:1] in (b"{", "{"):
+            try:
+                parsed_response = parse_json(resp)
+            except ValueError:
+                raise NonXMLResponseError(resp)
+        else:
+            parsed_response = fromstring(resp)
         # Check elements exist before .text
-        parsed_response = fromstring(resp)
         try:
             error_response = cls(
                 parsed_response.find("t:error", namespaces=ns).get("code", ""),
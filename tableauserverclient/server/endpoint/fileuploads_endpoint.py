@@ -1,10 +1,80 @@
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional
+
 from .endpoint import Endpoint, api
-from tableauserverclient import datetime_helpers as datetime
 from tableauserverclient.helpers.logging import logger
 
 from tableauserverclient.config import BYTES_PER_MB, config
 from tableauserverclient.models import FileuploadItem
 from tableauserverclient.server import RequestFactory
+from tableauserverclient.server.chunk_sizing import AdaptiveChunkSize, ChunkProgress
+from tableauserverclient.server.endpoint.exceptions import ServerResponseError
+from tableauserverclient.server.upload_checkpoint import UploadCheckpoint
+
+
+class _SessionMismatch(Exception):
+    """The upload session of a resumed checkpoint does not hold the bytes the checkpoint says it does."""
+
+
+def _read_into(file, buffer: bytearray, size: int) -> memoryview:
+    """Reads up to size bytes from file into buffer and returns the part filled."""
+    readinto = getattr(file, "readinto", None)
+    if readinto is None:
+        return memoryview(file.read(size))
+    view = memoryview(buffer)
+    filled = 0
+    # Unbuffered files and pipes can return less than asked for before the end
+    while filled < size:
+        read = readinto(view[filled:size])
+        if not read:
+            break
+        filled += read
+    return view[:filled]
+
+
+def _read_ahead(file, chunk_size: Callable[[], int], offset: int = 0):
+    """
+    Yields the chunks of a file, reading the next chunk on a background
+    thread while the caller sends the current one. Chunks are read into two
+    buffers in turn and yielded as memoryviews over them, so a chunk is only
+    valid until the next one is asked for. chunk_size is asked for the size
+    of each chunk once the chunk before it has been read, before that one is
+    sent. A file path is read from offset.
+    """
+    file_opened = False
+    try:
+        # Unbuffered, so chunks are read straight into the buffers
+        file_content = open(file, "rb", buffering=0)
+        file_opened = True
+        file_content.seek(offset)
+    except TypeError:
+        file_content = file
+
+    buffers = [bytearray(), bytearray()]
+
+    def read(reader: ThreadPoolExecutor, turn: int) -> "Future[memoryview]":
+        size = chunk_size()
+        if len(buffers[turn]) < size:
+            buffers[turn] = bytearray(size)
+        return reader.submit(_read_into, file_content, buffers[turn], size)
+
+    try:
+        with ThreadPoolExecutor(1, thread_name_prefix="tsc-upload-read") as reader:
+            turn = 0
+            pending = read(reader, turn)
+            while True:
+                chunk = pending.result()
+                if not chunk:
+                    break
+                # The other buffer was sent before this chunk was asked for, so it can be filled again
+                turn ^= 1
+                pending = read(reader, turn)
+                yield chunk
+    finally:
+        if file_opened:
+            file_content.close()
 
 
 class Fileuploads(Endpoint):
@@ -27,7 +97,8 @@ class Fileuploads(Endpoint):
     @api(version="2.0")
     def append(self, upload_id, data, content_type):
         url = f"{self.baseurl}/{upload_id}"
-        server_response = self.put_request(url, data, content_type)
+        # Each append adds to the upload, so a chunk the server may already have taken is not sent again
+        server_response = self.put_request(url, data, content_type, retryable=False)
         logger.info(f"Uploading a chunk to session (ID: {upload_id})")
         return FileuploadItem.from_response(server_response.content, self.parent_srv.namespace)
 
@@ -49,13 +120,119 @@ class Fileuploads(Endpoint):
             if file_opened:
                 file_content.close()
 
-    def upload(self, file):
-        upload_id = self.initiate()
-        for chunk in self._read_chunks(file):
-            logger.debug(f"{datetime.timestamp()} processing chunk...")
-            request, content_type = RequestFactory.Fileupload.chunk_req(chunk)
-            logger.debug(f"{datetime.timestamp()} created chunk request")
+    def upload(
+        self,
+        file,
+        progress: Optional[Callable[[ChunkProgress], None]] = None,
+        chunk_size: Optional[AdaptiveChunkSize] = None,
+        resume: bool = False,
+    ) -> str:
+        """
+        Uploads a file in chunks to an upload session and returns the
+        session ID. The next chunk is read while the current one is sent.
+
+        Parameters
+        ----------
+        file : str, Path or file object
+            The file to upload.
+
+        progress : Callable[[ChunkProgress], None], optional
+            Called after each chunk with its size and timing. Defaults to
+            the upload_progress of the server.
+
+        chunk_size : AdaptiveChunkSize, optional
+            Sizes the chunks from the measured throughput. Defaults to an
+            AdaptiveChunkSize when TSC_CHUNK_SIZE_ADAPTIVE is true, and
+            otherwise chunks are TSC_CHUNK_SIZE_MB.
+
+        resume : bool, default False
+            Saves a checkpoint after every chunk, so that if the upload
+            fails, uploading the same file again with resume=True carries on
+            in the same session after the last chunk the server
+            acknowledged. Only file paths can be resumed.
+
+        Raises
+        ------
+        ValueError
+            If resume is True and file is not a file path.
+
+        PermissionError
+            If resume is True and TSC_UPLOAD_CHECKPOINT_DIR is owned by, or
+            writable by, another user.
+
+        Returns
+        -------
+        str
+            The upload session ID.
+        """
+        if not resume:
+            upload_id = self.initiate()
+            self._upload_chunks(file, upload_id, progress, chunk_size)
+            logger.info(f"File upload finished (ID: {upload_id})")
+            return upload_id
+
+        if not isinstance(file, (str, os.PathLike)):
+            raise ValueError("Only uploads of a file path can be resumed.")
+        checkpoint_path = UploadCheckpoint.path_for(self.parent_srv.server_address, self.parent_srv.site_id, file)
+        resumed = UploadCheckpoint.resume(checkpoint_path, file)
+        if resumed is None:
+            checkpoint = UploadCheckpoint.start(checkpoint_path, self.initiate(), file)
+        else:
+            checkpoint = resumed
+            logger.info(f"Resuming file upload (ID: {checkpoint.upload_id}) after {checkpoint.acknowledged} bytes")
+
+        resumed_from = checkpoint.acknowledged
+        try:
+            self._upload_chunks(file, checkpoint.upload_id, progress, chunk_size, checkpoint)
+        except (ServerResponseError, _SessionMismatch) as error:
+            # The session of an old checkpoint may have expired or hold other bytes than the checkpoint says, in
+            # which case the upload starts over
+            if resumed is None or checkpoint.acknowledged > resumed_from:
+                raise
+            if isinstance(error, ServerResponseError) and not error.code.startswith("404"):
+                raise
+            logger.info(f"Upload session {checkpoint.upload_id} cannot be resumed ({error}), starting over")
+            checkpoint = UploadCheckpoint.start(checkpoint_path, self.initiate(), file)
+            self._upload_chunks(file, checkpoint.upload_id, progress, chunk_size, checkpoint)
+
+        checkpoint.delete()
+        logger.info(f"File upload finished (ID: {checkpoint.upload_id})")
+        return checkpoint.upload_id
+
+    def _upload_chunks(
+        self,
+        file,
+        upload_id: str,
+        progress: Optional[Callable[[ChunkProgress], None]],
+        chunk_size: Optional[AdaptiveChunkSize],
+        checkpoint: Optional[UploadCheckpoint] = None,
+    ) -> None:
+        progress = progress or self.parent_srv.upload_progress
+        if chunk_size is None and config.CHUNK_SIZE_ADAPTIVE:
+            chunk_size = AdaptiveChunkSize()
+        # Read by _read_ahead when it starts reading each chunk
+        next_size = [chunk_size.initial_size if chunk_size else config.CHUNK_SIZE_MB * BYTES_PER_MB]
+
+        uploaded = checkpoint.acknowledged if checkpoint else 0
+        for index, chunk in enumerate(_read_ahead(file, lambda: next_size[0], uploaded)):
+            request, content_type = RequestFactory.Fileupload.chunk_body(chunk)
+            started = time.perf_counter()
             fileupload_item = self.append(upload_id, request, content_type)
-            logger.info(f"\t{datetime.timestamp()} Published {fileupload_item.file_size}MB")
-        logger.info(f"File upload finished (ID: {upload_id})")
-        return upload_id
+            elapsed = time.perf_counter() - started
+            uploaded += len(chunk)
+            if checkpoint is not None:
+                if (
+                    index == 0
+                    and checkpoint.acknowledged
+                    and not checkpoint.agrees_with(fileupload_item.file_size, chunk)
+                ):
+                    raise _SessionMismatch(
+                        f"the session has {fileupload_item.file_size}MB, not {checkpoint.file_size_mb}MB "
+                        f"and the {len(chunk)} bytes sent"
+                    )
+                checkpoint.acknowledge(chunk, fileupload_item.file_size)
+            if chunk_size is not None:
+                next_size[0] = chunk_size.next_size(next_size[0], len(chunk), elapsed)
+            logger.info("\tPublished %sMB", fileupload_item.file_size)
+            if progress is not None:
+                progress(ChunkProgress(upload_id, index, len(chunk), elapsed, uploaded, next_size[0]))
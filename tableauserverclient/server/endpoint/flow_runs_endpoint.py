@@ -15,6 +15,8 @@ if TYPE_CHECKING:
 
 
 class FlowRuns(QuerysetEndpoint[FlowRunItem]):
+    cache_responses = False
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
         return None
@@ -5,12 +5,14 @@ import logging
 import os
 from contextlib import closing
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING, Union
+from typing import Optional, TYPE_CHECKING, TypeVar, Union, overload
 from collections.abc import Iterable
 
 from tableauserverclient.helpers.headers import fix_filename
 
 from tableauserverclient.server.endpoint.dqw_endpoint import _DataQualityWarningEndpoint
+from tableauserverclient.server.streaming import StreamedPage
+from tableauserverclient.server.multipart import FilePart
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import InternalServerError, MissingRequiredFieldError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
@@ -37,6 +39,7 @@ FILESIZE_LIMIT = 1024 * 1024 * 64  # 64MB
 ALLOWED_FILE_EXTENSIONS = ["tfl", "tflx"]
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.models import DQWItem
@@ -88,10 +91,33 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
         logger.info("Querying all flows on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_flow_items = FlowItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_flow_items = FlowItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_flow_items, pagination_item
 
+    @api(version="3.3")
+    def get_streamed(self, req_options: Optional["RequestOptions"] = None) -> StreamedPage[FlowItem]:
+        """
+        Queries one page of flows like `get`, but parses the response while
+        it downloads. Iterating the result yields each flow as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[FlowItem]
+            The flows of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming flows on site")
+        return self._get_streamed(self.baseurl, req_options, "flow", FlowItem.from_xml)
+
     # Get 1 flow by id
     @api(version="3.3")
     def get_by_id(self, flow_id: str) -> FlowItem:
@@ -187,6 +213,14 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
         self.delete_request(url)
         logger.info(f"Deleted single flow (ID: {flow_id})")
 
+    T = TypeVar("T", bound=FileObjectW)
+
+    @overload
+    def download(self, flow_id: str, filepath: T) -> T: ...
+
+    @overload
+    def download(self, flow_id: str, filepath: Optional[FilePath] = None) -> str: ...
+
     # Download 1 flow by id
     @api(version="3.3")
     def download(self, flow_id: str, filepath: Optional[PathOrFileW] = None) -> PathOrFileW:
@@ -334,7 +368,12 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
     # Publish flow
     @api(version="3.3")
     def publish(
-        self, flow_item: FlowItem, file: PathOrFileR, mode: str, connections: Optional[list[ConnectionItem]] = None
+        self,
+        flow_item: FlowItem,
+        file: PathOrFileR,
+        mode: str,
+        connections: Optional[list[ConnectionItem]] = None,
+        resume: bool = False,
     ) -> FlowItem:
         """
         Publishes a flow to the Tableau Server.
@@ -360,6 +399,12 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
             A list of connection items to publish with the flow. If the flow
             contains connections, they must be included in this list.
 
+        resume: bool, default False
+            For files published in chunks, saves the progress of the upload
+            after every chunk. If the upload fails, publishing the same file
+            path again with resume=True carries on after the last chunk the
+            server acknowledged instead of sending the whole file again.
+
         Returns
         -------
         FlowItem
@@ -415,21 +460,16 @@ class Flows(QuerysetEndpoint[FlowItem], TaggingMixin[FlowItem]):
         # Determine if chunking is required (64MB is the limit for single upload method)
         if file_size >= FILESIZE_LIMIT:
             logger.info(f"Publishing {filename} to server with chunking method (flow over 64MB)")
-            upload_session_id = self.parent_srv.fileuploads.upload(file)
+            upload_session_id = self.parent_srv.fileuploads.upload(file, resume=resume)
             url = f"{url}&uploadSessionId={upload_session_id}"
             xml_request, content_type = RequestFactory.Flow.publish_req_chunked(flow_item, connections)
         else:
             logger.info(f"Publishing {filename} to server")
 
-            if isinstance(file, (str, Path)):
-                with open(file, "rb") as f:
-                    file_contents = f.read()
-
-            elif isinstance(file, io_types_r):
-                file_contents = file.read()
-
-            else:
+            if not isinstance(file, (str, Path, *io_types_r)):
                 raise TypeError("file should be a filepath or file object.")
+            # Read while the request is sent, so the file is never in memory as a whole
+            file_contents = FilePart(file)
 
             xml_request, content_type = RequestFactory.Flow.publish_req(flow_item, filename, file_contents, connections)
 
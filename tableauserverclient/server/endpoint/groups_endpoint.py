@@ -1,5 +1,6 @@
 import logging
 
+from tableauserverclient.server.streaming import StreamedPage
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.server import RequestFactory
@@ -7,6 +8,7 @@ from tableauserverclient.models import GroupItem, UserItem, PaginationItem, JobI
 from tableauserverclient.server.pager import Pager
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 from typing import Literal, Optional, TYPE_CHECKING, Union, overload
 from collections.abc import Iterable
@@ -70,11 +72,34 @@ class Groups(QuerysetEndpoint[GroupItem]):
         """
         logger.info("Querying all groups on site")
         url = self.baseurl
-        server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_group_items = GroupItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(url, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_group_items = GroupItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_group_items, pagination_item
 
+    @api(version="2.0")
+    def get_streamed(self, req_options: Optional["RequestOptions"] = None) -> StreamedPage[GroupItem]:
+        """
+        Queries one page of groups like `get`, but parses the response while
+        it downloads. Iterating the result yields each group as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[GroupItem]
+            The groups of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming groups on site")
+        return self._get_streamed(self.baseurl, req_options, "group", GroupItem.from_xml)
+
     @api(version="2.0")
     def populate_users(self, group_item: GroupItem, req_options: Optional["RequestOptions"] = None) -> None:
         """
@@ -132,8 +157,9 @@ class Groups(QuerysetEndpoint[GroupItem]):
     ) -> tuple[list[UserItem], PaginationItem]:
         url = f"{self.baseurl}/{group_item.id}/users"
         server_response = self.get_request(url, req_options)
-        user_item = UserItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        user_item = UserItem.from_response(parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
         logger.info(f"Populated users for group (ID: {group_item.id})")
         return user_item, pagination_item
 
@@ -173,7 +199,7 @@ class Groups(QuerysetEndpoint[GroupItem]):
         logger.info(f"Deleted single group (ID: {group_id})")
 
     @overload
-    def update(self, group_item: GroupItem, as_job: Literal[False]) -> GroupItem: ...
+    def update(self, group_item: GroupItem, as_job: Literal[False] = False) -> GroupItem: ...
 
     @overload
     def update(self, group_item: GroupItem, as_job: Literal[True]) -> JobItem: ...
@@ -258,7 +284,7 @@ class Groups(QuerysetEndpoint[GroupItem]):
         return GroupItem.from_response(server_response.content, self.parent_srv.namespace)[0]
 
     @overload
-    def create_AD_group(self, group_item: GroupItem, asJob: Literal[False]) -> GroupItem: ...
+    def create_AD_group(self, group_item: GroupItem, asJob: Literal[False] = False) -> GroupItem: ...
 
     @overload
     def create_AD_group(self, group_item: GroupItem, asJob: Literal[True]) -> JobItem: ...
@@ -1,6 +1,7 @@
 from typing import Literal, Optional, TYPE_CHECKING, Union
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 from tableauserverclient.models.group_item import GroupItem
 from tableauserverclient.models.groupset_item import GroupSetItem
 from tableauserverclient.models.pagination_item import PaginationItem
@@ -33,8 +34,9 @@ class GroupSets(QuerysetEndpoint[GroupSetItem]):
         if result_level:
             url += f"?resultlevel={result_level}"
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_group_set_items = GroupSetItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_group_set_items = GroupSetItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_group_set_items, pagination_item
 
     @api(version="3.22")
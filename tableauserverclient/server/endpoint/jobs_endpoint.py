@@ -15,6 +15,8 @@ from typing import Optional, Union
 
 
 class Jobs(QuerysetEndpoint[BackgroundJobItem]):
+    cache_responses = False
+
     @property
     def baseurl(self):
         return f"{self.parent_srv.baseurl}/sites/{self.parent_srv.site_id}/jobs"
@@ -28,7 +30,7 @@ class Jobs(QuerysetEndpoint[BackgroundJobItem]):
         ...
 
     @overload  # type: ignore[override]
-    def get(self: Self, job_id: None, req_options: Optional[RequestOptionsBase]) -> tuple[list[BackgroundJobItem], PaginationItem]:  # type: ignore[override]
+    def get(self: Self, job_id: None = None, req_options: Optional[RequestOptionsBase] = None) -> tuple[list[BackgroundJobItem], PaginationItem]:  # type: ignore[override]
         ...
 
     @api(version="2.6")
@@ -69,9 +71,10 @@ class Jobs(QuerysetEndpoint[BackgroundJobItem]):
             req_options = job_id
 
         self.parent_srv.assert_at_least_version("3.1", "Jobs.get_by_id(job_id)")
-        server_response = self.get_request(self.baseurl, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        jobs = BackgroundJobItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(self.baseurl, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        jobs = BackgroundJobItem.from_response(parsed_response, self.parent_srv.namespace)
         return jobs, pagination_item
 
     @api(version="3.1")
@@ -1,6 +1,7 @@
 from typing import Optional, Union
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 from tableauserverclient.models.linked_tasks_item import LinkedTaskItem, LinkedTaskJobItem
 from tableauserverclient.models.pagination_item import PaginationItem
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
@@ -22,8 +23,9 @@ class LinkedTasks(QuerysetEndpoint[LinkedTaskItem]):
         logger.info("Querying all linked tasks on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_group_items = LinkedTaskItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_group_items = LinkedTaskItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_group_items, pagination_item
 
     @api(version="3.15")
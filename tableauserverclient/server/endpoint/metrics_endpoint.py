@@ -16,6 +16,7 @@ if TYPE_CHECKING:
 
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class Metrics(QuerysetEndpoint[MetricItem]):
@@ -35,8 +36,9 @@ class Metrics(QuerysetEndpoint[MetricItem]):
         logger.info("Querying all metrics on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_metric_items = MetricItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_metric_items = MetricItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_metric_items, pagination_item
 
     # Get 1 metric by id
@@ -1,6 +1,7 @@
 import logging
 
 from tableauserverclient.server.endpoint.default_permissions_endpoint import _DefaultPermissionsEndpoint
+from tableauserverclient.server.streaming import StreamedPage
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, XML_CONTENT_TYPE
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
@@ -8,7 +9,7 @@ from tableauserverclient.server import RequestFactory, RequestOptions
 from tableauserverclient.models.permissions_item import PermissionsRule
 from tableauserverclient.models import ProjectItem, PaginationItem, Resource
 
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Union
 
 from tableauserverclient.server.query import QuerySet
 
@@ -56,11 +57,34 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         """
         logger.info("Querying all projects on site")
         url = self.baseurl
-        server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_project_items = ProjectItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(url, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_project_items = ProjectItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_project_items, pagination_item
 
+    @api(version="2.0")
+    def get_streamed(self, req_options: Optional["RequestOptions"] = None) -> StreamedPage[ProjectItem]:
+        """
+        Queries one page of projects like `get`, but parses the response while
+        it downloads. Iterating the result yields each project as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[ProjectItem]
+            The projects of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming projects on site")
+        return self._get_streamed(self.baseurl, req_options, "project", ProjectItem.from_xml)
+
     @api(version="2.0")
     def delete(self, project_id: str) -> None:
         """
@@ -227,7 +251,7 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         return self._permissions.update(item, rules)
 
     @api(version="2.0")
-    def delete_permission(self, item: ProjectItem, rules: list[PermissionsRule]) -> None:
+    def delete_permission(self, item: ProjectItem, rules: Union[PermissionsRule, list[PermissionsRule]]) -> None:
         """
         Deletes the specified permissions from the project item.
 
@@ -238,8 +262,8 @@ class Projects(QuerysetEndpoint[ProjectItem]):
         item : ProjectItem
             The project item to delete permissions from.
 
-        rules : list[PermissionsRule]
-            The list of permissions rules to delete from the project.
+        rules : PermissionsRule | list[PermissionsRule]
+            The permissions rule, or list of rules, to delete from the project.
 
         Returns
         -------
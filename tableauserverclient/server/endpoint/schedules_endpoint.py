@@ -12,6 +12,7 @@ from tableauserverclient.models import PaginationItem, ScheduleItem, TaskItem, E
 from tableauserverclient.models.schedule_item import parse_batch_schedule_state
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 AddResponse = namedtuple("AddResponse", ("result", "error", "warnings", "task_created"))
 OK = AddResponse(result=True, error=None, warnings=None, task_created=None)
@@ -52,8 +53,9 @@ class Schedules(Endpoint):
         logger.info("Querying all schedules")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_schedule_items = ScheduleItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_schedule_items = ScheduleItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_schedule_items, pagination_item
 
     @api(version="3.8")
@@ -276,9 +278,10 @@ class Schedules(Endpoint):
         logger.info(f"Querying extract refresh tasks for schedule (ID: {schedule_id})")
         url = f"{self.siteurl}/{schedule_id}/extracts"
         server_response = self.get_request(url, req_options)
+        parsed_response = parse_response(server_response.content)
 
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        extract_items = ExtractItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        extract_items = ExtractItem.from_response(parsed_response, self.parent_srv.namespace)
 
         return extract_items, pagination_item
 
@@ -4,9 +4,11 @@ import logging
 from .endpoint import Endpoint, api
 from .exceptions import MissingRequiredFieldError
 from tableauserverclient.server import RequestFactory
+from tableauserverclient.server.streaming import StreamedPage
 from tableauserverclient.models import SiteAuthConfiguration, SiteItem, PaginationItem
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 from typing import TYPE_CHECKING, Optional
 
@@ -55,10 +57,33 @@ class Sites(Endpoint):
         logger.info("Requires Server Admin permissions")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_site_items = SiteItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_site_items = SiteItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_site_items, pagination_item
 
+    @api(version="2.0")
+    def get_streamed(self, req_options: Optional["RequestOptions"] = None) -> StreamedPage[SiteItem]:
+        """
+        Queries one page of sites like `get`, but parses the response while
+        it downloads. Iterating the result yields each site as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[SiteItem]
+            The sites of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming sites on site")
+        return self._get_streamed(self.baseurl, req_options, "site", SiteItem.from_xml)
+
     # Gets 1 site by id
     @api(version="2.0")
     def get_by_id(self, site_id: str) -> SiteItem:
@@ -6,6 +6,7 @@ from tableauserverclient.server import RequestFactory
 from tableauserverclient.models import SubscriptionItem, PaginationItem
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 from typing import Optional, TYPE_CHECKING
 
@@ -23,9 +24,10 @@ class Subscriptions(Endpoint):
         logger.info("Querying all subscriptions for the site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
+        parsed_response = parse_response(server_response.content)
 
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_subscriptions = SubscriptionItem.from_response(server_response.content, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_subscriptions = SubscriptionItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_subscriptions, pagination_item
 
     @api(version="2.3")
@@ -13,6 +13,7 @@ from tableauserverclient.models import TableItem, ColumnItem, PaginationItem
 from tableauserverclient.server.pager import Pager
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 from tableauserverclient.server.request_options import RequestOptions
 
 if TYPE_CHECKING:
@@ -53,8 +54,9 @@ class Tables(Endpoint, TaggingMixin[TableItem]):
         logger.info("Querying all tables on site")
         url = self.baseurl
         server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_table_items = TableItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_table_items = TableItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_table_items, pagination_item
 
     # Get 1 table
@@ -191,8 +193,9 @@ class Tables(Endpoint, TaggingMixin[TableItem]):
     ) -> tuple[list[ColumnItem], PaginationItem]:
         url = f"{self.baseurl}/{table_item.id}/columns"
         server_response = self.get_request(url, req_options)
-        columns = ColumnItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        columns = ColumnItem.from_response(parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
         return columns, pagination_item
 
     @api(version="3.5")
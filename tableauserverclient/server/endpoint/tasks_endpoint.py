@@ -7,12 +7,15 @@ from tableauserverclient.models import TaskItem, PaginationItem
 from tableauserverclient.server import RequestFactory
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.server.request_options import RequestOptions
 
 
 class Tasks(Endpoint):
+    cache_responses = False
+
     @property
     def baseurl(self) -> str:
         return f"{self.parent_srv.baseurl}/sites/{self.parent_srv.site_id}/tasks"
@@ -56,9 +59,10 @@ class Tasks(Endpoint):
 
         url = f"{self.baseurl}/{self.__normalize_task_type(task_type)}"
         server_response = self.get_request(url, req_options)
+        parsed_response = parse_response(server_response.content)
 
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_tasks = TaskItem.from_response(server_response.content, self.parent_srv.namespace, task_type)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_tasks = TaskItem.from_response(parsed_response, self.parent_srv.namespace, task_type)
         return all_tasks, pagination_item
 
     @api(version="2.6")
@@ -90,7 +94,7 @@ class Tasks(Endpoint):
         return TaskItem.from_response(server_response.content, self.parent_srv.namespace)[0]
 
     @api(version="3.19")
-    def create(self, extract_item: TaskItem) -> TaskItem:
+    def create(self, extract_item: TaskItem) -> bytes:
         """
         Creates a custom schedule for an extract refresh on Tableau Cloud. For
         Tableau Server, use the Schedules endpoint to create a schedule.
@@ -104,7 +108,8 @@ class Tasks(Endpoint):
 
         Returns
         -------
-        TaskItem
+        bytes
+            The raw XML response describing the created task.
         """
         if not extract_item:
             error = "No extract refresh provided"
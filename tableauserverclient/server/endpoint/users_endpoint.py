@@ -9,6 +9,7 @@ import warnings
 
 from tableauserverclient.server.query import QuerySet
 
+from tableauserverclient.server.streaming import StreamedPage
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError, ServerResponseError
 from tableauserverclient.server import RequestFactory, RequestOptions
@@ -16,6 +17,7 @@ from tableauserverclient.models import UserItem, WorkbookItem, PaginationItem, G
 from tableauserverclient.server.pager import Pager
 
 from tableauserverclient.helpers.logging import logger
+from tableauserverclient.helpers.parsing import parse_response
 
 
 class Users(QuerysetEndpoint[UserItem]):
@@ -95,11 +97,37 @@ class Users(QuerysetEndpoint[UserItem]):
         req_options.all_fields = True
 
         url = self.baseurl
-        server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_user_items = UserItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(url, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_user_items = UserItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_user_items, pagination_item
 
+    @api(version="2.0")
+    def get_streamed(self, req_options: Optional[RequestOptions] = None) -> StreamedPage[UserItem]:
+        """
+        Queries one page of users like `get`, but parses the response while
+        it downloads. Iterating the result yields each user as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[UserItem]
+            The users of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming users on site")
+        if req_options is None:
+            req_options = RequestOptions()
+        req_options.all_fields = True
+        return self._get_streamed(self.baseurl, req_options, "user", UserItem.from_xml)
+
     # Gets 1 user by id
     @api(version="2.0")
     def get_by_id(self, user_id: str) -> UserItem:
@@ -616,9 +644,10 @@ class Users(QuerysetEndpoint[UserItem]):
         if owned_only:
             url += "?ownedBy=true"
         server_response = self.get_request(url, req_options)
+        parsed_response = parse_response(server_response.content)
         logger.info(f"Populated workbooks for user (ID: {user_item.id})")
-        workbook_item = WorkbookItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        workbook_item = WorkbookItem.from_response(parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
         return workbook_item, pagination_item
 
     def populate_favorites(self, user_item: UserItem) -> None:
@@ -695,9 +724,10 @@ class Users(QuerysetEndpoint[UserItem]):
     ) -> tuple[list[GroupItem], PaginationItem]:
         url = f"{self.baseurl}/{user_item.id}/groups"
         server_response = self.get_request(url, req_options)
+        parsed_response = parse_response(server_response.content)
         logger.info(f"Populated groups for user (ID: {user_item.id})")
-        group_item = GroupItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        group_item = GroupItem.from_response(parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
         return group_item, pagination_item
 
     def filter(self, *invalid, page_size: Optional[int] = None, **kwargs) -> QuerySet[UserItem]:
@@ -2,6 +2,7 @@ import logging
 from contextlib import closing
 
 from tableauserverclient.models.permissions_item import PermissionsRule
+from tableauserverclient.server.streaming import StreamedPage
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.exceptions import MissingRequiredFieldError, UnsupportedAttributeError
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
@@ -71,11 +72,42 @@ class Views(QuerysetEndpoint[ViewItem], TaggingMixin[ViewItem]):
         url = self.baseurl
         if usage:
             url += "?includeUsageStatistics=true"
-        server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_view_items = ViewItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(url, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_view_items = ViewItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_view_items, pagination_item
 
+    @api(version="2.2")
+    def get_streamed(
+        self, req_options: Optional["RequestOptions"] = None, usage: bool = False
+    ) -> StreamedPage[ViewItem]:
+        """
+        Queries one page of views like `get`, but parses the response while
+        it downloads. Iterating the result yields each view as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        usage : bool, optional
+            If True, includes usage statistics in the response.
+
+        Returns
+        -------
+        StreamedPage[ViewItem]
+            The views of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming views on site")
+        url = self.baseurl
+        if usage:
+            url += "?includeUsageStatistics=true"
+        return self._get_streamed(url, req_options, "view", ViewItem.from_xml)
+
     @api(version="3.1")
     def get_by_id(self, view_id: str, usage: bool = False) -> ViewItem:
         """
@@ -14,6 +14,7 @@ from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api
 from tableauserverclient.server.endpoint.permissions_endpoint import _PermissionsEndpoint
 from tableauserverclient.server.endpoint.resource_tagger import TaggingMixin
 from tableauserverclient.server.pager import Pager
+from tableauserverclient.helpers.parsing import parse_response
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Server
@@ -31,8 +32,9 @@ class VirtualConnections(QuerysetEndpoint[VirtualConnectionItem], TaggingMixin):
     @api(version="3.18")
     def get(self, req_options: Optional[RequestOptions] = None) -> tuple[list[VirtualConnectionItem], PaginationItem]:
         server_response = self.get_request(self.baseurl, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        virtual_connections = VirtualConnectionItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        virtual_connections = VirtualConnectionItem.from_response(parsed_response, self.parent_srv.namespace)
         return virtual_connections, pagination_item
 
     @api(version="3.18")
@@ -47,8 +49,9 @@ class VirtualConnections(QuerysetEndpoint[VirtualConnectionItem], TaggingMixin):
         self, virtual_connection: VirtualConnectionItem, req_options: Optional[RequestOptions] = None
     ) -> tuple[list[ConnectionItem], PaginationItem]:
         server_response = self.get_request(f"{self.baseurl}/{virtual_connection.id}/connections", req_options)
-        connections = ConnectionItem.from_response(server_response.content, self.parent_srv.namespace)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
+        parsed_response = parse_response(server_response.content)
+        connections = ConnectionItem.from_response(parsed_response, self.parent_srv.namespace)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
 
         return connections, pagination_item
 
@@ -86,8 +89,9 @@ class VirtualConnections(QuerysetEndpoint[VirtualConnectionItem], TaggingMixin):
         self, virtual_connection: VirtualConnectionItem, req_options: Optional[RequestOptions] = None
     ) -> tuple[list[RevisionItem], PaginationItem]:
         server_response = self.get_request(f"{self.baseurl}/{virtual_connection.id}/revisions", req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        revisions = RevisionItem.from_response(server_response.content, self.parent_srv.namespace, virtual_connection)
+        parsed_response = parse_response(server_response.content)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        revisions = RevisionItem.from_response(parsed_response, self.parent_srv.namespace, virtual_connection)
         return revisions, pagination_item
 
     @api(version="3.23")
@@ -10,6 +10,8 @@ from tableauserverclient.helpers.headers import fix_filename
 from tableauserverclient.models.permissions_item import PermissionsRule
 from tableauserverclient.server.query import QuerySet
 
+from tableauserverclient.server.streaming import StreamedPage
+from tableauserverclient.server.multipart import FilePart
 from tableauserverclient.server.endpoint.endpoint import QuerysetEndpoint, api, parameter_added_in
 from tableauserverclient.server.endpoint.exceptions import (
     InternalServerError,
@@ -64,6 +66,9 @@ PathOrFileW = Union[FilePath, FileObjectW]
 
 
 class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
+    _item_model = WorkbookItem
+    _item_tag = "workbook"
+
     def __init__(self, parent_srv: "Server") -> None:
         super().__init__(parent_srv)
         self._permissions = _PermissionsEndpoint(parent_srv, lambda: self.baseurl)
@@ -95,11 +100,34 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         """
         logger.info("Querying all workbooks on site")
         url = self.baseurl
-        server_response = self.get_request(url, req_options)
-        pagination_item = PaginationItem.from_response(server_response.content, self.parent_srv.namespace)
-        all_workbook_items = WorkbookItem.from_response(server_response.content, self.parent_srv.namespace)
+        server_response = self.get_request(url, req_options, accept_json=True)
+        parsed_response = self._parse_list_response(server_response)
+        pagination_item = PaginationItem.from_response(parsed_response, self.parent_srv.namespace)
+        all_workbook_items = WorkbookItem.from_response(parsed_response, self.parent_srv.namespace)
         return all_workbook_items, pagination_item
 
+    @api(version="2.0")
+    def get_streamed(self, req_options: Optional["RequestOptions"] = None) -> StreamedPage[WorkbookItem]:
+        """
+        Queries one page of workbooks like `get`, but parses the response while
+        it downloads. Iterating the result yields each workbook as soon as it has
+        been read, which keeps memory flat for large page sizes. Used by
+        Pager(stream=True).
+
+        Parameters
+        ----------
+        req_options : RequestOptions, optional
+            The request options, as for `get`.
+
+        Returns
+        -------
+        StreamedPage[WorkbookItem]
+            The workbooks of the page. Its pagination is available once the
+            page has been iterated.
+        """
+        logger.info("Streaming workbooks on site")
+        return self._get_streamed(self.baseurl, req_options, "workbook", WorkbookItem.from_xml)
+
     # Get 1 workbook
     @api(version="2.0")
     def get_by_id(self, workbook_id: str) -> WorkbookItem:
@@ -152,7 +180,7 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
     @api(version="3.5")
     def create_extract(
         self,
-        workbook_item: WorkbookItem,
+        workbook_item: Union[WorkbookItem, str],
         encrypt: bool = False,
         includeAll: bool = True,
         datasources: Optional[list["DatasourceItem"]] = None,
@@ -164,8 +192,8 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
 
         Parameters
         ----------
-        workbook_item : WorkbookItem
-            The workbook item to create extracts for.
+        workbook_item : WorkbookItem | str
+            The workbook item or workbook ID to create extracts for.
 
         encrypt : bool, default False
             Set to True to encrypt the extracts.
@@ -194,7 +222,9 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
 
     # delete all the extracts on 1 workbook
     @api(version="3.3")
-    def delete_extract(self, workbook_item: WorkbookItem, includeAll: bool = True, datasources=None) -> JobItem:
+    def delete_extract(
+        self, workbook_item: Union[WorkbookItem, str], includeAll: bool = True, datasources=None
+    ) -> JobItem:
         """
         Delete all extracts of embedded datasources on 1 workbook.
 
@@ -202,8 +232,8 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
 
         Parameters
         ----------
-        workbook_item : WorkbookItem
-            The workbook item to delete extracts from.
+        workbook_item : WorkbookItem | str
+            The workbook item or workbook ID to delete extracts from.
 
         includeAll : bool, default True
             If True, all data sources in the workbook will have their extracts
@@ -768,10 +798,11 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         workbook_item: WorkbookItem,
         file: PathOrFileR,
         mode: str,
-        connections: Optional[Sequence[ConnectionItem]],
-        as_job: Literal[False],
-        skip_connection_check: bool,
+        connections: Optional[Sequence[ConnectionItem]] = None,
+        as_job: Literal[False] = False,
+        skip_connection_check: bool = False,
         parameters=None,
+        resume: bool = False,
     ) -> WorkbookItem: ...
 
     @overload
@@ -780,10 +811,11 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         workbook_item: WorkbookItem,
         file: PathOrFileR,
         mode: str,
-        connections: Optional[Sequence[ConnectionItem]],
-        as_job: Literal[True],
-        skip_connection_check: bool,
+        connections: Optional[Sequence[ConnectionItem]] = None,
+        as_job: Literal[True] = True,
+        skip_connection_check: bool = False,
         parameters=None,
+        resume: bool = False,
     ) -> JobItem: ...
 
     @api(version="2.0")
@@ -798,6 +830,7 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         as_job: bool = False,
         skip_connection_check: bool = False,
         parameters=None,
+        resume: bool = False,
     ):
         """
         Publish a workbook to the specified site.
@@ -851,6 +884,12 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
             will succeed but unchecked connection issues may result in a
             non-functioning workbook. Defaults to False.
 
+        resume : bool, default False
+            For files published in chunks, saves the progress of the upload
+            after every chunk. If the upload fails, publishing the same file
+            path again with resume=True carries on after the last chunk the
+            server acknowledged instead of sending the whole file again.
+
         Raises
         ------
         OSError
@@ -935,7 +974,7 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         # Determine if chunking is required (64MB is the limit for single upload method)
         if file_size >= FILESIZE_LIMIT:
             logger.info(f"Publishing {workbook_item.name} to server with chunking method (workbook over 64MB)")
-            upload_session_id = self.parent_srv.fileuploads.upload(file)
+            upload_session_id = self.parent_srv.fileuploads.upload(file, resume=resume)
             url = f"{url}&uploadSessionId={upload_session_id}"
             xml_request, content_type = RequestFactory.Workbook.publish_req_chunked(
                 workbook_item,
@@ -944,15 +983,10 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
         else:
             logger.info(f"Publishing {filename} to server")
 
-            if isinstance(file, (str, Path)):
-                with open(file, "rb") as f:
-                    file_contents = f.read()
-
-            elif isinstance(file, io_types_r):
-                file_contents = file.read()
-
-            else:
+            if not isinstance(file, (str, Path, *io_types_r)):
                 raise TypeError("file should be a filepath or file object.")
+            # Read while the request is sent, so the file is never in memory as a whole
+            file_contents = FilePart(file)
 
             xml_request, content_type = RequestFactory.Workbook.publish_req(
                 workbook_item,
@@ -960,7 +994,8 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
                 file_contents,
                 connections=connections,
             )
-        logger.debug(f"Request xml: {redact_xml(xml_request[:1000])} ")
+        if isinstance(xml_request, bytes):
+            logger.debug("Request xml: %s", redact_xml(xml_request[:1000]))
 
         # Send the publishing request to server
         try:
@@ -1026,12 +1061,16 @@ class Workbooks(QuerysetEndpoint[WorkbookItem], TaggingMixin[WorkbookItem]):
 
     @overload
     def download_revision(
-        self, workbook_id: str, revision_number: Optional[str], filepath: T, include_extract: bool
+        self, workbook_id: str, revision_number: Optional[str], filepath: T, include_extract: bool = True
     ) -> T: ...
 
     @overload
     def download_revision(
-        self, workbook_id: str, revision_number: Optional[str], filepath: Optional[FilePath], include_extract: bool
+        self,
+        workbook_id: str,
+        revision_number: Optional[str],
+        filepath: Optional[FilePath],
+        include_extract: bool = True,
     ) -> str: ...
 
     # Download 1 workbook revision by revision number
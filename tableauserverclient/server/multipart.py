@@ -0,0 +1,125 @@
+import os
+from collections.abc import Iterator
+from typing import IO, Optional, Union
+
+# bytes, bytearray or a memoryview over either
+BytesLike = Union[bytes, bytearray, memoryview]
+
+# Bytes read from a file at a time while its part is sent
+FILE_BLOCK_SIZE = 1024 * 1024
+
+
+class FilePart:
+    """
+    The contents of a file as the data of a MultipartBody part. The file is
+    read a block at a time while the body is sent, so it is never held in
+    memory as a whole. A path is opened each time the body is sent. A file
+    object is read from the position it had when the part was made, and
+    must stay open until the request is done.
+
+    Parameters
+    ----------
+    file : str, os.PathLike or file object
+        The file, opened in binary mode if it is a file object.
+    """
+
+    def __init__(self, file: Union[str, os.PathLike, IO[bytes]]) -> None:
+        self.file = file
+        if isinstance(file, (str, os.PathLike)):
+            self.start = 0
+            self.size = os.path.getsize(file)
+        else:
+            self.start = file.tell()
+            self.size = file.seek(0, os.SEEK_END) - self.start
+            file.seek(self.start)
+
+    def __repr__(self):
+        return f"<FilePart {self.file!r} size={self.size}>"
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[bytes]:
+        if isinstance(self.file, (str, os.PathLike)):
+            with open(self.file, "rb") as file:
+                yield from self._blocks(file)
+        else:
+            self.file.seek(self.start)
+            yield from self._blocks(self.file)
+
+    def _blocks(self, file: IO[bytes]) -> Iterator[bytes]:
+        left = self.size
+        while left:
+            block = file.read(min(left, FILE_BLOCK_SIZE))
+            if not block:
+                # The Content-Length sent promised more, so the server would wait for it
+                raise OSError(f"{self.file!r} ended before the {self.size} bytes it had when the request was built")
+            left -= len(block)
+            yield block
+
+
+class MultipartBody:
+    """
+    A multipart/mixed request body that is sent part by part instead of
+    being joined into one bytes object first. The bytes sent are the same
+    as those _add_multipart builds with urllib3, but the data of each part
+    is passed to the connection as it is, so a memoryview over a chunk of a
+    file is sent without being copied, and a FilePart is read from its file
+    while it is sent.
+
+    requests sends a body with __iter__ and __len__ as a stream with a
+    Content-Length header. The body can be iterated more than once, so a
+    request that is retried sends it again.
+
+    Parameters
+    ----------
+    parts : dict[str, tuple[str, Union[str, BytesLike, FilePart], str]]
+        The parts of the body keyed by name, each a (filename, data,
+        content_type) tuple like those _add_multipart takes.
+
+    boundary : Optional[str]
+        The boundary between parts. A random one is chosen by default.
+    """
+
+    def __init__(
+        self, parts: dict[str, tuple[str, Union[str, BytesLike, FilePart], str]], boundary: Optional[str] = None
+    ) -> None:
+        # Only publishing builds multipart requests
+        from urllib3.fields import RequestField
+        from urllib3.filepost import choose_boundary
+
+        self.boundary = boundary or choose_boundary()
+        self._segments: list[Union[memoryview, FilePart]] = []
+        for name, (filename, data, content_type) in parts.items():
+            # Only the headers of the field are used, so it is not given the data
+            field = RequestField(name=name, data="", filename=filename)
+            field.make_multipart(content_type=content_type)
+            head = f"--{self.boundary}\r\n{field.render_headers()}"
+            self._segments.append(memoryview(head.encode("utf-8")))
+            if isinstance(data, FilePart):
+                self._segments.append(data)
+            else:
+                self._segments.append(memoryview(data.encode("utf-8") if isinstance(data, str) else data))
+            self._segments.append(memoryview(b"\r\n"))
+        self._segments.append(memoryview(f"--{self.boundary}--\r\n".encode("latin-1")))
+        self._length = sum(
+            len(segment) if isinstance(segment, FilePart) else segment.nbytes for segment in self._segments
+        )
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/mixed; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Union[bytes, memoryview]]:
+        for segment in self._segments:
+            if isinstance(segment, FilePart):
+                yield from segment
+            elif segment.nbytes:
+                # An empty part has nothing to send
+                yield segment
+
+    def __bytes__(self) -> bytes:
+        return b"".join(self)
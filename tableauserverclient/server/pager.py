@@ -1,9 +1,14 @@
 import copy
+import math
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from functools import partial
-from typing import Optional, Protocol, TypeVar, Union, runtime_checkable
+from itertools import islice
+from typing import Callable, Optional, Protocol, TypeVar, Union, runtime_checkable
 from collections.abc import Iterable, Iterator
 
 from tableauserverclient.models.pagination_item import PaginationItem
+from tableauserverclient.models.records import to_record
 from tableauserverclient.server.request_options import RequestOptions
 
 
@@ -42,27 +47,56 @@ class Pager(Iterable[T]):
         The request options to pass to the endpoint. If not provided, will use default RequestOptions.
         Filters, sorts, page size, starting page number, etc can be set here.
 
+    prefetch: int, optional
+        Number of pages to fetch ahead of the consumer on a background thread pool. Defaults to 0, which
+        fetches one page at a time. Once the first page reports the total number of items, up to `prefetch`
+        further pages are requested concurrently. Items are still yielded in page order, and no more than
+        `prefetch` pages are held in memory ahead of the page being consumed.
+
+    stream: bool, optional
+        Parse each page while it downloads and yield items as soon as they have been read, instead of waiting
+        for the whole page. Defaults to False. Only applies to endpoints with a `get_streamed` method, such as
+        workbooks, users, datasources, views, projects, flows, groups and sites; others are paged as usual.
+        Can't be combined with `prefetch`.
+
+    as_records: bool, optional
+        Yield compact, immutable records instead of model items. Defaults to False. Records hold only the
+        parsed attributes and take much less memory, which matters when keeping hundreds of thousands of
+        users or views. Call `to_model()` on a record to get the full item. Supported for users, groups,
+        projects, workbooks, views, datasources and sites.
+
     Yields
     ------
     T
-        The items returned from the endpoint.
+        The items returned from the endpoint, or their records if `as_records` is set.
 
     Raises
     ------
     ValueError
-        If the endpoint is not a callable or an Endpoint object.
+        If the endpoint is not a callable or an Endpoint object, prefetch is negative, or prefetch is combined
+        with stream.
     """
 
     def __init__(
         self,
         endpoint: Union[CallableEndpoint[T], Endpoint[T]],
         request_opts: Optional[RequestOptions] = None,
+        *,
+        prefetch: int = 0,
+        stream: bool = False,
+        as_records: bool = False,
         **kwargs,
     ) -> None:
+        self._stream = False
         if isinstance(endpoint, Endpoint):
-            # The simpliest case is to take an Endpoint and call its get
-            endpoint = partial(endpoint.get, **kwargs)
-            self._endpoint = endpoint
+            if stream and hasattr(endpoint, "get_streamed"):
+                # Endpoints that can parse a page while it downloads return a StreamedPage
+                self._endpoint = partial(endpoint.get_streamed, **kwargs)
+                self._stream = True
+            else:
+                # The simpliest case is to take an Endpoint and call its get
+                endpoint = partial(endpoint.get, **kwargs)
+                self._endpoint = endpoint
         elif isinstance(endpoint, CallableEndpoint):
             # but if they pass a callable then use that instead (used internally)
             endpoint = partial(endpoint, **kwargs)
@@ -71,19 +105,38 @@ class Pager(Iterable[T]):
             # Didn't get something we can page over
             raise ValueError("Pager needs a server endpoint to page through.")
 
+        if prefetch < 0:
+            raise ValueError("prefetch must be zero or a positive number of pages.")
+        if prefetch and stream:
+            raise ValueError("Pages can be prefetched or streamed, not both.")
+
         self._options = request_opts or RequestOptions()
+        self._prefetch = prefetch
+        self._as_records = as_records
 
     def __iter__(self) -> Iterator[T]:
         options = copy.deepcopy(self._options)
+        items = self._iter_prefetched(options) if self._prefetch else self._iter_pages(options)
+        if self._as_records:
+            # Converted as they are yielded, so at most one page of full models is alive at a time
+            return map(to_record, items)
+        return items
+
+    def _iter_pages(self, options: RequestOptions) -> Iterator[T]:
         while True:
-            # Fetch the first page
-            current_item_list, pagination_item = self._endpoint(options)
+            if self._stream:
+                # Items come out while the page downloads, the pagination is known once it is done
+                page = self._endpoint(options)
+                yield from page
+                pagination_item = page.pagination
+            else:
+                # Fetch the first page
+                current_item_list, pagination_item = self._endpoint(options)
+                yield from current_item_list
 
             if pagination_item.total_available is None:
-                # This endpoint does not support pagination, drain the list and return
-                yield from current_item_list
+                # This endpoint does not support pagination, the list has been drained
                 return
-            yield from current_item_list
 
             if pagination_item.page_size * pagination_item.page_number >= pagination_item.total_available:
                 # Last page, exit
@@ -92,3 +145,47 @@ class Pager(Iterable[T]):
             # Update the options to fetch the next page
             options.pagenumber = pagination_item.page_number + 1
             options.pagesize = pagination_item.page_size
+
+    def _iter_prefetched(self, options: RequestOptions) -> Iterator[T]:
+        current_item_list, pagination_item = self._endpoint(options)
+        yield from current_item_list
+        if pagination_item.total_available is None or not pagination_item.page_size:
+            # Without a total there is nothing to prefetch against, the first page is all there is
+            return
+
+        page_size = pagination_item.page_size
+        last_page = math.ceil(pagination_item.total_available / page_size)
+
+        def fetch_page(page_number: int) -> tuple[list[T], PaginationItem]:
+            page_options = copy.deepcopy(options)
+            page_options.pagenumber = page_number
+            page_options.pagesize = page_size
+            return self._endpoint(page_options)
+
+        page_numbers = range(pagination_item.page_number + 1, last_page + 1)
+        for current_item_list, _ in prefetch_pages(fetch_page, page_numbers, self._prefetch):
+            yield from current_item_list
+
+
+R = TypeVar("R")
+
+
+def prefetch_pages(fetch_page: Callable[[int], R], page_numbers: Iterable[int], depth: int) -> Iterator[R]:
+    """
+    Calls `fetch_page` for each of `page_numbers` on a pool of `depth` threads and yields the results in
+    the order of `page_numbers`. At most `depth` pages are requested ahead of the one being yielded. If the
+    consumer stops early, pages that have not started are cancelled.
+    """
+    pages = iter(page_numbers)
+    pool = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="tsc-prefetch")
+    pending: deque[Future[R]] = deque(pool.submit(fetch_page, n) for n in islice(pages, depth))
+    try:
+        while pending:
+            result = pending.popleft().result()
+            for n in islice(pages, 1):
+                pending.append(pool.submit(fetch_page, n))
+            yield result
+    finally:
+        for future in pending:
+            future.cancel()
+        pool.shutdown(wait=False)
@@ -1,11 +1,21 @@
-from collections.abc import Iterable, Iterator, Sized
+from collections.abc import Iterable, Iterator, Sequence, Sized
+import copy
 from itertools import count
-from typing import Optional, Protocol, TYPE_CHECKING, TypeVar, overload
+from typing import Any, Optional, Protocol, TYPE_CHECKING, TypeVar, overload
 import sys
 from tableauserverclient.config import config
 from tableauserverclient.models.pagination_item import PaginationItem
+from tableauserverclient.models.records import to_record
+from tableauserverclient.server.columns import (
+    build_columns,
+    import_optional,
+    is_datetime_column,
+    timestamps_to_datetime64,
+    to_datetime64,
+)
 from tableauserverclient.server.endpoint.exceptions import ServerResponseError
 from tableauserverclient.server.filter import Filter
+from tableauserverclient.server.pager import prefetch_pages
 from tableauserverclient.server.request_options import RequestOptions
 from tableauserverclient.server.sort import Sort
 import math
@@ -13,15 +23,21 @@ import math
 from typing_extensions import Self
 
 if TYPE_CHECKING:
+    from tableauserverclient.models.lazy import RowReader
     from tableauserverclient.server.endpoint import QuerysetEndpoint
 
 T = TypeVar("T")
 
 
 class Slice(Protocol):
-    start: Optional[int]
-    step: Optional[int]
-    stop: Optional[int]
+    @property
+    def start(self) -> Optional[int]: ...
+
+    @property
+    def step(self) -> Optional[int]: ...
+
+    @property
+    def stop(self) -> Optional[int]: ...
 
 
 def to_camel_case(word: str) -> str:
@@ -60,6 +76,10 @@ class QuerySet(Iterable[T], Sized):
     QuerySets are also indexable, and can be sliced. If you try to access an
     index that has not been fetched, the QuerySet will fetch the page that
     contains the item you are looking for.
+
+    Iteration fetches one page at a time by default. Calling `prefetch(n)`
+    fetches up to n pages ahead on a background thread pool once the total
+    count is known, while still yielding items in order.
     """
 
     def __init__(self, model: "QuerysetEndpoint[T]", page_size: Optional[int] = None) -> None:
@@ -67,6 +87,7 @@ class QuerySet(Iterable[T], Sized):
         self.request_options = RequestOptions(pagesize=page_size or config.PAGE_SIZE)
         self._result_cache: list[T] = []
         self._pagination_item = PaginationItem()
+        self._prefetch = 0
 
     def __iter__(self: Self) -> Iterator[T]:
         # Not built to be re-entrant. Starts back at page 1, and empties
@@ -95,6 +116,27 @@ class QuerySet(Iterable[T], Sized):
                 continue
             if (page * self.page_size) >= size:
                 return
+            if self._prefetch and self.total_available is not None:
+                yield from self._iter_prefetched(page + 1)
+                return
+
+    def _iter_prefetched(self: Self, first_page: int) -> Iterator[T]:
+        page_size = self.page_size
+        last_page = math.ceil(self.total_available / page_size)
+
+        def fetch_page(page_number: int) -> tuple[list[T], PaginationItem]:
+            options = copy.deepcopy(self.request_options)
+            options.pagenumber = page_number
+            options.pagesize = page_size
+            return self.model.get(options)
+
+        pages = range(first_page, last_page + 1)
+        for page, (items, pagination_item) in zip(pages, prefetch_pages(fetch_page, pages, self._prefetch)):
+            # Keep the cache pointing at the page being yielded so indexing
+            # and the pagination properties stay consistent mid-iteration.
+            self.request_options.pagenumber = page
+            self._result_cache, self._pagination_item = items, pagination_item
+            yield from items
 
     @overload
     def __getitem__(self: Self, k: Slice) -> list[T]: ...
@@ -208,6 +250,156 @@ class QuerySet(Iterable[T], Sized):
             self.request_options.pagesize = kwargs["page_size"]
         return self
 
+    def prefetch(self: Self, pages: int) -> Self:
+        """
+        Fetch up to `pages` pages ahead of the consumer while iterating.
+        Pages are requested concurrently on a bounded thread pool after the
+        first page reports the total number of items. Items are yielded in
+        the same order as without prefetching. Pass 0 to disable.
+
+        Parameters
+        ----------
+        pages : int
+            The number of pages to fetch ahead.
+
+        Returns
+        -------
+        QuerySet
+        """
+        if pages < 0:
+            raise ValueError("prefetch must be zero or a positive number of pages.")
+        self._prefetch = pages
+        return self
+
+    def records(self: Self) -> Iterator[Any]:
+        """
+        Iterate over the QuerySet as compact, immutable records instead of
+        model items. A record is a named tuple of the parsed attributes, with
+        nested owner and project items reduced to their IDs and names. Keeping
+        records instead of items cuts memory for large listings. Call
+        `to_model()` on a record to get the full item back.
+
+        Returns
+        -------
+        Iterator
+            A UserRecord, WorkbookRecord, ViewRecord, etc. for each item.
+
+        Examples
+        --------
+        >>> users = list(server.users.all().records())
+        >>> admins = [u for u in users if u.site_role == "SiteAdministratorCreator"]
+        >>> admin = admins[0].to_model()
+        """
+        return map(to_record, self)
+
+    def to_columns(self: Self, fields: Sequence[str], numpy: Optional[bool] = None) -> dict[str, Any]:
+        """
+        Read the given attributes of every item in the QuerySet into one
+        column per attribute, paging through the results. Workbooks and data
+        sources are read straight from the response without building an item
+        for each, and only the fields asked for are parsed. Other items are
+        built a page at a time, so the columns are all that is kept.
+
+        Datetime columns are converted to NumPy datetime64[s] arrays, in UTC
+        and with NaT for missing values, when NumPy is installed. Other
+        columns are lists.
+
+        Parameters
+        ----------
+        fields : Sequence[str]
+            The item attributes to read, such as "name", "size" or "owner_id".
+
+        numpy : bool, optional
+            Whether to convert datetime columns to NumPy arrays. By default
+            they are converted if NumPy is installed. True raises ImportError
+            if it is not, False always returns lists.
+
+        Returns
+        -------
+        dict[str, Any]
+            The columns, keyed by attribute name, in the order of `fields`.
+
+        Examples
+        --------
+        >>> columns = server.workbooks.all().to_columns(["name", "size", "updated_at"])
+        >>> largest = max(zip(columns["size"], columns["name"]))
+        """
+        if isinstance(fields, str):
+            raise TypeError("fields must be a sequence of attribute names, not a string.")
+        np = None
+        if numpy or numpy is None:
+            try:
+                np = import_optional("numpy", "Converting datetime columns")
+            except ImportError:
+                if numpy:
+                    raise
+
+        read_row = self.model._row_reader(fields, timestamps=np is not None)
+        if read_row is not None:
+            columns: dict[str, Any] = self._read_columns(read_row)
+            for field in read_row.timestamps:
+                columns[field] = timestamps_to_datetime64(columns[field], np)
+            return columns
+
+        columns = build_columns(self, fields)
+        if np is not None:
+            for field, values in columns.items():
+                if is_datetime_column(values):
+                    columns[field] = to_datetime64(values, np)
+        return columns
+
+    def _read_columns(self: Self, read_row: "RowReader") -> dict[str, list[Any]]:
+        """Pages through the results like iterating, reading each item from its element into the columns."""
+        columns: list[list[Any]] = [[] for _ in read_row.names]
+        for page in count(1):
+            self.request_options.pagenumber = page
+            rows, pagination_item = self.model._get_rows(self.request_options, read_row)
+            for column, values in zip(columns, zip(*rows)):
+                column.extend(values)
+            total = pagination_item.total_available
+            if not rows or (total is not None and page * (pagination_item.page_size or self.page_size) >= total):
+                break
+        return dict(zip(read_row.names, columns))
+
+    def to_arrow(self: Self, fields: Sequence[str]) -> Any:
+        """
+        Read the given attributes of every item in the QuerySet into a
+        pyarrow Table. Datetimes become UTC timestamps and tags become lists
+        of strings. Requires pyarrow.
+
+        Parameters
+        ----------
+        fields : Sequence[str]
+            The item attributes to read, as for `to_columns`.
+
+        Returns
+        -------
+        pyarrow.Table
+        """
+        pa = import_optional("pyarrow", "to_arrow")
+        columns = self.to_columns(fields, numpy=False)
+        for field, values in columns.items():
+            if any(isinstance(value, (set, frozenset)) for value in values):
+                columns[field] = [None if value is None else sorted(value) for value in values]
+        return pa.table(columns)
+
+    def to_pandas(self: Self, fields: Sequence[str]) -> Any:
+        """
+        Read the given attributes of every item in the QuerySet into a pandas
+        DataFrame, with datetime columns as datetime64 in UTC. Requires pandas.
+
+        Parameters
+        ----------
+        fields : Sequence[str]
+            The item attributes to read, as for `to_columns`.
+
+        Returns
+        -------
+        pandas.DataFrame
+        """
+        pd = import_optional("pandas", "to_pandas")
+        return pd.DataFrame(self.to_columns(fields, numpy=True), columns=list(fields))
+
     def fields(self: Self, *fields: str) -> Self:
         """
         Add fields to the request options. If no fields are provided, the
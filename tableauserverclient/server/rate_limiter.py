@@ -0,0 +1,124 @@
+import asyncio
+import math
+import threading
+import time
+from collections.abc import Mapping
+from typing import Optional
+
+
+class _TokenBucket:
+    def __init__(self, rate: float, burst: int) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be a positive number of requests per second.")
+        if burst < 1:
+            raise ValueError("burst must be at least 1.")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return f"<_TokenBucket rate={self.rate} burst={self.burst}>"
+
+    def reserve(self) -> float:
+        """Takes a token and returns how long the caller has to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # Tokens may go negative; later callers queue up behind earlier ones
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+
+class RateLimiter:
+    """
+    Client-side token bucket that limits how fast requests are sent. Attach
+    it to a Server, or to several Servers to share one budget between them,
+    and every request made through those servers waits for a token before it
+    is sent. Up to `burst` requests can go out back to back, after which they
+    are spaced to `rate` requests per second.
+
+    Callers block until a token is available instead of letting the server
+    reject the request. The limiter is thread-safe, so requests made from
+    thread pools (for example Pager prefetching or AsyncServer) are limited
+    together. Asyncio code that talks to the server directly can use
+    `acquire_async` to wait without blocking the event loop.
+
+    Parameters
+    ----------
+    rate : float or None
+        Requests per second for all methods combined. If None, only the
+        `method_limits` apply.
+
+    burst : int, optional
+        Number of requests that can be sent without waiting. Defaults to the
+        rate rounded up, so one second worth of requests.
+
+    method_limits : Mapping[str, tuple[float, int]], optional
+        Additional (rate, burst) limits for specific HTTP methods, for example
+        {"POST": (1, 1)}. A request must get a token from both the shared
+        bucket and the bucket for its method.
+
+    Examples
+    --------
+    >>> limiter = TSC.RateLimiter(rate=10, burst=20, method_limits={"POST": (2, 2)})
+    >>> server_a = TSC.Server('https://MY-SERVER', rate_limiter=limiter)
+    >>> server_b = TSC.Server('https://MY-SERVER', rate_limiter=limiter)
+    """
+
+    def __init__(
+        self,
+        rate: Optional[float],
+        burst: Optional[int] = None,
+        *,
+        method_limits: Optional[Mapping[str, tuple[float, int]]] = None,
+    ) -> None:
+        if rate is None and not method_limits:
+            raise ValueError("RateLimiter needs a rate, method_limits, or both.")
+        self._bucket = None if rate is None else _TokenBucket(rate, burst or max(1, math.ceil(rate)))
+        self._method_buckets = {
+            method.upper(): _TokenBucket(method_rate, method_burst)
+            for method, (method_rate, method_burst) in (method_limits or {}).items()
+        }
+        self._lock = threading.Lock()
+        self._throttled_count = 0
+        self._wait_time = 0.0
+
+    def __repr__(self):
+        return f"<RateLimiter {self._bucket} method_limits={self._method_buckets}>"
+
+    @property
+    def throttled_count(self) -> int:
+        """Number of requests that had to wait for a token."""
+        return self._throttled_count
+
+    @property
+    def wait_time(self) -> float:
+        """Total seconds spent waiting for tokens."""
+        return self._wait_time
+
+    def reserve(self, method: str = "GET") -> float:
+        """Takes a token for a request and returns the seconds to wait before sending it."""
+        buckets = [self._bucket, self._method_buckets.get(method.upper())]
+        delay = max((bucket.reserve() for bucket in buckets if bucket is not None), default=0.0)
+        if delay > 0:
+            with self._lock:
+                self._throttled_count += 1
+                self._wait_time += delay
+        return delay
+
+    def acquire(self, method: str = "GET") -> None:
+        """Blocks until a request with the given HTTP method may be sent."""
+        delay = self.reserve(method)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self, method: str = "GET") -> None:
+        """Waits without blocking the event loop until a request with the given HTTP method may be sent."""
+        delay = self.reserve(method)
+        if delay > 0:
+            await asyncio.sleep(delay)
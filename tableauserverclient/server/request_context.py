@@ -0,0 +1,88 @@
+from functools import lru_cache
+from typing import Any, Optional
+
+from packaging.version import Version
+
+TABLEAU_AUTH_HEADER = "x-tableau-auth"
+CONTENT_TYPE_HEADER = "content-type"
+USER_AGENT_HEADER = "User-Agent"
+
+# The version check_at_least_version assumes when the server has none
+DEFAULT_VERSION = "2.4"
+
+
+@lru_cache(maxsize=1)
+def user_agent() -> str:
+    """
+    The User-Agent TSC sends. In a source checkout get_versions runs git,
+    which costs milliseconds, so it is asked once per process.
+    """
+    from tableauserverclient.bin._version import get_versions
+
+    return f"Tableau Server Client/{get_versions()['version']}"
+
+
+class RequestContext:
+    """
+    The parts of a request that only depend on the version and the
+    http_options of a Server: the parsed version, the results of version
+    checks, and the options and headers every request starts from. Server
+    builds one when it is first needed and builds a new one when its version
+    or http_options no longer match, so requests do not parse versions or
+    look up the client version again.
+
+    Parameters
+    ----------
+    version : Optional[str]
+        The REST API version of the server.
+
+    http_options : dict[str, Any]
+        The options passed to requests for every request. A copy is kept.
+    """
+
+    def __init__(self, version: Optional[str], http_options: dict[str, Any]) -> None:
+        self.version = version
+        self.parsed_version: Optional[Version] = Version(version) if version else None
+        self.http_options = dict(http_options)
+        self.headers: dict[str, Any] = dict(http_options.get("headers", {}))
+        if "headers" in http_options:
+            # A copy, so headers changed in place on the server no longer match
+            self.http_options["headers"] = dict(self.headers)
+        self._at_least: dict[str, bool] = {}
+
+    def matches(self, version: Optional[str], http_options: dict[str, Any]) -> bool:
+        return self.version == version and self.http_options == http_options
+
+    def at_least(self, target: str) -> bool:
+        """True if the server version is target or later."""
+        result = self._at_least.get(target)
+        if result is None:
+            result = (self.parsed_version or Version(DEFAULT_VERSION)) >= Version(target)
+            self._at_least[target] = result
+        return result
+
+    def parameters(
+        self,
+        auth_token: Optional[str],
+        content: Optional[bytes],
+        content_type: Optional[str],
+        parameters: Optional[dict[str, Any]],
+    ) -> dict[str, Any]:
+        """The keyword arguments of a request: the http_options, with the headers merged and set."""
+        parameters = parameters or {}
+        request_headers = parameters.get("headers")
+        headers = {**self.headers, **request_headers} if request_headers else dict(self.headers)
+        parameters.update(self.http_options)
+        parameters["headers"] = headers
+
+        if auth_token is not None:
+            headers[TABLEAU_AUTH_HEADER] = auth_token
+        if content_type is not None:
+            headers[CONTENT_TYPE_HEADER] = content_type
+        if USER_AGENT_HEADER not in headers:
+            headers[USER_AGENT_HEADER] = (
+                parameters[USER_AGENT_HEADER] if USER_AGENT_HEADER in parameters else user_agent()
+            )
+        if content is not None:
+            parameters["data"] = content
+        return parameters
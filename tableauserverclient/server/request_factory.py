@@ -4,11 +4,42 @@ from collections.abc import Iterable
 
 from typing_extensions import ParamSpec
 
-from requests.packages.urllib3.fields import RequestField
-from requests.packages.urllib3.filepost import encode_multipart_formdata
 from typing_extensions import Concatenate
 
-from tableauserverclient.models import *
+from tableauserverclient.models import (
+    ColumnItem,
+    ConnectionCredentials,
+    ConnectionItem,
+    Credentials,
+    CustomViewItem,
+    DataAlertItem,
+    DataFreshnessPolicyItem,
+    DatabaseItem,
+    DatasourceItem,
+    ExtensionsServer,
+    ExtensionsSiteSettings,
+    FlowItem,
+    GroupItem,
+    GroupSetItem,
+    IntervalItem,
+    MetricItem,
+    Permission,
+    PermissionsRule,
+    ProjectItem,
+    Resource,
+    ScheduleItem,
+    SiteItem,
+    SiteOIDCConfiguration,
+    SubscriptionItem,
+    TableItem,
+    TaskItem,
+    UserItem,
+    VirtualConnectionItem,
+    WebhookItem,
+    WorkbookItem,
+)
+
+from tableauserverclient.server.multipart import FilePart, MultipartBody
 
 if TYPE_CHECKING:
     from tableauserverclient.server import Server
@@ -17,6 +48,15 @@ if TYPE_CHECKING:
 
 
 def _add_multipart(parts: dict) -> tuple[Any, str]:
+    if any(isinstance(data, FilePart) for _, data, _ in parts.values()):
+        # Files are streamed into the request instead of being read into memory with the rest of the body
+        body = MultipartBody(parts)
+        return body, body.content_type
+
+    # Only publishing builds multipart requests
+    from urllib3.fields import RequestField
+    from urllib3.filepost import encode_multipart_formdata
+
     mime_multipart_parts = list()
     for name, (filename, data, content_type) in parts.items():
         multipart_part = RequestField(name=name, data=data, filename=filename)
@@ -369,6 +409,16 @@ class FileuploadRequest:
         }
         return _add_multipart(parts)
 
+    def chunk_body(self, chunk):
+        """Like chunk_req, but the chunk is streamed from where it is rather than copied into the request."""
+        body = MultipartBody(
+            {
+                "request_payload": ("", "", "text/xml"),
+                "tableau_file": ("file", chunk, "application/octet-stream"),
+            }
+        )
+        return body, body.content_type
+
 
 class FlowRequest:
     def _generate_xml(self, flow_item: "FlowItem", connections: Optional[list["ConnectionItem"]] = None) -> bytes:
@@ -401,7 +451,7 @@ class FlowRequest:
         self,
         flow_item: "FlowItem",
         filename: str,
-        file_contents: bytes,
+        file_contents: Union[bytes, FilePart],
         connections: Optional[list["ConnectionItem"]] = None,
     ) -> tuple[Any, str]:
         xml_request = self._generate_xml(flow_item, connections)
@@ -1465,7 +1515,7 @@ class CustomViewRequest:
         parts = {"request_payload": ("", xml_request, "text/xml")}
         return _add_multipart(parts)
 
-    def publish_req(self, custom_view_item: CustomViewItem, filename: str, file_contents: bytes):
+    def publish_req(self, custom_view_item: CustomViewItem, filename: str, file_contents: Union[bytes, FilePart]):
         xml_request = self._publish_xml(custom_view_item)
         parts = {
             "request_payload": ("", xml_request, "text/xml"),
@@ -0,0 +1,194 @@
+import abc
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, NamedTuple, Optional
+from urllib.parse import urlencode, urlsplit
+
+if TYPE_CHECKING:
+    from requests import Response
+
+
+class CacheKey(NamedTuple):
+    """Identifies a cached GET response: who asked, for which URL, with which query string."""
+
+    scope: str
+    url: str
+    query: str
+
+    @classmethod
+    def build(
+        cls,
+        url: str,
+        params: Optional[dict],
+        site_id: Optional[str],
+        user_id: Optional[str],
+        accept: Optional[str] = None,
+    ) -> "CacheKey":
+        query = urlencode(sorted((params or {}).items()))
+        scope = f"{site_id or ''}:{user_id or ''}"
+        if accept is not None:
+            # A JSON and an XML response for the same URL are different entries
+            scope = f"{scope}:{accept}"
+        return cls(scope, url, query)
+
+
+def resource_path(url: str) -> str:
+    return urlsplit(url).path.rstrip("/")
+
+
+def affected_by(cached_url: str, changed_url: str) -> bool:
+    """
+    True if a change to `changed_url` may make a cached response for
+    `cached_url` stale. That is the case when one path contains the other:
+    updating /sites/1/users/2 affects the user itself, lists such as
+    /sites/1/users and everything below it such as /sites/1/users/2/groups.
+    """
+    cached, changed = resource_path(cached_url), resource_path(changed_url)
+    shorter, longer = sorted((cached, changed), key=len)
+    return longer == shorter or longer.startswith(shorter + "/")
+
+
+class BaseResponseCache(abc.ABC):
+    """Interface the endpoints use to read and invalidate cached GET responses, with shared statistics."""
+
+    def __init__(self) -> None:
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    @property
+    def evictions(self) -> int:
+        """Number of responses dropped to stay within the size limit."""
+        return self._evictions
+
+    @property
+    def invalidations(self) -> int:
+        """Number of responses dropped because their resource changed."""
+        return self._invalidations
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self._hits + self._misses
+        return self._hits / lookups if lookups else 0.0
+
+    def _count(self, hits: int = 0, misses: int = 0, evictions: int = 0, invalidations: int = 0) -> None:
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += misses
+            self._evictions += evictions
+            self._invalidations += invalidations
+
+    @abc.abstractmethod
+    def get(self, key: CacheKey) -> Optional["Response"]:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def set(self, key: CacheKey, response: "Response") -> None:
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def invalidate(self, url: str) -> None:
+        """Drops cached responses that a change to `url` may have made stale."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class ResponseCache(BaseResponseCache):
+    """
+    In-memory cache for responses to GET requests. Attach it to a Server to
+    answer repeated reads, such as server_info.get or get_by_id for the same
+    item, without a round trip.
+
+    Responses are kept for `ttl` seconds. When more than `max_entries`
+    responses are cached, the least recently used one is dropped. A PUT,
+    POST, PATCH or DELETE through the same server drops every cached response
+    for the changed resource, the lists that contain it and anything below
+    it. Only successful responses are cached, and streamed downloads are
+    never cached. Jobs, tasks and flow runs change while they are polled, so
+    their responses are never cached either.
+
+    Responses are cached per site and user, so a cache can be shared by
+    several Server instances.
+
+    Parameters
+    ----------
+    ttl : float, optional
+        Seconds a response stays valid. Defaults to 60.
+
+    max_entries : int, optional
+        Maximum number of cached responses. Defaults to 1024.
+
+    Examples
+    --------
+    >>> cache = TSC.ResponseCache(ttl=300, max_entries=5000)
+    >>> server = TSC.Server('https://MY-SERVER', response_cache=cache)
+    >>> ...
+    >>> print(cache.hits, cache.misses, cache.hit_rate)
+    """
+
+    def __init__(self, ttl: float = 60, max_entries: int = 1024) -> None:
+        if ttl <= 0:
+            raise ValueError("ttl must be a positive number of seconds.")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+        super().__init__()
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[CacheKey, tuple[float, "Response"]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self):
+        return (
+            f"<ResponseCache ttl={self.ttl} entries={len(self._entries)}/{self.max_entries} "
+            f"hits={self._hits} misses={self._misses}>"
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional["Response"]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._count(hits=1)
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+        self._count(misses=1)
+        return None
+
+    def set(self, key: CacheKey, response: "Response") -> None:
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        self._count(evictions=evicted)
+
+    def invalidate(self, url: str) -> None:
+        with self._lock:
+            stale = [key for key in self._entries if affected_by(key.url, url)]
+            for key in stale:
+                del self._entries[key]
+        self._count(invalidations=len(stale))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,173 @@
+import random
+import threading
+import time
+from collections import Counter
+from collections.abc import Collection
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional
+
+from tableauserverclient.exponential_backoff import ASYNC_POLL_MAX_INTERVAL, ASYNC_POLL_MIN_INTERVAL
+
+if TYPE_CHECKING:
+    from requests import Response
+
+RETRY_BACKOFF_FACTOR = 2
+RETRY_STATUS_CODES = frozenset((429, 502, 503, 504))
+# POST and PATCH are not idempotent, so they are never retried by default. A PUT that is not
+# idempotent, like appending to an upload session, opts out with put_request(retryable=False).
+RETRY_METHODS = frozenset(("GET", "PUT", "DELETE"))
+
+
+class RetryPolicy:
+    """
+    Controls automatic retries of requests that fail because the server is
+    throttling or temporarily unavailable. Pass an instance to Server to
+    enable retries, and share one instance across servers to aggregate
+    statistics.
+
+    The delay before each retry grows exponentially from `min_interval` up to
+    `max_interval`, with random jitter so that concurrent clients spread out.
+    When the response carries a `Retry-After` header, that delay is used
+    instead. No retry is made once `max_retries` is reached or when waiting
+    would take the total time spent retrying past `max_elapsed`; the last
+    response is then handled as usual and raises the normal error.
+
+    Parameters
+    ----------
+    max_retries : int, optional
+        The maximum number of retries for a single request. Defaults to 5.
+
+    status_codes : Collection[int], optional
+        HTTP status codes that trigger a retry. Defaults to 429, 502, 503 and
+        504.
+
+    methods : Collection[str], optional
+        HTTP methods that may be retried. Defaults to the idempotent GET, PUT
+        and DELETE.
+
+    min_interval : float, optional
+        Delay in seconds before the first retry.
+
+    max_interval : float, optional
+        Upper bound in seconds for a computed delay. A longer delay requested
+        by `Retry-After` is honoured, subject to `max_elapsed`.
+
+    backoff_factor : float, optional
+        Multiplier applied to the delay after each retry.
+
+    jitter : float, optional
+        Fraction of each computed delay that is randomized, between 0 and 1.
+
+    max_elapsed : float, optional
+        Upper bound in seconds on the total time spent retrying a single
+        request, measured from its first response.
+
+    Examples
+    --------
+    >>> policy = TSC.RetryPolicy(max_retries=8, max_elapsed=600)
+    >>> server = TSC.Server('https://MY-SERVER', retry_policy=policy)
+    >>> ...
+    >>> print(policy.retry_count, policy.retries_by_status)
+    """
+
+    def __init__(
+        self,
+        *,
+        max_retries: int = 5,
+        status_codes: Collection[int] = RETRY_STATUS_CODES,
+        methods: Collection[str] = RETRY_METHODS,
+        min_interval: float = ASYNC_POLL_MIN_INTERVAL,
+        max_interval: float = ASYNC_POLL_MAX_INTERVAL,
+        backoff_factor: float = RETRY_BACKOFF_FACTOR,
+        jitter: float = 0.5,
+        max_elapsed: float = 300,
+    ) -> None:
+        if max_retries < 0:
+            raise ValueError("max_retries must not be negative.")
+        if not 0 <= jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1.")
+        self.max_retries = max_retries
+        self.status_codes = frozenset(status_codes)
+        self.methods = frozenset(m.upper() for m in methods)
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.max_elapsed = max_elapsed
+
+        self._lock = threading.Lock()
+        self._retry_count = 0
+        self._exhausted_count = 0
+        self._retries_by_status: Counter[int] = Counter()
+
+    def __repr__(self):
+        return (
+            f"<RetryPolicy max_retries={self.max_retries} status_codes={sorted(self.status_codes)} "
+            f"methods={sorted(self.methods)} retries={self._retry_count}>"
+        )
+
+    @property
+    def retry_count(self) -> int:
+        """Total number of retries made with this policy."""
+        return self._retry_count
+
+    @property
+    def exhausted_count(self) -> int:
+        """Number of requests that still failed after retries were used up."""
+        return self._exhausted_count
+
+    @property
+    def retries_by_status(self) -> dict[int, int]:
+        """Number of retries made with this policy, by the status code that caused them."""
+        with self._lock:
+            return dict(self._retries_by_status)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._retry_count = 0
+            self._exhausted_count = 0
+            self._retries_by_status.clear()
+
+    def is_retryable(self, method: str, response: "Response") -> bool:
+        return method.upper() in self.methods and response.status_code in self.status_codes
+
+    def next_delay(self, method: str, response: "Response", attempt: int, elapsed: float) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before retrying, or None if the
+        request should not be retried. `attempt` is the number of retries
+        already made for this request and `elapsed` the seconds spent so far.
+        Each call that returns a delay is counted as a retry.
+        """
+        if not self.is_retryable(method, response):
+            return None
+
+        delay = self._retry_after(response)
+        if delay is None:
+            delay = min(self.max_interval, self.min_interval * self.backoff_factor**attempt)
+            delay *= 1 - self.jitter * random.random()
+
+        with self._lock:
+            if attempt >= self.max_retries or elapsed + delay > self.max_elapsed:
+                self._exhausted_count += 1
+                return None
+            self._retry_count += 1
+            self._retries_by_status[response.status_code] += 1
+        return delay
+
+    @staticmethod
+    def _retry_after(response: "Response") -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, retry_at.timestamp() - time.time())
@@ -1,53 +1,58 @@
 from tableauserverclient.helpers.logging import logger
 
+import importlib
 import requests
 import urllib3
 import ssl
+import threading
+from typing import TYPE_CHECKING, Any, Generic, Optional, TypeVar, Union, overload
 
 from defusedxml.ElementTree import fromstring, ParseError
-from packaging.version import Version
-from tableauserverclient.server.endpoint import (
-    Sites,
-    Views,
-    Users,
-    Groups,
-    Workbooks,
-    Datasources,
-    Projects,
-    Auth,
-    Schedules,
-    ServerInfo,
-    Tasks,
-    Subscriptions,
-    Jobs,
-    Metadata,
-    Databases,
-    Tables,
-    Flows,
-    FlowTasks,
-    Webhooks,
-    DataAccelerationReport,
-    Favorites,
-    DataAlerts,
-    Fileuploads,
-    FlowRuns,
-    Metrics,
-    Endpoint,
-    CustomViews,
-    LinkedTasks,
-    GroupSets,
-    Tags,
-    VirtualConnections,
-    OIDC,
-    Extensions,
-)
+from tableauserverclient.server.endpoint.endpoint import Endpoint
 from tableauserverclient.server.exceptions import (
     ServerInfoEndpointNotFoundError,
     EndpointUnavailableError,
 )
 from tableauserverclient.server.endpoint.exceptions import NotSignedInError
+from tableauserverclient.server.request_context import RequestContext
 from tableauserverclient.namespace import Namespace
 
+if TYPE_CHECKING:
+    from tableauserverclient.server.endpoint import (
+        Auth,
+        CustomViews,
+        DataAccelerationReport,
+        DataAlerts,
+        Databases,
+        Datasources,
+        Extensions,
+        Favorites,
+        Fileuploads,
+        FlowRuns,
+        FlowTasks,
+        Flows,
+        GroupSets,
+        Groups,
+        Jobs,
+        LinkedTasks,
+        Metadata,
+        Metrics,
+        OIDC,
+        Projects,
+        Schedules,
+        ServerInfo,
+        Sites,
+        Subscriptions,
+        Tables,
+        Tags,
+        Tasks,
+        Users,
+        Views,
+        VirtualConnections,
+        Webhooks,
+        Workbooks,
+    )
+
 
 _PRODUCT_TO_REST_VERSION = {
     "10.0": "2.3",
@@ -60,6 +65,42 @@ _PRODUCT_TO_REST_VERSION = {
 minimum_supported_server_version = "2.3"
 default_server_version = "2.4"  # first version that dropped the legacy auth endpoint
 
+XML_RESPONSE_FORMAT = "xml"
+JSON_RESPONSE_FORMAT = "json"
+
+
+E = TypeVar("E", bound=Endpoint)
+
+
+class LazyEndpoint(Generic[E]):
+    """
+    An endpoint of Server that is created, and its module imported, the first
+    time it is used. A script that only signs in and lists workbooks does not
+    import the other thirty endpoint modules. Declared as LazyEndpoint[Users]
+    and so on, so type checkers know the endpoint class.
+    """
+
+    def __init__(self, class_name: str) -> None:
+        self.class_name = class_name
+        self.name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, server: None, owner: Optional[type] = None) -> "LazyEndpoint[E]": ...
+
+    @overload
+    def __get__(self, server: "Server", owner: Optional[type] = None) -> E: ...
+
+    def __get__(self, server: Optional["Server"], owner: Optional[type] = None) -> Union[E, "LazyEndpoint[E]"]:
+        if server is None:
+            return self
+        endpoint_class = getattr(importlib.import_module("tableauserverclient.server.endpoint"), self.class_name)
+        # Stored on the instance, which hides this descriptor from later lookups. setdefault keeps one endpoint
+        # when threads get here at the same time
+        return server.__dict__.setdefault(self.name, endpoint_class(server))
+
 
 class Server:
     """
@@ -101,6 +142,30 @@ class Server:
         A factory function that returns a requests.Session object. If not provided,
         requests.session is used.
 
+    retry_policy : RetryPolicy, optional
+        Retries requests that fail with throttling or transient gateway errors
+        (429, 502, 503, 504) using exponential backoff and the Retry-After
+        header. If not provided, failed requests raise immediately.
+
+    rate_limiter : RateLimiter, optional
+        Limits how fast requests are sent. Requests wait for the limiter
+        before they are sent. A limiter can be shared between several Server
+        instances.
+
+    response_cache : ResponseCache or DiskResponseCache, optional
+        Answers repeated GET requests from a cache instead of the server.
+        Changes made through this server drop the affected responses.
+
+    response_format : str, optional
+        "xml" (default) or "json". With "json", list requests for users,
+        groups, workbooks, views, data sources, projects and jobs ask the
+        server for JSON. The items are the same as from XML. Responses that
+        come back as XML, and all other endpoints, are read as XML.
+
+    upload_progress : Callable[[ChunkProgress], None], optional
+        Called after each chunk of a chunked upload, such as publishing a
+        file over 64MB, with the size and timing of the chunk.
+
     Examples
     --------
     >>> import tableauserverclient as TSC
@@ -141,11 +206,57 @@ class Server:
         CreateNew = "CreateNew"
         Replace = "Replace"
 
-    def __init__(self, server_address, use_server_version=False, http_options=None, session_factory=None):
+    auth: "LazyEndpoint[Auth]" = LazyEndpoint("Auth")
+    views: "LazyEndpoint[Views]" = LazyEndpoint("Views")
+    users: "LazyEndpoint[Users]" = LazyEndpoint("Users")
+    sites: "LazyEndpoint[Sites]" = LazyEndpoint("Sites")
+    groups: "LazyEndpoint[Groups]" = LazyEndpoint("Groups")
+    jobs: "LazyEndpoint[Jobs]" = LazyEndpoint("Jobs")
+    workbooks: "LazyEndpoint[Workbooks]" = LazyEndpoint("Workbooks")
+    datasources: "LazyEndpoint[Datasources]" = LazyEndpoint("Datasources")
+    favorites: "LazyEndpoint[Favorites]" = LazyEndpoint("Favorites")
+    flows: "LazyEndpoint[Flows]" = LazyEndpoint("Flows")
+    flow_tasks: "LazyEndpoint[FlowTasks]" = LazyEndpoint("FlowTasks")
+    projects: "LazyEndpoint[Projects]" = LazyEndpoint("Projects")
+    schedules: "LazyEndpoint[Schedules]" = LazyEndpoint("Schedules")
+    server_info: "LazyEndpoint[ServerInfo]" = LazyEndpoint("ServerInfo")
+    tasks: "LazyEndpoint[Tasks]" = LazyEndpoint("Tasks")
+    subscriptions: "LazyEndpoint[Subscriptions]" = LazyEndpoint("Subscriptions")
+    metadata: "LazyEndpoint[Metadata]" = LazyEndpoint("Metadata")
+    databases: "LazyEndpoint[Databases]" = LazyEndpoint("Databases")
+    tables: "LazyEndpoint[Tables]" = LazyEndpoint("Tables")
+    webhooks: "LazyEndpoint[Webhooks]" = LazyEndpoint("Webhooks")
+    data_acceleration_report: "LazyEndpoint[DataAccelerationReport]" = LazyEndpoint("DataAccelerationReport")
+    data_alerts: "LazyEndpoint[DataAlerts]" = LazyEndpoint("DataAlerts")
+    fileuploads: "LazyEndpoint[Fileuploads]" = LazyEndpoint("Fileuploads")
+    flow_runs: "LazyEndpoint[FlowRuns]" = LazyEndpoint("FlowRuns")
+    metrics: "LazyEndpoint[Metrics]" = LazyEndpoint("Metrics")
+    custom_views: "LazyEndpoint[CustomViews]" = LazyEndpoint("CustomViews")
+    linked_tasks: "LazyEndpoint[LinkedTasks]" = LazyEndpoint("LinkedTasks")
+    group_sets: "LazyEndpoint[GroupSets]" = LazyEndpoint("GroupSets")
+    tags: "LazyEndpoint[Tags]" = LazyEndpoint("Tags")
+    virtual_connections: "LazyEndpoint[VirtualConnections]" = LazyEndpoint("VirtualConnections")
+    oidc: "LazyEndpoint[OIDC]" = LazyEndpoint("OIDC")
+    extensions: "LazyEndpoint[Extensions]" = LazyEndpoint("Extensions")
+
+    def __init__(
+        self,
+        server_address,
+        use_server_version=False,
+        http_options=None,
+        session_factory=None,
+        retry_policy=None,
+        rate_limiter=None,
+        response_cache=None,
+        response_format="xml",
+        upload_progress=None,
+    ):
         self._auth_token = None
         self._site_id = None
         self._user_id = None
         self._ssl_context = None
+        self._credentials = None
+        self._auth_lock = threading.Lock()
 
         # TODO: this needs to change to default to https, but without breaking existing code
         if not server_address.startswith("http://") and not server_address.startswith("https://"):
@@ -153,43 +264,19 @@ class Server:
 
         self._server_address: str = server_address
         self._session_factory = session_factory or requests.session
+        self.retry_policy = retry_policy
+        self.rate_limiter = rate_limiter
+        self.response_cache = response_cache
+        if response_format not in (XML_RESPONSE_FORMAT, JSON_RESPONSE_FORMAT):
+            raise ValueError(f"response_format must be 'xml' or 'json', not {response_format!r}.")
+        self.response_format = response_format
+        self.upload_progress = upload_progress
 
-        self.auth = Auth(self)
-        self.views = Views(self)
-        self.users = Users(self)
-        self.sites = Sites(self)
-        self.groups = Groups(self)
-        self.jobs = Jobs(self)
-        self.workbooks = Workbooks(self)
-        self.datasources = Datasources(self)
-        self.favorites = Favorites(self)
-        self.flows = Flows(self)
-        self.flow_tasks = FlowTasks(self)
-        self.projects = Projects(self)
-        self.schedules = Schedules(self)
-        self.server_info = ServerInfo(self)
-        self.tasks = Tasks(self)
-        self.subscriptions = Subscriptions(self)
-        self.metadata = Metadata(self)
-        self.databases = Databases(self)
-        self.tables = Tables(self)
-        self.webhooks = Webhooks(self)
-        self.data_acceleration_report = DataAccelerationReport(self)
-        self.data_alerts = DataAlerts(self)
-        self.fileuploads = Fileuploads(self)
         self._namespace = Namespace()
-        self.flow_runs = FlowRuns(self)
-        self.metrics = Metrics(self)
-        self.custom_views = CustomViews(self)
-        self.linked_tasks = LinkedTasks(self)
-        self.group_sets = GroupSets(self)
-        self.tags = Tags(self)
-        self.virtual_connections = VirtualConnections(self)
-        self.oidc = OIDC(self)
-        self.extensions = Extensions(self)
 
         self._session = self._session_factory()
         self._http_options = dict()  # must set this before making a server call
+        self._request_context: Optional[RequestContext] = None
         if http_options:
             self.add_http_options(http_options)
 
@@ -228,6 +315,7 @@ class Server:
         self._http_options = dict()
 
     def _clear_auth(self):
+        self._credentials = None
         self._site_id = None
         self._user_id = None
         self._auth_token = None
@@ -240,6 +328,28 @@ class Server:
         self._auth_token = auth_token
         self._site_url = site_url
 
+    def _reauthenticate(self, rejected_token) -> bool:
+        """
+        Signs in again with the credentials from the last sign_in after the
+        server rejected `rejected_token`, typically because the session
+        expired. Only one thread signs in; threads that were rejected with the
+        same token wait for it and then use the new token. Returns True if
+        there is a new token to retry the request with.
+        """
+        if self._credentials is None:
+            return False
+        with self._auth_lock:
+            if self._auth_token != rejected_token:
+                # Another thread already signed in again while we waited
+                return self._auth_token is not None
+            logger.info("Authentication token was rejected, signing in again")
+            try:
+                self.auth.sign_in(self._credentials)
+            except Exception as e:
+                logger.info(f"Could not sign in again: {e.__class__}{e}")
+                return False
+            return True
+
     def _get_legacy_version(self):
         # the serverInfo call was introduced in 2.4, earlier than that we have this different call
         response = self._session.get(self.server_address + "/auth?format=xml")
@@ -277,9 +387,7 @@ class Server:
         logger.info("use use_server_version instead", DeprecationWarning)
 
     def check_at_least_version(self, target: str):
-        server_version = Version(self.version or "2.4")
-        target_version = Version(target)
-        return server_version >= target_version
+        return self.request_context.at_least(target)
 
     def assert_at_least_version(self, comparison: str, reason: str):
         if not self.check_at_least_version(comparison):
@@ -330,6 +438,17 @@ class Server:
     def http_options(self):
         return self._http_options
 
+    @property
+    def request_context(self) -> RequestContext:
+        """
+        The parsed version, version checks and request defaults, rebuilt when
+        version or http_options have changed since the last request.
+        """
+        context = self._request_context
+        if context is None or not context.matches(self.version, self._http_options):
+            context = self._request_context = RequestContext(self.version, self._http_options)
+        return context
+
     @property
     def session(self):
         return self._session
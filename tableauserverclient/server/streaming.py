@@ -0,0 +1,96 @@
+from collections.abc import Iterable, Iterator
+from contextlib import closing
+from typing import TYPE_CHECKING, Callable, Generic, Optional, TypeVar
+from xml.etree.ElementTree import Element
+
+from defusedxml.ElementTree import iterparse
+
+from tableauserverclient.models.pagination_item import PaginationItem
+from tableauserverclient.namespace import NAMESPACE_RE, NEW_NAMESPACE
+
+if TYPE_CHECKING:
+    from requests import Response
+
+T = TypeVar("T")
+
+# Bytes read from the connection at a time, the same amount iterparse asks its source for
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+class _ChunkReader:
+    """File-like wrapper that lets iterparse pull the chunks of a streamed response as they arrive."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+
+    def read(self, size: int = -1) -> bytes:
+        # iterparse only needs some bytes on each call, and an empty result once the body is exhausted
+        for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class StreamedPage(Generic[T]):
+    """
+    One page of a list response that is parsed while it downloads. Iterating
+    yields an item as soon as its element has been read, then detaches and
+    clears the element, so neither the whole body nor the whole tree is held
+    in memory. The element of a lazily decoded item is detached but not
+    cleared, and is freed with the item.
+
+    The page can be iterated once. `pagination` is set when the pagination
+    element has been read, which the server sends before the items.
+
+    Parameters
+    ----------
+    response : Response
+        A response requested with stream=True.
+
+    item_tag : str
+        The tag of the item elements, without namespace, such as "workbook".
+
+    parse_item : Callable[[Element, dict[str, str]], T]
+        Builds an item from its element and the namespace map, such as
+        WorkbookItem.from_xml.
+    """
+
+    def __init__(self, response: "Response", item_tag: str, parse_item: Callable[[Element, dict[str, str]], T]) -> None:
+        self._response = response
+        self.item_tag = item_tag
+        self._parse_item = parse_item
+        self.pagination = PaginationItem()
+
+    def __repr__(self):
+        return f"<StreamedPage item_tag={self.item_tag} pagination={self.pagination}>"
+
+    def __iter__(self) -> Iterator[T]:
+        with closing(self._response):
+            ns = {"t": NEW_NAMESPACE}
+            item_tag = pagination_tag = ""
+            # Open elements from the root down. Items are the children of the collection, two levels down.
+            open_elements: list[Element] = []
+            source = _ChunkReader(self._response.iter_content(STREAM_CHUNK_SIZE))
+            for event, element in iterparse(source, events=("start", "end")):
+                if event == "start":
+                    if not open_elements:
+                        match = NAMESPACE_RE.match(element.tag)
+                        if match:
+                            ns = {"t": match.group(1)}
+                        item_tag = f"{{{ns['t']}}}{self.item_tag}"
+                        pagination_tag = f"{{{ns['t']}}}pagination"
+                    open_elements.append(element)
+                    continue
+
+                open_elements.pop()
+                if len(open_elements) == 1 and element.tag == pagination_tag:
+                    self.pagination = PaginationItem.from_xml(element)
+                elif len(open_elements) == 2 and element.tag == item_tag:
+                    item = self._parse_item(element, ns)
+                    # The item has been built, detach the element from the tree that is still being read
+                    open_elements[-1].remove(element)
+                    if "_lazy_source" not in getattr(item, "__dict__", {}):
+                        # Nothing reads the element again, so its children and attributes are freed now. A
+                        # lazily decoded item reads its fields from it later and frees it with the item.
+                        element.clear()
+                    yield item
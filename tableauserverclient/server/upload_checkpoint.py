@@ -0,0 +1,192 @@
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+from tableauserverclient.config import BYTES_PER_MB, config
+from tableauserverclient.helpers.logging import logger
+
+# Version of the checkpoint file format, so older files are ignored if it changes
+CHECKPOINT_FORMAT = 1
+
+# The fields of a saved checkpoint and their types, a file without them is not a checkpoint
+CHECKPOINT_FIELDS = {
+    "upload_id": str,
+    "size": int,
+    "mtime_ns": int,
+    "acknowledged": int,
+    "file_size_mb": int,
+    "sha256": str,
+}
+
+
+def _checkpoint_dir() -> Path:
+    """
+    TSC_UPLOAD_CHECKPOINT_DIR, created if missing so that only the current
+    user can use it. Another user who owns the directory or can write to it
+    could plant a checkpoint to send the rest of a file to their upload
+    session, so such a directory is refused.
+    """
+    directory = Path(config.UPLOAD_CHECKPOINT_DIR)
+    directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Windows has neither user IDs nor these mode bits, its directories are private to the user by default
+    if hasattr(os, "getuid"):
+        stat = directory.stat()
+        if stat.st_uid != os.getuid() or stat.st_mode & 0o022:
+            raise PermissionError(
+                f"Upload checkpoint directory {directory} must be owned by, and only writable by, the current user"
+            )
+    return directory
+
+
+def _hash_prefix(path: Union[str, os.PathLike], length: int) -> "hashlib._Hash":
+    """The sha256 of the first length bytes of a file, which can be updated with the bytes after them."""
+    digest = hashlib.sha256()
+    buffer = bytearray(BYTES_PER_MB)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as file:
+        left = length
+        while left:
+            read = file.readinto(view[: min(left, len(buffer))])
+            if not read:
+                break
+            digest.update(view[:read])
+            left -= read
+    return digest
+
+
+class UploadCheckpoint:
+    """
+    The progress of a chunked upload of a file, kept in a small JSON file
+    so that an upload that fails part way can carry on in the same upload
+    session instead of sending the whole file again.
+
+    The checkpoint records the upload session ID, the size and modification
+    time of the file, how many bytes the server has acknowledged with a
+    sha256 of those bytes, and the size in MB the server last reported for
+    the session. It is saved after every chunk the server acknowledges and
+    deleted once the last chunk is acknowledged. An upload only resumes from
+    it when the file still has the same size, modification time and leading
+    bytes, and only carries on in the session when the size the server
+    reports after the first chunk sent agrees with the bytes acknowledged.
+
+    Checkpoints are kept in TSC_UPLOAD_CHECKPOINT_DIR, one per server, site
+    and file path. It defaults to a directory in the user's cache directory
+    and must be owned by, and only writable by, the current user.
+
+    Parameters
+    ----------
+    path : Path
+        Where the checkpoint is saved.
+
+    upload_id : str
+        The upload session the file is appended to.
+
+    size : int
+        The size of the file in bytes.
+
+    mtime_ns : int
+        The modification time of the file in nanoseconds.
+    """
+
+    def __init__(self, path: Path, upload_id: str, size: int, mtime_ns: int) -> None:
+        self.path = path
+        self.upload_id = upload_id
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.acknowledged = 0
+        self.file_size_mb = 0
+        self.digest = hashlib.sha256()
+
+    def __repr__(self):
+        return f"<UploadCheckpoint upload_id={self.upload_id} acknowledged={self.acknowledged}/{self.size}>"
+
+    @staticmethod
+    def path_for(server_address: str, site_id: Optional[str], file: Union[str, os.PathLike]) -> Path:
+        key = "\n".join((server_address, site_id or "", os.path.abspath(file)))
+        return _checkpoint_dir() / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()[:32]}.json"
+
+    @classmethod
+    def start(cls, path: Path, upload_id: str, file: Union[str, os.PathLike]) -> "UploadCheckpoint":
+        """A checkpoint for a new upload session of file, saved with nothing acknowledged yet."""
+        stat = os.stat(file)
+        checkpoint = cls(path, upload_id, stat.st_size, stat.st_mtime_ns)
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def resume(cls, path: Path, file: Union[str, os.PathLike]) -> Optional["UploadCheckpoint"]:
+        """
+        The checkpoint saved at path, or None if there is none or file is
+        no longer the file it was saved for. A checkpoint that does not
+        match is deleted.
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                saved = json.load(f)
+            stat = os.stat(file)
+        except (OSError, ValueError):
+            return None
+
+        if not isinstance(saved, dict) or saved.get("format") != CHECKPOINT_FORMAT:
+            return None
+        if not all(isinstance(saved.get(field), kind) for field, kind in CHECKPOINT_FIELDS.items()):
+            logger.info(f"Not resuming upload of {file}: {path} is not a checkpoint")
+            path.unlink(missing_ok=True)
+            return None
+        if (saved["size"], saved["mtime_ns"]) != (stat.st_size, stat.st_mtime_ns):
+            logger.info(f"Not resuming upload {saved.get('upload_id')}: {file} has changed")
+            path.unlink(missing_ok=True)
+            return None
+
+        checkpoint = cls(path, saved["upload_id"], saved["size"], saved["mtime_ns"])
+        checkpoint.acknowledged = saved["acknowledged"]
+        checkpoint.file_size_mb = saved["file_size_mb"]
+        checkpoint.digest = _hash_prefix(file, checkpoint.acknowledged)
+        if checkpoint.digest.hexdigest() != saved["sha256"]:
+            logger.info(f"Not resuming upload {checkpoint.upload_id}: {file} has changed")
+            path.unlink(missing_ok=True)
+            return None
+        return checkpoint
+
+    def acknowledge(self, chunk: memoryview, file_size_mb: int) -> None:
+        """Records a chunk the server has acknowledged and saves the checkpoint."""
+        self.acknowledged += len(chunk)
+        self.file_size_mb = file_size_mb
+        self.digest.update(chunk)
+        self.save()
+
+    def agrees_with(self, file_size_mb: int, chunk: memoryview) -> bool:
+        """
+        Whether file_size_mb, the size the server reports for the session
+        once chunk is appended, is that of the acknowledged bytes and chunk
+        rounded to MB either way.
+        """
+        expected = self.acknowledged + len(chunk)
+        return expected // BYTES_PER_MB <= file_size_mb <= -(-expected // BYTES_PER_MB)
+
+    def save(self) -> None:
+        saved = {
+            "format": CHECKPOINT_FORMAT,
+            "upload_id": self.upload_id,
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "acknowledged": self.acknowledged,
+            "file_size_mb": self.file_size_mb,
+            "sha256": self.digest.hexdigest(),
+        }
+        # Written to a new file of its own and moved into place, so a crash never leaves half a checkpoint
+        # and nothing already at a predictable name, such as a symlink, is written through
+        fd, partial = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.stem, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(saved, f)
+            os.replace(partial, self.path)
+        except BaseException:
+            os.unlink(partial)
+            raise
+
+    def delete(self) -> None:
+        self.path.unlink(missing_ok=True)
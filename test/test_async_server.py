@@ -0,0 +1,220 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.async_server import AsyncEndpoint, AsyncQuerySet
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+GET_USER_XML = TEST_ASSET_DIR / "user_get.xml"
+GET_XML_PAGE1 = TEST_ASSET_DIR / "workbook_get_page_1.xml"
+GET_XML_PAGE2 = TEST_ASSET_DIR / "workbook_get_page_2.xml"
+GET_XML_PAGE3 = TEST_ASSET_DIR / "workbook_get_page_3.xml"
+GET_WORKBOOK_BY_ID_XML = TEST_ASSET_DIR / "workbook_get_by_id.xml"
+
+
+@pytest.fixture(scope="function")
+def server():
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    return server
+
+
+def test_wraps_existing_server(server: TSC.Server) -> None:
+    async_server = TSC.AsyncServer(server, max_concurrency=2)
+    assert async_server.server is server
+    assert isinstance(async_server.workbooks, AsyncEndpoint)
+    assert async_server.baseurl == server.baseurl
+    assert async_server.workbooks.baseurl == server.workbooks.baseurl
+    async_server.close()
+
+
+def test_creates_server_from_address() -> None:
+    async_server = TSC.AsyncServer("http://test", http_options={"timeout": 5})
+    assert async_server.server.http_options == {"timeout": 5}
+    async_server.close()
+
+
+def test_rejects_invalid_concurrency(server: TSC.Server) -> None:
+    with pytest.raises(ValueError):
+        TSC.AsyncServer(server, max_concurrency=0)
+
+
+def test_get_returns_parsed_items(server: TSC.Server) -> None:
+    async def main():
+        async with TSC.AsyncServer(server) as async_server:
+            return await async_server.users.get()
+
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=GET_USER_XML.read_text())
+        users, pagination_item = asyncio.run(main())
+
+    assert len(users) == 2
+    assert all(isinstance(user, TSC.UserItem) for user in users)
+    assert pagination_item.total_available == 2
+
+
+def test_gather_by_id(server: TSC.Server) -> None:
+    workbook_id = "3cc6cd06-89ce-4fdc-b935-5294135d6d42"
+
+    async def main():
+        async with TSC.AsyncServer(server, max_concurrency=4) as async_server:
+            return await asyncio.gather(*(async_server.workbooks.get_by_id(workbook_id) for _ in range(10)))
+
+    with requests_mock.mock() as m:
+        m.get(f"{server.workbooks.baseurl}/{workbook_id}", text=GET_WORKBOOK_BY_ID_XML.read_text())
+        workbooks = asyncio.run(main())
+
+    assert len(workbooks) == 10
+    assert {wb.id for wb in workbooks} == {workbook_id}
+
+
+def test_async_for_over_queryset(server: TSC.Server) -> None:
+    async def main():
+        async with TSC.AsyncServer(server) as async_server:
+            queryset = async_server.workbooks.all(page_size=1)
+            assert isinstance(queryset, AsyncQuerySet)
+            return [wb.name async for wb in queryset]
+
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=GET_XML_PAGE1.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=GET_XML_PAGE2.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=GET_XML_PAGE3.read_text())
+        names = asyncio.run(main())
+
+    assert names == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+
+
+def test_async_for_over_changed_since(server: TSC.Server) -> None:
+    async def main():
+        async with TSC.AsyncServer(server) as async_server:
+            queryset = async_server.workbooks.changed_since("2024-01-01T00:00:00Z", page_size=1)
+            assert isinstance(queryset, AsyncQuerySet)
+            return [wb.name async for wb in queryset]
+
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=1&pageSize=1", text=GET_XML_PAGE1.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", text=GET_XML_PAGE2.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", text=GET_XML_PAGE3.read_text())
+        names = asyncio.run(main())
+
+    assert names == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert "updatedat:gte:2024-01-01t00:00:00z" in m.last_request.qs["filter"]
+
+
+class WorkbookPages:
+    """
+    Answers the workbook pages of size 1, each once the event loop has run
+    another task, which it cannot do while a request blocks it.
+    """
+
+    def __init__(self) -> None:
+        self.loop_ran = threading.Event()
+        self.unblocked: list[bool] = []
+
+    def __call__(self, request, context) -> str:
+        self.unblocked.append(self.loop_ran.wait(1))
+        return (GET_XML_PAGE1, GET_XML_PAGE2, GET_XML_PAGE3)[int(request.qs["pagenumber"][0]) - 1].read_text()
+
+
+def consume_with_loop_running(server: TSC.Server, consume) -> tuple[Any, WorkbookPages]:
+    pages = WorkbookPages()
+
+    async def main():
+        async with TSC.AsyncServer(server) as async_server:
+            queryset = async_server.workbooks.all(page_size=1)
+            loop = asyncio.get_running_loop()
+            loop.call_soon(pages.loop_ran.set)
+            return await consume(queryset)
+
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=pages)
+        result = asyncio.run(main())
+    return result, pages
+
+
+def test_records_are_async(server: TSC.Server) -> None:
+    async def consume(queryset):
+        return [record.name async for record in queryset.records()]
+
+    names, pages = consume_with_loop_running(server, consume)
+
+    assert names == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert pages.unblocked == [True] * 3
+
+
+@pytest.mark.parametrize(
+    "method, module, names",
+    [
+        ("to_columns", None, lambda columns: columns["name"]),
+        ("to_arrow", "pyarrow", lambda table: table.column("name").to_pylist()),
+        ("to_pandas", "pandas", lambda frame: list(frame["name"])),
+    ],
+)
+def test_columnar_exports_are_async(server: TSC.Server, method: str, module: Optional[str], names) -> None:
+    if module is not None:
+        pytest.importorskip(module)
+
+    async def consume(queryset):
+        return await getattr(queryset, method)(["name"])
+
+    result, pages = consume_with_loop_running(server, consume)
+
+    assert names(result) == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert pages.unblocked == [True] * 3
+
+
+def test_async_pager(server: TSC.Server) -> None:
+    async def main():
+        async with TSC.AsyncServer(server) as async_server:
+            return await async_server.pager(async_server.workbooks, TSC.RequestOptions(2, 1)).to_list()
+
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=GET_XML_PAGE2.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=GET_XML_PAGE3.read_text())
+        workbooks = asyncio.run(main())
+
+    assert [wb.name for wb in workbooks] == ["Page2Workbook", "Page3Workbook"]
+
+
+def test_concurrency_limit(server: TSC.Server) -> None:
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def slow_call(n: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.01)
+        with lock:
+            in_flight -= 1
+        return n
+
+    async def main():
+        async with TSC.AsyncServer(server, max_concurrency=3) as async_server:
+            return await asyncio.gather(*(async_server.run(slow_call, n) for n in range(20)))
+
+    assert asyncio.run(main()) == list(range(20))
+    assert peak <= 3
+
+
+def test_errors_propagate(server: TSC.Server) -> None:
+    async def main():
+        async with TSC.AsyncServer(server) as async_server:
+            await async_server.users.get_by_id("")
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
@@ -144,3 +144,88 @@ def test_revoke_all_server_admin_tokens(server: TSC.Server) -> None:
     assert "6b7179ba-b82b-4f0f-91ed-812074ac5da6" == server.site_id
     assert "Samples" == server.site_url
     assert "1a96d216-e9b8-497b-a82a-0b899a965e01" == server.user_id
+
+
+def _sign_in_and_expire(server: TSC.Server, m: requests_mock.Mocker) -> TSC.TableauAuth:
+    m.post(server.auth.baseurl + "/signin", text=SIGN_IN_XML.read_text())
+    tableau_auth = TSC.TableauAuth("testuser", "password", site_id="Samples")
+    server.auth.sign_in(tableau_auth)
+    # Simulate the session expiring on the server
+    server._auth_token = "expired"
+    return tableau_auth
+
+
+def _reject_expired(request, context):
+    if request.headers["x-tableau-auth"] == "expired":
+        context.status_code = 401
+        return SIGN_IN_ERROR_XML.read_text()
+    return (TEST_ASSET_DIR / "user_get.xml").read_text()
+
+
+def test_reauthenticate_on_expired_session(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        _sign_in_and_expire(server, m)
+        m.get(server.users.baseurl, text=_reject_expired)
+        users, _ = server.users.get()
+
+    assert len(users) == 2
+    assert server.auth_token == "eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l"
+    signins = [r for r in m.request_history if r.path.endswith("/signin")]
+    assert len(signins) == 2
+
+
+def test_reauthenticate_only_once(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        _sign_in_and_expire(server, m)
+        m.get(server.users.baseurl, text=SIGN_IN_ERROR_XML.read_text(), status_code=401)
+        with pytest.raises(TSC.FailedSignInError):
+            server.users.get()
+
+    assert len([r for r in m.request_history if r.path.endswith("/users")]) == 2
+
+
+def test_no_reauthenticate_without_credentials(server: TSC.Server) -> None:
+    server._set_auth("6b7179ba-b82b-4f0f-91ed-812074ac5da6", "1", "expired")
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=_reject_expired)
+        with pytest.raises(TSC.FailedSignInError):
+            server.users.get()
+
+    assert m.call_count == 1
+
+
+def test_reauthenticate_once_across_threads(server: TSC.Server) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    with requests_mock.mock() as m:
+        _sign_in_and_expire(server, m)
+        m.get(server.users.baseurl, text=_reject_expired)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(lambda _: server.users.get(), range(8)))
+
+    assert all(len(users) == 2 for users, _ in results)
+    signins = [r for r in m.request_history if r.path.endswith("/signin")]
+    assert len(signins) == 2
+
+
+def test_sign_out_forgets_credentials(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.post(server.auth.baseurl + "/signin", text=SIGN_IN_XML.read_text())
+        m.post(server.auth.baseurl + "/signout", text="")
+        server.auth.sign_in(TSC.TableauAuth("testuser", "password"))
+        assert server._credentials is not None
+        server.auth.sign_out()
+
+    assert server._credentials is None
+
+
+def test_switch_site_updates_credentials(server: TSC.Server) -> None:
+    server.version = "2.6"
+    with requests_mock.mock() as m:
+        tableau_auth = _sign_in_and_expire(server, m)
+        server._auth_token = "eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l"
+        m.post(server.auth.baseurl + "/switchSite", text=SIGN_IN_XML.read_text())
+        server.auth.switch_site(TSC.SiteItem("Other", "Other"))
+
+    assert server._credentials.site_id == "Other"
+    assert tableau_auth.site_id == "Samples"
@@ -0,0 +1,175 @@
+import datetime
+import xml.etree.ElementTree as ET
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.datetime_helpers import utc
+
+
+@pytest.fixture(scope="function")
+def server():
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    server.version = "3.19"
+
+    return server
+
+
+def workbooks_response(*workbooks: tuple[str, str]) -> str:
+    root = ET.Element("tsResponse", xmlns="http://tableau.com/api")
+    ET.SubElement(root, "pagination", pageNumber="1", pageSize="100", totalAvailable=str(len(workbooks)))
+    elements = ET.SubElement(root, "workbooks")
+    for workbook_id, updated_at in workbooks:
+        attributes = {"id": workbook_id, "name": workbook_id}
+        if updated_at:
+            attributes["updatedAt"] = updated_at
+        ET.SubElement(elements, "workbook", attrib=attributes)
+    return ET.tostring(root).decode("utf-8")
+
+
+def query(request) -> dict[str, str]:
+    return {k: v[0] for k, v in parse_qs(urlsplit(request.url).query).items()}
+
+
+def test_changed_since(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=workbooks_response(("a", "2024-01-02T00:00:00Z")))
+        since = datetime.datetime(2024, 1, 1, 8, 30)
+        workbooks = [wb for wb in server.workbooks.changed_since(since)]
+
+    assert [wb.id for wb in workbooks] == ["a"]
+    assert query(m.last_request)["filter"] == "updatedAt:gte:2024-01-01T08:30:00Z"
+
+
+def test_changed_since_converts_to_utc(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=workbooks_response())
+        since = datetime.datetime(2024, 1, 1, 10, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))
+        list(server.workbooks.changed_since(since))
+
+    assert query(m.last_request)["filter"] == "updatedAt:gte:2024-01-01T08:30:00Z"
+
+
+def test_feed_yields_only_new_changes(server: TSC.Server) -> None:
+    feed = TSC.ChangeFeed(server, [TSC.Resource.Workbook])
+    with requests_mock.mock() as m:
+        m.get(
+            server.workbooks.baseurl,
+            [
+                {"text": workbooks_response(("a", "2024-01-01T00:00:00Z"), ("b", "2024-01-02T00:00:00Z"))},
+                # The inclusive filter returns b again alongside the new change
+                {"text": workbooks_response(("b", "2024-01-02T00:00:00Z"), ("c", "2024-01-03T00:00:00Z"))},
+            ],
+        )
+        first = [item.id for _, item in feed.changes()]
+        assert "filter" not in query(m.last_request)
+        assert query(m.last_request)["sort"] == "updatedAt:asc"
+        second = [item.id for _, item in feed.changes()]
+        assert query(m.last_request)["filter"] == "updatedAt:gte:2024-01-02T00:00:00Z"
+
+    assert first == ["a", "b"]
+    assert second == ["c"]
+    assert feed.watermarks == {TSC.Resource.Workbook: datetime.datetime(2024, 1, 3, tzinfo=utc)}
+
+
+def test_feed_resumes_from_watermarks(server: TSC.Server) -> None:
+    watermark = datetime.datetime(2024, 1, 2, tzinfo=utc)
+    feed = TSC.ChangeFeed(server, [TSC.Resource.Workbook], watermarks={TSC.Resource.Workbook: watermark})
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=workbooks_response(("b", "2024-01-02T00:00:00Z")))
+        changes = list(feed.changes())
+
+    assert query(m.last_request)["filter"] == "updatedAt:gte:2024-01-02T00:00:00Z"
+    assert [item.id for _, item in changes] == ["b"]
+
+
+def test_watermark_advances_with_consumer(server: TSC.Server) -> None:
+    feed = TSC.ChangeFeed(server, [TSC.Resource.Workbook])
+    with requests_mock.mock() as m:
+        m.get(
+            server.workbooks.baseurl,
+            text=workbooks_response(("a", "2024-01-01T00:00:00Z"), ("b", "2024-01-02T00:00:00Z")),
+        )
+        changes = feed.changes()
+        next(changes)
+        # Asking for the next item acknowledges the previous one
+        next(changes)
+        changes.close()
+
+    assert feed.watermarks == {TSC.Resource.Workbook: datetime.datetime(2024, 1, 1, tzinfo=utc)}
+
+
+class Site:
+    """
+    Answers workbook listings sorted by updatedAt and filtered by an
+    updatedAt:gte filter, paged like the server. `updates` are applied after
+    the request with the same number.
+    """
+
+    def __init__(self, updated: dict[str, str], updates: dict[int, tuple[str, str]]) -> None:
+        self.updated = updated
+        self.updates = updates
+        self.requests = 0
+
+    def __call__(self, request, context) -> str:
+        parameters = query(request)
+        since = parameters.get("filter", "updatedAt:gte:").split(":gte:")[1]
+        listed = sorted((at, workbook_id) for workbook_id, at in self.updated.items() if at >= since)
+        size = int(parameters["pageSize"])
+        start = (int(parameters["pageNumber"]) - 1) * size
+        page = [(workbook_id, at) for at, workbook_id in listed[start : start + size]]
+        self.requests += 1
+        if self.requests in self.updates:
+            workbook_id, at = self.updates[self.requests]
+            self.updated[workbook_id] = at
+        return workbooks_response(*page)
+
+
+def test_item_updated_while_paging_is_not_skipped(server: TSC.Server) -> None:
+    updated = {workbook_id: f"2024-01-0{day}T00:00:00Z" for day, workbook_id in enumerate("abcde", start=1)}
+    # a is updated once the first page has been read, and moves to the end of the order
+    site = Site(updated, {1: ("a", "2024-01-10T00:00:00Z")})
+    feed = TSC.ChangeFeed(server, [TSC.Resource.Workbook])
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=site)
+        changes = [item.id for _, item in feed.changes(page_size=2)]
+
+    assert changes == ["a", "b", "c", "d", "e", "a"]
+    assert feed.watermarks == {TSC.Resource.Workbook: datetime.datetime(2024, 1, 10, tzinfo=utc)}
+
+
+def test_more_items_than_a_page_at_one_time(server: TSC.Server) -> None:
+    site = Site({workbook_id: "2024-01-01T00:00:00Z" for workbook_id in "abcde"}, {})
+    feed = TSC.ChangeFeed(server, [TSC.Resource.Workbook])
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=site)
+        changes = [item.id for _, item in feed.changes(page_size=2)]
+
+    assert changes == ["a", "b", "c", "d", "e"]
+
+
+def test_deletions(server: TSC.Server) -> None:
+    feed = TSC.ChangeFeed(server, [TSC.Resource.Workbook])
+    with requests_mock.mock() as m:
+        m.get(
+            server.workbooks.baseurl,
+            [
+                {"text": workbooks_response(("a", ""), ("b", ""), ("c", ""))},
+                {"text": workbooks_response(("b", ""), ("d", ""))},
+            ],
+        )
+        assert list(feed.deletions()) == []
+        assert query(m.last_request)["fields"] == "id"
+        assert list(feed.deletions()) == [(TSC.Resource.Workbook, "a"), (TSC.Resource.Workbook, "c")]
+
+
+def test_unsupported_resource(server: TSC.Server) -> None:
+    with pytest.raises(ValueError):
+        TSC.ChangeFeed(server, [TSC.Resource.Database])
@@ -0,0 +1,188 @@
+import os
+import threading
+import time
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.config import BYTES_PER_MB, config
+from tableauserverclient.server.chunk_sizing import AdaptiveChunkSize, ChunkProgress
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+FILEUPLOAD_INITIALIZE = TEST_ASSET_DIR / "fileupload_initialize.xml"
+FILEUPLOAD_APPEND = TEST_ASSET_DIR / "fileupload_append.xml"
+UPLOAD_ID = "7720:170fe6b1c1c7422dadff20f944d58a52-1:0"
+
+
+def test_grows_on_fast_links() -> None:
+    sizer = AdaptiveChunkSize(min_mb=1, max_mb=64, target_seconds=5, initial_mb=8)
+    assert sizer.initial_size == 8 * BYTES_PER_MB
+    # 8MB in 0.1s could send 400MB in 5s, but the size at most doubles
+    assert sizer.next_size(8 * BYTES_PER_MB, 8 * BYTES_PER_MB, 0.1) == 16 * BYTES_PER_MB
+    assert sizer.next_size(48 * BYTES_PER_MB, 48 * BYTES_PER_MB, 0.1) == 64 * BYTES_PER_MB
+
+
+def test_shrinks_on_slow_links() -> None:
+    sizer = AdaptiveChunkSize(min_mb=2, max_mb=64, target_seconds=5)
+    # 8MB in 60s is 0.7MB in 5s, but the size at most halves
+    assert sizer.next_size(8 * BYTES_PER_MB, 8 * BYTES_PER_MB, 60) == 4 * BYTES_PER_MB
+    assert sizer.next_size(3 * BYTES_PER_MB, 3 * BYTES_PER_MB, 60) == 2 * BYTES_PER_MB
+
+
+def test_settles_on_target() -> None:
+    sizer = AdaptiveChunkSize(min_mb=1, max_mb=64, target_seconds=5)
+    # 10MB/s sends 50MB in 5s, which is whole MB already
+    assert sizer.next_size(40 * BYTES_PER_MB, 40 * BYTES_PER_MB, 4) == 50 * BYTES_PER_MB
+    # A short last chunk is measured by the bytes it had
+    assert sizer.next_size(40 * BYTES_PER_MB, 10 * BYTES_PER_MB, 1) == 50 * BYTES_PER_MB
+
+
+def test_bounds_are_checked() -> None:
+    with pytest.raises(ValueError):
+        AdaptiveChunkSize(min_mb=10, max_mb=5)
+    with pytest.raises(ValueError):
+        AdaptiveChunkSize(target_seconds=0)
+    assert AdaptiveChunkSize(min_mb=1, max_mb=4, initial_mb=50).initial_size == 4 * BYTES_PER_MB
+
+
+def test_never_larger_than_a_request_can_be(monkeypatch) -> None:
+    sizer = AdaptiveChunkSize(min_mb=1, max_mb=128, initial_mb=128)
+    assert sizer.max_size == sizer.initial_size == 64 * BYTES_PER_MB
+    assert sizer.next_size(64 * BYTES_PER_MB, 64 * BYTES_PER_MB, 0.1) == 64 * BYTES_PER_MB
+
+    monkeypatch.setenv("TSC_FILESIZE_LIMIT_MB", "8")
+    sizer = AdaptiveChunkSize(min_mb=16)
+    assert sizer.min_size == sizer.max_size == 8 * BYTES_PER_MB
+    size = AdaptiveChunkSize(min_mb=1).initial_size
+    for _ in range(10):
+        size = sizer.next_size(size, size, 0)
+        assert size <= 8 * BYTES_PER_MB
+
+
+def test_adaptive_from_environment(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.setenv("TSC_CHUNK_SIZE_ADAPTIVE", "true")
+    monkeypatch.setenv("TSC_CHUNK_SIZE_MB", "1")
+    monkeypatch.setenv("TSC_CHUNK_SIZE_MAX_MB", "2")
+    file_path = tmp_path / "big.hyper"
+    file_path.write_bytes(b"1" * 7 * BYTES_PER_MB)
+
+    reported: list[ChunkProgress] = []
+    server = TSC.Server("http://test", False, upload_progress=reported.append)
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    with requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=FILEUPLOAD_APPEND.read_text())
+        server.fileuploads.upload(str(file_path))
+
+    # The mock answers at once, so chunks grow to the 2MB maximum. The second chunk was read before the first was sent.
+    assert [progress.size for progress in reported] == [
+        BYTES_PER_MB,
+        BYTES_PER_MB,
+        2 * BYTES_PER_MB,
+        2 * BYTES_PER_MB,
+        BYTES_PER_MB,
+    ]
+    assert [progress.number for progress in reported] == list(range(5))
+    assert reported[-1].uploaded == 7 * BYTES_PER_MB
+    assert all(progress.upload_id == UPLOAD_ID and progress.elapsed > 0 for progress in reported)
+
+
+class StubServer(ThreadingHTTPServer):
+    """
+    A local server for chunked uploads that receives bodies at a fixed
+    bandwidth, after a fixed latency. Like Tableau Server, it rejects chunks
+    larger than TSC_FILESIZE_LIMIT_MB.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, bandwidth: float, latency: float) -> None:
+        self.bandwidth = bandwidth
+        self.latency = latency
+        self.chunks: list[int] = []
+        super().__init__(("127.0.0.1", 0), StubHandler)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server: StubServer
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def reply(self, body: bytes) -> None:
+        length = int(self.headers["Content-Length"])
+        time.sleep(self.server.latency)
+        while length:
+            block = self.rfile.read(min(length, 256 * 1024))
+            length -= len(block)
+            time.sleep(len(block) / self.server.bandwidth)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self) -> None:
+        self.reply(FILEUPLOAD_INITIALIZE.read_bytes())
+
+    def do_PUT(self) -> None:
+        length = int(self.headers["Content-Length"])
+        # Room for the multipart headers around the chunk
+        if length > config.FILESIZE_LIMIT_MB * BYTES_PER_MB + 1024:
+            self.send_error(413)
+            return
+        self.server.chunks.append(length)
+        self.reply(FILEUPLOAD_APPEND.read_bytes())
+
+
+def upload(tmp_path: Path, bandwidth: float, latency: float, size_mb: int, chunk_size) -> tuple[float, list[int]]:
+    file_path = tmp_path / "big.hyper"
+    file_path.write_bytes(os.urandom(size_mb * BYTES_PER_MB))
+    stub = StubServer(bandwidth, latency)
+    threading.Thread(target=stub.serve_forever, args=(0.01,), daemon=True).start()
+    try:
+        server = TSC.Server(f"http://127.0.0.1:{stub.server_port}", False)
+        server.version = "3.19"
+        server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+        started = time.perf_counter()
+        server.fileuploads.upload(str(file_path), chunk_size=chunk_size)
+        return time.perf_counter() - started, [size // BYTES_PER_MB for size in stub.chunks]
+    finally:
+        stub.shutdown()
+        stub.server_close()
+
+
+@pytest.fixture
+def fixed_1mb_chunks(monkeypatch) -> Iterator[None]:
+    monkeypatch.setenv("TSC_CHUNK_SIZE_MB", "1")
+    yield
+
+
+@pytest.mark.benchmark
+def test_benchmark_fast_link(tmp_path: Path, fixed_1mb_chunks, monkeypatch) -> None:
+    # Bandwidth is plentiful and every request waits 50ms, so small chunks waste time on round trips. The server
+    # takes at most 4MB a request, scaled down from 64MB like the file.
+    monkeypatch.setenv("TSC_FILESIZE_LIMIT_MB", "4")
+    fixed_seconds, fixed_chunks = upload(tmp_path, 1000 * BYTES_PER_MB, 0.05, 16, None)
+    adaptive = AdaptiveChunkSize(min_mb=1, max_mb=16, target_seconds=0.25, initial_mb=1)
+    adaptive_seconds, adaptive_chunks = upload(tmp_path, 1000 * BYTES_PER_MB, 0.05, 16, adaptive)
+
+    assert len(fixed_chunks) == 16
+    assert len(adaptive_chunks) < 8
+    assert max(adaptive_chunks) <= 4
+    assert adaptive_seconds < fixed_seconds
+
+
+@pytest.mark.benchmark
+def test_benchmark_slow_link(tmp_path: Path) -> None:
+    # At 40MB/s a 4MB chunk takes 0.1s, twice the target, so chunks shrink and a failure would resend less
+    adaptive = AdaptiveChunkSize(min_mb=1, max_mb=16, target_seconds=0.05, initial_mb=4)
+    _, chunks = upload(tmp_path, 40 * BYTES_PER_MB, 0, 16, adaptive)
+
+    assert chunks[:2] == [4, 4]
+    assert max(chunks[2:]) <= 2
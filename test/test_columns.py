@@ -0,0 +1,130 @@
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.datetime_helpers import utc
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+GET_XML_PAGE1 = TEST_ASSET_DIR / "workbook_get_page_1.xml"
+GET_XML_PAGE2 = TEST_ASSET_DIR / "workbook_get_page_2.xml"
+GET_XML_PAGE3 = TEST_ASSET_DIR / "workbook_get_page_3.xml"
+
+FIELDS = ["name", "size", "created_at", "tags"]
+
+
+@pytest.fixture(scope="function")
+def server():
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    server.version = "3.19"
+
+    return server
+
+
+@pytest.fixture
+def workbook_pages(server: TSC.Server):
+    with requests_mock.mock() as m:
+        for page, asset in enumerate((GET_XML_PAGE1, GET_XML_PAGE2, GET_XML_PAGE3), start=1):
+            m.get(f"{server.workbooks.baseurl}?pageNumber={page}&pageSize=1", text=asset.read_text())
+        yield m
+
+
+def test_to_columns(server: TSC.Server, workbook_pages) -> None:
+    columns = server.workbooks.all().paginate(page_size=1).to_columns(FIELDS, numpy=False)
+
+    assert list(columns) == FIELDS
+    assert columns["name"] == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert columns["size"] == [1, 26, 26]
+    assert columns["created_at"][0] == datetime.datetime(2016, 8, 3, 20, 34, 4, tzinfo=utc)
+    assert workbook_pages.call_count == 3
+
+
+def test_to_columns_without_numpy(server: TSC.Server, workbook_pages, monkeypatch) -> None:
+    monkeypatch.setitem(sys.modules, "numpy", None)
+
+    columns = server.workbooks.all().paginate(page_size=1).to_columns(FIELDS)
+    assert isinstance(columns["created_at"], list)
+
+    with pytest.raises(ImportError, match="numpy"):
+        server.workbooks.all().paginate(page_size=1).to_columns(FIELDS, numpy=True)
+
+
+def test_to_columns_rejects_string_fields(server: TSC.Server) -> None:
+    with pytest.raises(TypeError):
+        server.workbooks.all().to_columns("name")
+
+
+def test_to_columns_datetime64(server: TSC.Server, workbook_pages) -> None:
+    np = pytest.importorskip("numpy")
+
+    columns = server.workbooks.all().paginate(page_size=1).to_columns(["name", "created_at"], numpy=True)
+
+    assert columns["created_at"].dtype == np.dtype("datetime64[s]")
+    assert columns["created_at"][0] == np.datetime64("2016-08-03T20:34:04")
+    assert isinstance(columns["name"], list)
+
+
+def test_to_arrow(server: TSC.Server, workbook_pages) -> None:
+    pytest.importorskip("pyarrow")
+
+    table = server.workbooks.all().paginate(page_size=1).to_arrow(FIELDS)
+
+    assert table.column_names == FIELDS
+    assert table.num_rows == 3
+    assert table.column("size").to_pylist() == [1, 26, 26]
+
+
+def test_to_pandas(server: TSC.Server, workbook_pages) -> None:
+    pytest.importorskip("pandas")
+
+    frame = server.workbooks.all().paginate(page_size=1).to_pandas(FIELDS)
+
+    assert list(frame.columns) == FIELDS
+    assert frame["name"].tolist() == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert str(frame["created_at"].dtype).startswith("datetime64")
+
+
+def test_workbooks_are_read_without_building_items(server: TSC.Server, workbook_pages, monkeypatch) -> None:
+    built = []
+    monkeypatch.setattr(TSC.WorkbookItem, "from_xml", lambda *args, **kwargs: built.append(args))
+
+    columns = server.workbooks.all().paginate(page_size=1).to_columns(FIELDS, numpy=False)
+
+    assert not built
+    assert columns["name"] == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+
+
+@pytest.mark.parametrize("numpy", [False, True])
+def test_columns_match_items(server: TSC.Server, numpy: bool) -> None:
+    if numpy:
+        pytest.importorskip("numpy")
+    fields = ["id", "name", "size", "created_at", "updated_at", "has_extracts", "owner_id", "project_name", "tags"]
+    with requests_mock.mock() as m:
+        m.get(server.datasources.baseurl, text=(TEST_ASSET_DIR / "datasource_get.xml").read_text())
+        columns = server.datasources.all().to_columns(fields, numpy=numpy)
+        datasources = list(server.datasources.all())
+
+    for field in fields:
+        expected = [getattr(datasource, field) for datasource in datasources]
+        if numpy and field.endswith("_at"):
+            expected = [value.replace(tzinfo=None) for value in expected]
+        assert list(columns[field]) == expected, field
+
+
+def test_users_are_read_from_items(server: TSC.Server) -> None:
+    np = pytest.importorskip("numpy")
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=(TEST_ASSET_DIR / "user_get.xml").read_text())
+        columns = server.users.all().to_columns(["name", "last_login"])
+
+    assert columns["name"] == ["alice", "Bob"]
+    assert columns["last_login"][0] == np.datetime64("2016-08-16T23:17:06")
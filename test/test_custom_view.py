@@ -10,6 +10,7 @@ import requests_mock
 import tableauserverclient as TSC
 from tableauserverclient.config import BYTES_PER_MB
 from tableauserverclient.datetime_helpers import format_datetime
+from tableauserverclient.helpers.parsing import fromstring
 
 TEST_ASSET_DIR = Path(__file__).parent / "assets"
 
@@ -47,6 +48,7 @@ def test_get(server: TSC.Server) -> None:
     assert "d79634e1-6063-4ec9-95ff-50acbf609ff5" == all_views[0].id
     assert "ENDANGERED SAFARI" == all_views[0].name
     assert "SafariSample/sheets/ENDANGEREDSAFARI" == all_views[0].content_url
+    assert all_views[0].workbook is not None and all_views[0].owner is not None  # for mypy
     assert "3cc6cd06-89ce-4fdc-b935-5294135d6d42" == all_views[0].workbook.id
     assert "5de011f8-5aa9-4d5b-b991-f462c8dd6bb7" == all_views[0].owner.id
     assert all_views[0].created_at is None
@@ -55,6 +57,7 @@ def test_get(server: TSC.Server) -> None:
 
     assert "fd252f73-593c-4c4e-8584-c032b8022adc" == all_views[1].id
     assert "Overview" == all_views[1].name
+    assert all_views[1].workbook is not None and all_views[1].owner is not None  # for mypy
     assert "6d13b0ca-043d-4d42-8c9d-3f3313ea3a00" == all_views[1].workbook.id
     assert "5de011f8-5aa9-4d5b-b991-f462c8dd6bb7" == all_views[1].owner.id
     assert "2002-05-30T09:00:00Z" == format_datetime(all_views[1].created_at)
@@ -62,12 +65,39 @@ def test_get(server: TSC.Server) -> None:
     assert all_views[1].shared
 
 
+def test_nested_items_match_response_parsers(monkeypatch) -> None:
+    ns = {"t": "http://tableau.com/api"}
+    response_xml = b"""<tsResponse xmlns="http://tableau.com/api"><customView id="cv" name="Overview" shared="true">
+        <view id="v" name="Map" contentUrl="Superstore/sheets/Map" createdAt="2016-08-03T20:34:04Z">
+            <tags><tag label="sales"/></tags>
+        </view>
+        <workbook id="wb" name="Superstore" contentUrl="Superstore" showTabs="true" size="2"/>
+        <owner id="u" name="alice" siteRole="Creator" lastLogin="2016-08-03T20:34:04Z"/>
+    </customView></tsResponse>"""
+    # Workbooks without a project get a random placeholder project ID
+    monkeypatch.setattr("uuid.uuid4", lambda: "placeholder")
+
+    (custom_view,) = TSC.CustomViewItem.list_from_response(response_xml, ns)
+
+    subtree = fromstring(response_xml).find("t:customView", ns)
+    assert subtree is not None and custom_view.view is not None and custom_view.workbook is not None
+    assert vars(custom_view.owner) == vars(TSC.UserItem.from_response_as_owner(subtree, ns)[0])
+    workbooks = [custom_view.workbook, TSC.WorkbookItem.from_response(subtree, ns)[0]]
+    for workbook in workbooks:
+        # With TSC_LAZY_DECODING, vars() only holds the fields read so far
+        workbook._decode_all()
+    assert vars(workbooks[0]) == vars(workbooks[1])
+    assert vars(custom_view.view) == vars(TSC.ViewItem.from_response(subtree, ns)[0])
+    assert custom_view.view.tags == {"sales"}
+
+
 def test_get_by_id(server: TSC.Server) -> None:
     response_xml = GET_XML_ID.read_text()
     with requests_mock.mock() as m:
         m.get(server.custom_views.baseurl + "/d79634e1-6063-4ec9-95ff-50acbf609ff5", text=response_xml)
-        view: TSC.CustomViewItem = server.custom_views.get_by_id("d79634e1-6063-4ec9-95ff-50acbf609ff5")
+        view = server.custom_views.get_by_id("d79634e1-6063-4ec9-95ff-50acbf609ff5")
 
+    assert view is not None  # for mypy
     assert "d79634e1-6063-4ec9-95ff-50acbf609ff5" == view.id
     assert "ENDANGERED SAFARI" == view.name
     assert "SafariSample/sheets/ENDANGEREDSAFARI" == view.content_url
@@ -83,7 +113,7 @@ def test_get_by_id(server: TSC.Server) -> None:
 
 def test_get_by_id_missing_id(server: TSC.Server) -> None:
     with pytest.raises(TSC.MissingRequiredFieldError):
-        server.custom_views.get_by_id(None)
+        server.custom_views.get_by_id(None)  # type: ignore[arg-type]
 
 
 def test_get_before_signin(server: TSC.Server) -> None:
@@ -143,13 +173,13 @@ def test_update(server: TSC.Server) -> None:
         the_custom_view.owner = TSC.UserItem()
         assert the_custom_view.owner is not None  # for mypy
         the_custom_view.owner.id = "dd2239f6-ddf1-4107-981a-4cf94e415794"
-        the_custom_view = server.custom_views.update(the_custom_view)
+        updated_view = server.custom_views.update(the_custom_view)
 
-    assert isinstance(the_custom_view, TSC.CustomViewItem)
-    assert "1f951daf-4061-451a-9df1-69a8062664f2" == the_custom_view.id
-    if the_custom_view.owner:
-        assert "dd2239f6-ddf1-4107-981a-4cf94e415794" == the_custom_view.owner.id
-    assert "Best test ever" == the_custom_view.name
+    assert isinstance(updated_view, TSC.CustomViewItem)
+    assert "1f951daf-4061-451a-9df1-69a8062664f2" == updated_view.id
+    if updated_view.owner:
+        assert "dd2239f6-ddf1-4107-981a-4cf94e415794" == updated_view.owner.id
+    assert "Best test ever" == updated_view.name
 
 
 def test_update_missing_id(server: TSC.Server) -> None:
@@ -887,8 +887,9 @@ def test_publish_description(server: TSC.Server) -> None:
         _ = server.datasources.publish(single_datasource, TEST_ASSET_DIR / "SampleDS.tds", server.PublishMode.CreateNew)
 
         history = m.request_history[0]
-    boundary = history.body[: history.body.index(b"\r\n")].strip()
-    parts = history.body.split(boundary)
+    request_body = bytes(history.body)
+    boundary = request_body[: request_body.index(b"\r\n")].strip()
+    parts = request_body.split(boundary)
     request_payload = next(part for part in parts if b"request_payload" in part)
     xml_payload = request_payload.strip().split(b"\r\n")[-1]
     body = fromstring(xml_payload)
@@ -3,6 +3,7 @@ import pytest
 import requests
 
 import tableauserverclient as TSC
+from tableauserverclient.helpers.logging import TRACE
 from tableauserverclient.server.endpoint import Endpoint
 
 import requests_mock
@@ -60,6 +61,18 @@ def test_get_request_stream(server: TSC.Server) -> None:
         assert response._content_consumed is False
 
 
+def test_binary_body_not_logged(server: TSC.Server, caplog) -> None:
+    url = "http://test/"
+    caplog.set_level(TRACE, logger="TSC")
+    endpoint = Endpoint(server)
+    with requests_mock.mock() as m:
+        m.get(url, content=b"\x1337" * 1000, headers={"Content-Type": "application/octet-stream"})
+        endpoint.get_request(url)
+
+    assert "\x13" not in caplog.text
+    assert not [record for record in caplog.records if record.levelno == TRACE]
+
+
 def test_binary_log_truncated(server: TSC.Server) -> None:
     class FakeResponse:
         headers = {"Content-Type": "application/octet-stream"}
@@ -68,10 +81,24 @@ def test_binary_log_truncated(server: TSC.Server) -> None:
 
     endpoint = Endpoint(server)
     server_response = FakeResponse()
-    log = endpoint.log_response_safely(server_response)  # type: ignore
+    with pytest.warns(DeprecationWarning):
+        log = endpoint.log_response_safely(server_response)  # type: ignore
     assert log.find("[Truncated File Contents]") > 0
 
 
+def test_log_response_safely_redacts(server: TSC.Server) -> None:
+    class FakeResponse:
+        headers = {"Content-Type": "application/xml"}
+        content = b'<tsResponse><credentials token="eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l"/></tsResponse>'
+        encoding = "utf-8"
+        status_code = 200
+
+    endpoint = Endpoint(server)
+    with pytest.warns(DeprecationWarning):
+        log = endpoint.log_response_safely(FakeResponse())  # type: ignore
+    assert log == '<tsResponse><credentials token="[redacted]"/></tsResponse>'
+
+
 def test_set_user_agent_from_options_headers(server: TSC.Server) -> None:
     params = {"User-Agent": "1", "headers": {"User-Agent": "2"}}
     result = Endpoint.set_user_agent(params)
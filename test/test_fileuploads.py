@@ -1,13 +1,19 @@
 import contextlib
 import io
 import os
+import threading
 from pathlib import Path
 
 import pytest
 import requests_mock
+from urllib3.fields import RequestField
+from urllib3.filepost import encode_multipart_formdata
 
 import tableauserverclient as TSC
 from tableauserverclient.config import BYTES_PER_MB, config
+from tableauserverclient.models import FileuploadItem
+from tableauserverclient.server.endpoint.fileuploads_endpoint import _read_ahead
+from tableauserverclient.server.multipart import MultipartBody
 
 TEST_ASSET_DIR = Path(__file__).parent / "assets"
 FILEUPLOAD_INITIALIZE = TEST_ASSET_DIR / "fileupload_initialize.xml"
@@ -90,3 +96,82 @@ def test_upload_chunks_config(server: TSC.Server) -> None:
         assert len(chunk) == config.CHUNK_SIZE_MB * BYTES_PER_MB
         data.seek(0)
         assert len(chunk) < len(data.read())
+
+
+def test_multipart_body_matches_urllib3() -> None:
+    chunk = b"\x00chunk\xff"
+    body = MultipartBody(
+        {
+            "request_payload": ("", "<tsRequest/>", "text/xml"),
+            "tableau_file": ("file", memoryview(chunk), "application/octet-stream"),
+        },
+        boundary="boundary",
+    )
+
+    payload = RequestField(name="request_payload", data="<tsRequest/>", filename="")
+    payload.make_multipart(content_type="text/xml")
+    file = RequestField(name="tableau_file", data=chunk, filename="file")
+    file.make_multipart(content_type="application/octet-stream")
+    fields = [payload, file]
+    expected, _ = encode_multipart_formdata(fields, boundary="boundary")
+
+    assert bytes(body) == b"".join(body) == expected
+    assert len(body) == len(expected)
+    assert body.content_type == "multipart/mixed; boundary=boundary"
+
+
+def test_upload_streams_chunks(server: TSC.Server, tmp_path: Path) -> None:
+    upload_id = "7720:170fe6b1c1c7422dadff20f944d58a52-1:0"
+    data = os.urandom(BYTES_PER_MB * 5 // 2)
+    file_path = tmp_path / "big.hyper"
+    file_path.write_bytes(data)
+
+    sent = []
+
+    def append(request, context):
+        body = request.body
+        assert isinstance(body, MultipartBody)
+        assert request.headers["Content-Length"] == str(len(body))
+        sent.append(bytes(body))
+        return FILEUPLOAD_APPEND.read_text()
+
+    with set_env(TSC_CHUNK_SIZE_MB="1"), requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{upload_id}", text=append)
+        assert server.fileuploads.upload(str(file_path)) == upload_id
+
+    assert len(sent) == 3
+    # Each body was copied when it was sent, so reusing the read buffers did not change it
+    chunks = [body.split(b"\r\n\r\n")[2].rsplit(b"\r\n--", 1)[0] for body in sent]
+    assert b"".join(chunks) == data
+
+
+def test_next_chunk_is_read_while_sending(server: TSC.Server) -> None:
+    second_read = threading.Event()
+
+    class SlowFile(io.BytesIO):
+        reads = 0
+
+        def readinto(self, buffer):
+            self.reads += 1
+            if self.reads == 2:
+                second_read.set()
+            return super().readinto(buffer)
+
+    def append(upload_id, request, content_type):
+        # The first chunk is still being sent when the second is read
+        assert second_read.wait(5)
+        return FileuploadItem.from_response(FILEUPLOAD_APPEND.read_bytes(), server.namespace)
+
+    with set_env(TSC_CHUNK_SIZE_MB="1"):
+        server.fileuploads.initiate = lambda: "upload"  # type: ignore[method-assign]
+        server.fileuploads.append = append  # type: ignore[method-assign]
+        assert server.fileuploads.upload(SlowFile(b"1" * (BYTES_PER_MB + 1))) == "upload"
+
+
+def test_read_ahead_matches_read_chunks(server: TSC.Server) -> None:
+    data = os.urandom(BYTES_PER_MB * 3 + 17)
+    with set_env(TSC_CHUNK_SIZE_MB="1"):
+        expected = list(server.fileuploads._read_chunks(io.BytesIO(data)))
+    actual = [bytes(chunk) for chunk in _read_ahead(io.BytesIO(data), lambda: BYTES_PER_MB)]
+    assert actual == expected
@@ -0,0 +1,115 @@
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.endpoint import GET_MANY_MAX_URL_LENGTH
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+USER_GET_BY_ID_XML = TEST_ASSET_DIR / "user_get_by_id.xml"
+
+
+@pytest.fixture(scope="function")
+def server():
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    server.version = "3.19"
+
+    return server
+
+
+def workbooks_response(*workbook_ids: str) -> str:
+    root = ET.Element("tsResponse", xmlns="http://tableau.com/api")
+    ET.SubElement(root, "pagination", pageNumber="1", pageSize="100", totalAvailable=str(len(workbook_ids)))
+    elements = ET.SubElement(root, "workbooks")
+    for workbook_id in workbook_ids:
+        workbook = ET.SubElement(elements, "workbook", id=workbook_id, name=workbook_id)
+        ET.SubElement(workbook, "project", id="p1", name="default")
+        ET.SubElement(workbook, "owner", id="o1")
+    return ET.tostring(root, encoding="unicode")
+
+
+def requested_ids(request) -> list[str]:
+    query = parse_qs(urlsplit(request.url).query)
+    (filter_expression,) = query["filter"]
+    assert filter_expression.startswith("id:in:[") and filter_expression.endswith("]")
+    return filter_expression[len("id:in:[") : -1].split(",")
+
+
+def echo_workbooks(exclude=()):
+    def callback(request, context):
+        return workbooks_response(*(i for i in requested_ids(request) if i not in exclude))
+
+    return callback
+
+
+def test_get_many(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=echo_workbooks(exclude={"gone"}))
+        workbooks = server.workbooks.get_many(["a", "b", "gone", "a"])
+
+    assert m.call_count == 1
+    assert requested_ids(m.request_history[0]) == ["a", "b", "gone"]
+    assert sorted(workbooks) == ["a", "b"]
+    assert workbooks["a"].name == "a"
+    assert workbooks.missing == ["gone"]
+
+
+def test_get_many_empty(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        assert server.workbooks.get_many([]) == {}
+    assert m.call_count == 0
+
+
+def test_get_many_chunks_long_urls(server: TSC.Server) -> None:
+    ids = [f"{i:08d}-89ce-4fdc-b935-5294135d6d42" for i in range(200)]
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=echo_workbooks())
+        workbooks = server.workbooks.get_many(ids)
+
+    assert m.call_count > 1
+    assert all(len(request.url) <= GET_MANY_MAX_URL_LENGTH for request in m.request_history)
+    assert sorted(i for request in m.request_history for i in requested_ids(request)) == ids
+    assert sorted(workbooks) == ids
+    assert workbooks.missing == []
+
+
+def test_get_many_falls_back_to_get_by_id(server: TSC.Server) -> None:
+    error = (
+        '<tsResponse xmlns="http://tableau.com/api">'
+        '<error code="400065"><summary>Bad Request</summary><detail>Invalid filter</detail></error>'
+        "</tsResponse>"
+    )
+    user_id = "dd2239f6-ddf1-4107-981a-4cf94e415794"
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, status_code=400, text=error, complete_qs=False)
+        m.get(f"{server.users.baseurl}/{user_id}", text=USER_GET_BY_ID_XML.read_text())
+        m.get(
+            f"{server.users.baseurl}/missing",
+            status_code=404,
+            text=error.replace("400065", "404002"),
+        )
+        users = server.users.get_many([user_id, "missing"])
+
+    assert list(users) == [user_id]
+    assert users[user_id].name == "alice"
+    assert users.missing == ["missing"]
+
+
+def test_get_many_raises_other_errors(server: TSC.Server) -> None:
+    error = (
+        '<tsResponse xmlns="http://tableau.com/api">'
+        '<error code="403004"><summary>Forbidden</summary><detail>Nope</detail></error>'
+        "</tsResponse>"
+    )
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, status_code=403, text=error)
+        with pytest.raises(TSC.ServerResponseError):
+            server.workbooks.get_many(["a"])
@@ -0,0 +1,164 @@
+import json
+import re
+import uuid
+from pathlib import Path
+from xml.etree.ElementTree import Element
+
+import pytest
+import requests_mock
+from defusedxml.ElementTree import fromstring
+
+import tableauserverclient as TSC
+from tableauserverclient.models import BackgroundJobItem
+from tableauserverclient.models.lazy import LazyDecoding
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+NS = {"t": "http://tableau.com/api"}
+
+
+@pytest.fixture(scope="function")
+def server():
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False, response_format="json")
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    server.version = "3.19"
+
+    return server
+
+
+def local_name(element: Element) -> str:
+    return element.tag.rsplit("}", 1)[-1]
+
+
+def json_value(value: str):
+    # The server sends some values as JSON booleans and numbers
+    if value in ("true", "false"):
+        return value == "true"
+    if re.fullmatch(r"[1-9][0-9]*", value):
+        return int(value)
+    return value
+
+
+def to_json(element: Element):
+    """Renders an element the way the REST API does in JSON mode."""
+    if not element.attrib and len(element) == 0 and element.text and element.text.strip():
+        return element.text
+    document = {key: json_value(value) for key, value in element.attrib.items()}
+    for child in element:
+        name = local_name(child)
+        value = to_json(child)
+        if local_name(element) == f"{name}s" or name in document:
+            # Collections are lists, even with a single entry
+            existing = document.setdefault(name, [])
+            if not isinstance(existing, list):
+                document[name] = existing = [existing]
+            existing.append(value)
+        else:
+            document[name] = value
+    return document
+
+
+def json_body(asset: str) -> str:
+    return json.dumps(to_json(fromstring((TEST_ASSET_DIR / asset).read_bytes())))
+
+
+def comparable(value):
+    """Nested items have no equality, compare their attributes instead."""
+    if isinstance(value, (list, tuple)):
+        return [comparable(v) for v in value]
+    if isinstance(value, LazyDecoding):
+        # With TSC_LAZY_DECODING, vars() only holds the fields read so far
+        value._decode_all()
+    if hasattr(value, "__dict__") and not callable(value):
+        return {k: comparable(v) for k, v in vars(value).items()}
+    return value
+
+
+@pytest.mark.parametrize(
+    "model, asset",
+    [
+        (TSC.UserItem, "user_get.xml"),
+        (TSC.GroupItem, "group_get.xml"),
+        (TSC.WorkbookItem, "workbook_get.xml"),
+        (TSC.WorkbookItem, "workbook_get_all_fields.xml"),
+        (TSC.ViewItem, "view_get.xml"),
+        (TSC.DatasourceItem, "datasource_get.xml"),
+        (TSC.DatasourceItem, "datasource_get_all_fields.xml"),
+        (TSC.ProjectItem, "project_get.xml"),
+        (BackgroundJobItem, "job_get.xml"),
+    ],
+)
+def test_from_json_matches_xml(model, asset: str, monkeypatch) -> None:
+    # Workbooks without a project get a random placeholder project ID
+    placeholder = uuid.uuid4()
+    monkeypatch.setattr(uuid, "uuid4", lambda: placeholder)
+    from_xml = model.from_response((TEST_ASSET_DIR / asset).read_bytes(), NS)
+    from_json = model.from_json(json_body(asset))
+
+    assert len(from_json) == len(from_xml) > 0
+    assert comparable(from_json) == comparable(from_xml)
+
+
+def test_pagination_from_json() -> None:
+    pagination = TSC.PaginationItem.from_json(json_body("workbook_get.xml"))
+
+    assert (pagination.page_number, pagination.page_size, pagination.total_available) == (1, 100, 2)
+
+
+def test_get_negotiates_json(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=json_body("user_get.xml"), headers={"Content-Type": "application/json"})
+        users, pagination = server.users.get()
+
+    assert m.last_request.headers["Accept"] == "application/json"
+    assert pagination.total_available == 2
+    expected = TSC.UserItem.from_response((TEST_ASSET_DIR / "user_get.xml").read_bytes(), NS)
+    assert comparable(users) == comparable(expected)
+
+
+def test_get_falls_back_to_xml(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=(TEST_ASSET_DIR / "workbook_get.xml").read_text())
+        workbooks, pagination = server.workbooks.get()
+
+    assert [workbook.name for workbook in workbooks] == ["Superstore", "SafariSample"]
+    assert pagination.total_available == 2
+
+
+def test_xml_only_endpoints_do_not_ask_for_json(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.schedules.baseurl, text=(TEST_ASSET_DIR / "schedule_get.xml").read_text())
+        server.schedules.get()
+
+    assert m.last_request.headers.get("Accept") != "application/json"
+
+
+def test_xml_mode_does_not_ask_for_json() -> None:
+    server = TSC.Server("http://test", False)
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    server.version = "3.19"
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=(TEST_ASSET_DIR / "user_get.xml").read_text())
+        server.users.get()
+
+    assert m.last_request.headers.get("Accept") != "application/json"
+
+
+def test_json_error(server: TSC.Server) -> None:
+    error = {"error": {"code": "400006", "summary": "Bad Request", "detail": "Invalid page number"}}
+    with requests_mock.mock() as m:
+        m.get(server.groups.baseurl, status_code=400, json=error)
+        with pytest.raises(TSC.ServerResponseError) as raised:
+            server.groups.get()
+
+    assert (raised.value.code, raised.value.summary) == ("400006", "Bad Request")
+
+
+def test_invalid_response_format() -> None:
+    with pytest.raises(ValueError):
+        TSC.Server("http://test", False, response_format="yaml")
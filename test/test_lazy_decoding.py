@@ -0,0 +1,119 @@
+import inspect
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.streaming import StreamedPage
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+NS = {"t": "http://tableau.com/api"}
+
+ASSETS = [
+    (TSC.WorkbookItem, "workbook_get.xml"),
+    (TSC.WorkbookItem, "workbook_get_all_fields.xml"),
+    (TSC.WorkbookItem, "workbook_get_by_id.xml"),
+    (TSC.WorkbookItem, "workbook_get_by_id_acceleration_status.xml"),
+    (TSC.WorkbookItem, "workbook_get_by_id_personal.xml"),
+    (TSC.WorkbookItem, "workbook_get_invalid_date.xml"),
+    (TSC.DatasourceItem, "datasource_get.xml"),
+    (TSC.DatasourceItem, "datasource_get_all_fields.xml"),
+    (TSC.DatasourceItem, "datasource_get_by_id.xml"),
+    (TSC.DatasourceItem, "datasource_get_no_owner.xml"),
+]
+
+
+def comparable(value):
+    """Nested items have no equality, compare their attributes instead."""
+    if isinstance(value, list):
+        return [comparable(v) for v in value]
+    if hasattr(value, "__dict__") and not callable(value):
+        return {k: comparable(v) for k, v in vars(value).items() if k != "_lazy_source"}
+    return value
+
+
+@pytest.mark.parametrize("model, asset", ASSETS)
+def test_lazy_matches_eager(model, asset: str) -> None:
+    body = (TEST_ASSET_DIR / asset).read_bytes()
+    eager_items = model.from_response(body, NS, lazy=False)  # type: ignore[attr-defined]
+    lazy_items = model.from_response(body, NS, lazy=True)  # type: ignore[attr-defined]
+    assert len(lazy_items) == len(eager_items) > 0
+
+    for eager, lazy in zip(eager_items, lazy_items):
+        assert type(lazy) is model
+        for name in model._decoded_by:  # type: ignore[attr-defined]
+            if model is TSC.WorkbookItem and name == "_project_id" and eager.project is None:
+                # Both get a random placeholder ID when there is no project
+                assert lazy.project_id is not None
+                continue
+            assert comparable(getattr(lazy, name)) == comparable(getattr(eager, name)), name
+
+
+@pytest.mark.parametrize("model, asset", ASSETS)
+def test_decode_all_matches_eager(model, asset: str, monkeypatch) -> None:
+    # Workbooks without a project get a random placeholder project ID
+    monkeypatch.setattr("uuid.uuid4", lambda: "placeholder")
+    body = (TEST_ASSET_DIR / asset).read_bytes()
+    eager_items = model.from_response(body, NS, lazy=False)  # type: ignore[attr-defined]
+    lazy_items = model.from_response(body, NS, lazy=True)  # type: ignore[attr-defined]
+
+    for eager, lazy in zip(eager_items, lazy_items):
+        lazy._decode_all()
+        assert "_lazy_source" not in vars(lazy)
+        assert comparable(lazy) == comparable(eager)
+
+
+@pytest.mark.parametrize("model", [TSC.WorkbookItem, TSC.DatasourceItem])
+def test_fields_match_set_values(model) -> None:
+    parameters = list(inspect.signature(model._set_values).parameters)[1:]
+    assert list(model._fields) == parameters
+    # Every attribute has a value from __init__ for the fields an element leaves out
+    assert set(model._decoded_by) <= set(vars(model()))
+
+
+def test_lazy_decodes_on_first_access() -> None:
+    body = (TEST_ASSET_DIR / "workbook_get.xml").read_bytes()
+    (workbook, _) = TSC.WorkbookItem.from_response(body, NS, lazy=True)
+
+    assert "_created_at" not in vars(workbook)
+    assert workbook.created_at is not None
+    assert "_created_at" in vars(workbook)
+    assert "_owner" not in vars(workbook)
+
+
+def test_lazy_fields_can_be_set() -> None:
+    body = (TEST_ASSET_DIR / "workbook_get.xml").read_bytes()
+    (workbook, _) = TSC.WorkbookItem.from_response(body, NS, lazy=True)
+
+    workbook.name = "renamed"
+    workbook.tags.add("new")
+
+    assert workbook.name == "renamed"
+    assert "new" in workbook.tags
+    assert "new" not in workbook._initial_tags
+
+
+def test_lazy_decoding_from_config(monkeypatch) -> None:
+    monkeypatch.setenv("TSC_LAZY_DECODING", "true")
+    body = (TEST_ASSET_DIR / "datasource_get.xml").read_bytes()
+
+    (datasource, _) = TSC.DatasourceItem.from_response(body, NS)
+
+    assert "_lazy_source" in vars(datasource)
+    assert datasource.name == "SampleDS"
+
+
+def test_lazy_items_from_stream() -> None:
+    with requests_mock.mock() as m:
+        m.get("http://test/workbooks", content=(TEST_ASSET_DIR / "workbook_get.xml").read_bytes())
+        response = TSC.Server("http://test", False).session.get("http://test/workbooks", stream=True)
+        page = StreamedPage(response, "workbook", lambda e, ns: TSC.WorkbookItem.from_xml(e, ns, lazy=True))
+        workbooks = [workbook for workbook in page]
+
+    assert [workbook.owner_id for workbook in workbooks] == [
+        "5de011f8-5aa9-4d5b-b991-f462c8dd6bb7",
+        "5de011f8-5aa9-4d5b-b991-f462c8dd6bb7",
+    ]
+    assert all(workbook.updated_at is not None for workbook in workbooks)
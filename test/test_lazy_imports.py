@@ -0,0 +1,114 @@
+import ast
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+import tableauserverclient as TSC
+import tableauserverclient.models
+import tableauserverclient.server
+import tableauserverclient.server.endpoint
+
+
+def run_python(code: str) -> str:
+    """Runs code in a fresh interpreter, where nothing has been imported yet, and returns its output."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.strip()
+
+
+def import_seconds(module: str) -> float:
+    code = f"import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+    return min(float(run_python(code)) for _ in range(3))
+
+
+@pytest.mark.parametrize(
+    "package",
+    [TSC, tableauserverclient.models, tableauserverclient.server, tableauserverclient.server.endpoint],
+    ids=lambda package: package.__name__,
+)
+def test_all_names_resolve(package) -> None:
+    for name in package.__all__:
+        assert getattr(package, name) is not None, name
+        assert name in dir(package)
+
+
+@pytest.mark.parametrize(
+    "package",
+    [TSC, tableauserverclient.models, tableauserverclient.server, tableauserverclient.server.endpoint],
+    ids=lambda package: package.__name__,
+)
+def test_type_checking_imports_match_exports(package) -> None:
+    # The imports type checkers read are the one list kept by hand beside the exports
+    tree = ast.parse(Path(package.__file__).read_text())
+    (block,) = [node for node in tree.body if isinstance(node, ast.If)]
+    aliases = [alias for node in block.body if isinstance(node, ast.ImportFrom) for alias in node.names]
+    assert len(aliases) > 0
+    assert {alias.name for alias in aliases} == {name for names in package._EXPORTS.values() for name in names}
+    assert all(alias.asname == alias.name for alias in aliases)
+
+
+def test_unknown_name() -> None:
+    with pytest.raises(AttributeError):
+        TSC.NoSuchItem
+
+
+def test_submodules_after_bare_import() -> None:
+    # An eager __init__ imported these as a side effect, so scripts reach them through the package
+    loaded = run_python(
+        "import tableauserverclient as TSC; "
+        "print(TSC.server.endpoint.exceptions.ServerResponseError.__name__, "
+        "TSC.models.UserItem.__name__, TSC.helpers.__name__, TSC.config.__name__, TSC.datetime_helpers.__name__)"
+    )
+    assert loaded == (
+        "ServerResponseError UserItem tableauserverclient.helpers tableauserverclient.config "
+        "tableauserverclient.datetime_helpers"
+    )
+
+
+def test_submodules_are_listed() -> None:
+    assert {"server", "models", "helpers", "config", "datetime_helpers"} <= set(dir(TSC))
+    assert "endpoint" in dir(tableauserverclient.server)
+
+
+def test_import_does_not_load_requests_or_endpoints() -> None:
+    loaded = run_python(
+        "import sys, tableauserverclient; "
+        "print(sorted(m for m in sys.modules if m == 'requests' or m.startswith('tableauserverclient.')))"
+    )
+    assert loaded == "['tableauserverclient.lazy_imports', 'tableauserverclient.namespace']"
+
+
+def test_endpoints_are_imported_on_first_use() -> None:
+    loaded = run_python(
+        "import sys, tableauserverclient as TSC; "
+        "server = TSC.Server('http://test'); "
+        "before = 'tableauserverclient.server.endpoint.workbooks_endpoint' in sys.modules; "
+        "server.workbooks; "
+        "after = 'tableauserverclient.server.endpoint.workbooks_endpoint' in sys.modules; "
+        "print(before, after, 'tableauserverclient.server.endpoint.flows_endpoint' in sys.modules)"
+    )
+    assert loaded == "False True False"
+
+
+def test_endpoint_is_created_once() -> None:
+    server = TSC.Server("http://test", False)
+    with ThreadPoolExecutor(8) as pool:
+        endpoints = list(pool.map(lambda _: server.users, range(32)))
+
+    assert all(endpoint is endpoints[0] for endpoint in endpoints)
+    assert isinstance(endpoints[0], TSC.server.endpoint.Users)
+    assert TSC.Server("http://test", False).users is not endpoints[0]
+
+
+def test_endpoint_can_be_replaced() -> None:
+    server = TSC.Server("http://test", False)
+    replacement = TSC.server.endpoint.Workbooks(server)
+    server.workbooks = replacement
+    assert server.workbooks is replacement
+
+
+@pytest.mark.benchmark
+def test_import_time() -> None:
+    # Importing the package used to import requests and every model and endpoint module
+    assert import_seconds("tableauserverclient") < import_seconds("requests")
@@ -0,0 +1,136 @@
+import io
+import os
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+import requests_mock
+from urllib3.fields import RequestField
+from urllib3.filepost import encode_multipart_formdata
+
+import tableauserverclient as TSC
+from tableauserverclient.config import BYTES_PER_MB
+from tableauserverclient.server.multipart import FilePart, MultipartBody
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+DATASOURCE_PUBLISH = TEST_ASSET_DIR / "datasource_publish.xml"
+
+
+@pytest.fixture(scope="function")
+def server() -> TSC.Server:
+    server = TSC.Server("http://test", False)
+    server.version = "3.19"
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvS"
+    return server
+
+
+def encoded(data: bytes) -> bytes:
+    """The body urllib3 builds in memory for a publish of data."""
+    payload = RequestField(name="request_payload", data="<tsRequest/>", filename="")
+    payload.make_multipart(content_type="text/xml")
+    file = RequestField(name="tableau_datasource", data=data, filename="big.hyper")
+    file.make_multipart(content_type="application/octet-stream")
+    return encode_multipart_formdata([payload, file], boundary="boundary")[0]
+
+
+def body(file) -> MultipartBody:
+    return MultipartBody(
+        {
+            "request_payload": ("", "<tsRequest/>", "text/xml"),
+            "tableau_datasource": ("big.hyper", FilePart(file), "application/octet-stream"),
+        },
+        boundary="boundary",
+    )
+
+
+def test_file_part_from_path(tmp_path: Path) -> None:
+    data = os.urandom(BYTES_PER_MB * 5 // 2)
+    path = tmp_path / "big.hyper"
+    path.write_bytes(data)
+
+    streamed = body(path)
+    assert len(streamed) == len(encoded(data))
+    # Iterated twice, as a retried request would be
+    assert bytes(streamed) == bytes(streamed) == encoded(data)
+
+
+def test_file_part_from_file_object() -> None:
+    file = io.BytesIO(b"header" + b"data" * 1000)
+    file.seek(6)
+    streamed = body(file)
+    assert bytes(streamed) == encoded(b"data" * 1000)
+    assert bytes(streamed) == encoded(b"data" * 1000)
+
+
+def test_file_part_that_shrinks(tmp_path: Path) -> None:
+    path = tmp_path / "big.hyper"
+    path.write_bytes(b"1" * 100)
+    streamed = body(path)
+    path.write_bytes(b"1" * 10)
+    with pytest.raises(OSError):
+        bytes(streamed)
+
+
+def test_publish_streams_the_file(server: TSC.Server, tmp_path: Path) -> None:
+    data = os.urandom(BYTES_PER_MB)
+    path = tmp_path / "big.hyper"
+    path.write_bytes(data)
+
+    sent = []
+
+    def publish(request, context):
+        sent.append((request.headers["Content-Length"], bytes(request.body)))
+        return DATASOURCE_PUBLISH.read_text()
+
+    item = TSC.DatasourceItem("ee8c6e70-43b6-11e6-af4f-f7b0d8e20760", "big")
+    with requests_mock.mock() as m:
+        m.post(server.datasources.baseurl, text=publish)
+        server.datasources.publish(item, path, server.PublishMode.CreateNew)
+
+    ((length, request_body),) = sent
+    assert int(length) == len(request_body)
+    assert data in request_body
+
+
+class PublishHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        length = int(self.headers["Content-Length"])
+        while length:
+            length -= len(self.rfile.read(min(length, 64 * 1024)))
+        response = DATASOURCE_PUBLISH.read_bytes()
+        self.send_response(201)
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+
+def test_publish_memory(tmp_path: Path) -> None:
+    # The file used to be read into memory and then copied into the body, so a 48MB publish held about 96MB
+    path = tmp_path / "big.hyper"
+    path.write_bytes(os.urandom(48 * BYTES_PER_MB))
+    stub = ThreadingHTTPServer(("127.0.0.1", 0), PublishHandler)
+    threading.Thread(target=stub.serve_forever, args=(0.01,), daemon=True).start()
+    try:
+        server = TSC.Server(f"http://127.0.0.1:{stub.server_port}", False)
+        server.version = "3.19"
+        server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        server._auth_token = "j80k54ll2lfMZ0tv97mlPvvS"
+        item = TSC.DatasourceItem("ee8c6e70-43b6-11e6-af4f-f7b0d8e20760", "big")
+
+        tracemalloc.start()
+        try:
+            server.datasources.publish(item, path, server.PublishMode.CreateNew)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    finally:
+        stub.shutdown()
+        stub.server_close()
+
+    assert peak < 8 * BYTES_PER_MB
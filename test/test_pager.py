@@ -136,3 +136,173 @@ def test_queryset_no_matches(server: TSC.Server) -> None:
         all_groups = server.groups.all()
         groups = list(all_groups)
     assert len(groups) == 0
+
+
+def test_pager_with_prefetch(server: TSC.Server) -> None:
+    page_1 = GET_XML_PAGE1.read_text()
+    page_2 = GET_XML_PAGE2.read_text()
+    page_3 = GET_XML_PAGE3.read_text()
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+        opts = TSC.RequestOptions(1, 1)
+        workbooks = list(TSC.Pager(server.workbooks, opts, prefetch=2))
+
+    assert [wb.name for wb in workbooks] == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert m.call_count == 3
+
+
+def test_pager_prefetch_rejects_negative(server: TSC.Server) -> None:
+    with pytest.raises(ValueError):
+        TSC.Pager(server.workbooks, prefetch=-1)
+
+
+def test_queryset_with_prefetch(server: TSC.Server) -> None:
+    page_1 = GET_XML_PAGE1.read_text()
+    page_2 = GET_XML_PAGE2.read_text()
+    page_3 = GET_XML_PAGE3.read_text()
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+        queryset = server.workbooks.all(page_size=1).prefetch(4)
+        workbooks = [wb for wb in queryset]
+
+    assert [wb.name for wb in workbooks] == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert m.call_count == 3
+    assert queryset.page_number == 3
+
+
+def test_prefetch_pages_keeps_order() -> None:
+    import threading
+    import time
+
+    from tableauserverclient.server.pager import prefetch_pages
+
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def fetch(page: int) -> int:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        # Later pages finish first to prove ordering is preserved
+        time.sleep(0.01 * (10 - page))
+        with lock:
+            in_flight -= 1
+        return page
+
+    assert list(prefetch_pages(fetch, range(1, 10), 3)) == list(range(1, 10))
+    assert peak <= 3
+
+
+def test_pager_with_stream(server: TSC.Server) -> None:
+    page_1 = GET_XML_PAGE1.read_text()
+    page_2 = GET_XML_PAGE2.read_text()
+    page_3 = GET_XML_PAGE3.read_text()
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=page_1)
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=page_2)
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=page_3)
+
+        opts = TSC.RequestOptions(1, 1)
+        workbooks = list(TSC.Pager(server.workbooks, opts, stream=True))
+
+    assert [wb.name for wb in workbooks] == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert m.call_count == 3
+
+
+def test_pager_stream_rejects_prefetch(server: TSC.Server) -> None:
+    with pytest.raises(ValueError):
+        TSC.Pager(server.workbooks, prefetch=2, stream=True)
+
+
+@pytest.mark.parametrize(
+    "endpoint_name, asset",
+    [
+        ("datasources", "datasource_get.xml"),
+        ("flows", "flow_get.xml"),
+        ("groups", "group_get.xml"),
+        ("projects", "project_get.xml"),
+        ("sites", "site_get.xml"),
+        ("users", "user_get.xml"),
+        ("views", "view_get.xml"),
+        ("workbooks", "workbook_get.xml"),
+    ],
+)
+def test_streamed_items_match_get(server: TSC.Server, endpoint_name: str, asset: str) -> None:
+    server.version = "3.19"
+    endpoint = getattr(server, endpoint_name)
+    with requests_mock.mock() as m:
+        m.get(endpoint.baseurl, text=(TEST_ASSET_DIR / asset).read_text())
+        expected, expected_pagination = endpoint.get()
+        page = endpoint.get_streamed()
+        streamed = list(page)
+
+    assert len(streamed) == len(expected) > 0
+    for item, expected_item in zip(streamed, expected):
+        assert type(item) is type(expected_item)
+        # Compare the parsed values; nested models don't define equality
+        flat = {k: v for k, v in vars(expected_item).items() if isinstance(v, (str, int, bool, type(None)))}
+        assert {k: getattr(item, k) for k in flat} == flat
+    assert page.pagination.total_available == expected_pagination.total_available
+
+
+def test_streamed_page_yields_while_downloading() -> None:
+    from tableauserverclient.server.streaming import StreamedPage
+
+    extra = b"".join(
+        f'<workbook id="extra-{i}" name="Extra{i}"><project id="p" name="p"/><owner id="o"/></workbook>'.encode()
+        for i in range(50)
+    )
+    body = GET_XML_PAGE1.read_bytes().replace(b"</workbooks>", extra + b"</workbooks>")
+    chunks = [body[i : i + 256] for i in range(0, len(body), 256)]
+
+    class FakeResponse:
+        sent = 0
+        closed = False
+
+        def iter_content(self, chunk_size):
+            for chunk in chunks:
+                self.sent += 1
+                yield chunk
+
+        def close(self):
+            self.closed = True
+
+    response = FakeResponse()
+    page = StreamedPage(response, "workbook", TSC.WorkbookItem.from_xml)  # type: ignore[arg-type]
+    items = iter(page)
+    first = next(items)
+
+    assert first.name == "Page1Workbook"
+    assert page.pagination.total_available == 3
+    assert response.sent < len(chunks)
+    assert [wb.name for wb in items] == [f"Extra{i}" for i in range(50)]
+    assert response.closed
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_streamed_page_clears_elements(lazy: bool) -> None:
+    from tableauserverclient.server.streaming import StreamedPage
+
+    elements = []
+
+    def parse(element, ns):
+        elements.append(element)
+        return TSC.WorkbookItem.from_xml(element, ns, lazy)
+
+    with requests_mock.mock() as m:
+        m.get("http://test/workbooks", content=GET_XML_PAGE1.read_bytes())
+        response = TSC.Server("http://test", False).session.get("http://test/workbooks", stream=True)
+        (workbook,) = list(StreamedPage(response, "workbook", parse))
+
+    # An eager item has read everything from its element, a lazy one still reads from it
+    assert (len(elements[0]) == 0 and not elements[0].attrib) is not lazy
+    assert workbook.name == "Page1Workbook"
+    assert workbook.project_name is not None
@@ -0,0 +1,126 @@
+import asyncio
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+GET_USER_XML = TEST_ASSET_DIR / "user_get.xml"
+
+
+@contextmanager
+def fake_clock():
+    now = 0.0
+    lock = threading.Lock()
+
+    def sleep(interval):
+        nonlocal now
+        with lock:
+            now += interval
+
+    def monotonic():
+        return now
+
+    with patch("time.sleep", sleep), patch("time.monotonic", monotonic):
+        yield monotonic
+
+
+def test_burst_then_rate() -> None:
+    with fake_clock() as clock:
+        limiter = TSC.RateLimiter(rate=2, burst=3)
+        for _ in range(3):
+            limiter.acquire()
+        assert clock() == 0
+        limiter.acquire()
+        assert clock() == pytest.approx(0.5)
+        limiter.acquire()
+        assert clock() == pytest.approx(1.0)
+    assert limiter.throttled_count == 2
+    assert limiter.wait_time == pytest.approx(1.0)
+
+
+def test_default_burst_is_one_second() -> None:
+    with fake_clock() as clock:
+        limiter = TSC.RateLimiter(rate=2.5)
+        for _ in range(3):
+            limiter.acquire()
+        assert clock() == 0
+        limiter.acquire()
+        assert clock() > 0
+
+
+def test_method_limits() -> None:
+    with fake_clock() as clock:
+        limiter = TSC.RateLimiter(None, method_limits={"post": (1, 1)})
+        limiter.acquire("GET")
+        limiter.acquire("GET")
+        assert clock() == 0
+        limiter.acquire("POST")
+        limiter.acquire("post")
+        assert clock() == pytest.approx(1.0)
+
+
+def test_requires_a_limit() -> None:
+    with pytest.raises(ValueError):
+        TSC.RateLimiter(None)
+    with pytest.raises(ValueError):
+        TSC.RateLimiter(rate=0)
+
+
+def test_shared_between_servers() -> None:
+    with fake_clock() as clock, requests_mock.mock() as m:
+        limiter = TSC.RateLimiter(rate=1, burst=2)
+        servers = [TSC.Server("http://test", False, rate_limiter=limiter) for _ in range(2)]
+        for server in servers:
+            server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+            server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+            m.get(server.users.baseurl, text=GET_USER_XML.read_text())
+        for server in servers:
+            server.users.get()
+        assert clock() == 0
+        servers[0].users.get()
+        assert clock() == pytest.approx(1.0)
+    assert m.call_count == 3
+
+
+def test_thread_safe() -> None:
+    with fake_clock():
+        limiter = TSC.RateLimiter(rate=10, burst=1)
+        delays = []
+        lock = threading.Lock()
+
+        def reserve():
+            delay = limiter.reserve()
+            with lock:
+                delays.append(delay)
+
+        threads = [threading.Thread(target=reserve) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    # Every caller got its own slot, spaced by 1/rate
+    assert sorted(delays) == pytest.approx([n / 10 for n in range(20)])
+
+
+def test_acquire_async() -> None:
+    slept = []
+
+    async def fake_sleep(interval):
+        slept.append(interval)
+
+    async def main():
+        with patch("asyncio.sleep", fake_sleep), patch("time.monotonic", lambda: 0.0):
+            limiter = TSC.RateLimiter(rate=1, burst=1)
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+
+    asyncio.run(main())
+    assert slept == [pytest.approx(1.0)]
@@ -0,0 +1,94 @@
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.models import UserRecord, WorkbookRecord
+from tableauserverclient.models.records import to_record
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+GET_XML_PAGE1 = TEST_ASSET_DIR / "workbook_get_page_1.xml"
+GET_XML_PAGE2 = TEST_ASSET_DIR / "workbook_get_page_2.xml"
+GET_XML_PAGE3 = TEST_ASSET_DIR / "workbook_get_page_3.xml"
+USER_GET_XML = TEST_ASSET_DIR / "user_get.xml"
+
+NS = {"t": "http://tableau.com/api"}
+
+
+@pytest.fixture(scope="function")
+def server():
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    server.version = "3.19"
+
+    return server
+
+
+def test_pager_as_records(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl + "?pageNumber=1&pageSize=1", complete_qs=True, text=GET_XML_PAGE1.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=2&pageSize=1", complete_qs=True, text=GET_XML_PAGE2.read_text())
+        m.get(server.workbooks.baseurl + "?pageNumber=3&pageSize=1", complete_qs=True, text=GET_XML_PAGE3.read_text())
+
+        records = list(TSC.Pager(server.workbooks, TSC.RequestOptions(1, 1), as_records=True))
+
+    assert all(isinstance(record, WorkbookRecord) for record in records)
+    assert [record.name for record in records] == ["Page1Workbook", "Page2Workbook", "Page3Workbook"]
+    assert records[0].project_name == "default"
+
+
+def test_queryset_records(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=USER_GET_XML.read_text())
+        records = [record for record in server.users.all().records()]
+
+    assert [type(record) for record in records] == [UserRecord, UserRecord]
+    assert records[0].name == "alice"
+    assert records[0].site_role == "Publisher"
+
+
+def test_records_are_read_only() -> None:
+    (user,) = TSC.UserItem.from_response(USER_GET_XML.read_bytes(), NS)[:1]
+    record = to_record(user)
+
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.name = "mallory"  # type: ignore[misc]
+
+
+@pytest.mark.parametrize(
+    "model, asset",
+    [
+        (TSC.DatasourceItem, "datasource_get.xml"),
+        (TSC.GroupItem, "group_get.xml"),
+        (TSC.ProjectItem, "project_get.xml"),
+        (TSC.SiteItem, "site_get.xml"),
+        (TSC.UserItem, "user_get.xml"),
+        (TSC.ViewItem, "view_get.xml"),
+        (TSC.WorkbookItem, "workbook_get.xml"),
+    ],
+)
+def test_record_to_model(model: type, asset: str) -> None:
+    items = model.from_response((TEST_ASSET_DIR / asset).read_bytes(), NS)  # type: ignore[attr-defined]
+    assert items
+
+    for item in items:
+        record = to_record(item)
+        rebuilt = record.to_model()
+
+        assert type(rebuilt) is model
+        for name in record._fields:
+            # ViewItem.total_views raises until usage is requested, so compare the stored value
+            attribute = "_total_views" if name == "total_views" else name
+            assert getattr(rebuilt, attribute, None) == getattr(item, attribute, None), name
+
+
+def test_to_record_rejects_unsupported_items() -> None:
+    with pytest.raises(ValueError):
+        to_record(TSC.TableItem("customers"))
@@ -0,0 +1,174 @@
+import copy
+import ssl
+import timeit
+import warnings
+
+import pytest
+from packaging.version import Version
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint import Endpoint
+from tableauserverclient.server.endpoint.endpoint import api, parameter_added_in
+from tableauserverclient.server.request_context import RequestContext, user_agent
+
+
+@pytest.fixture(scope="function")
+def server() -> TSC.Server:
+    server = TSC.Server("http://test", False)
+    server.version = "3.19"
+    return server
+
+
+class FakeResponse:
+    status_code = 200
+    headers = {"Content-Type": "application/octet-stream"}
+    content = b""
+    encoding = None
+
+
+def fake_get(url, **parameters):
+    return FakeResponse()
+
+
+def set_parameters(http_options, auth_token, content, content_type, parameters) -> dict:
+    """How Endpoint built the parameters of every request before RequestContext."""
+    parameters = parameters or {}
+    request_headers = parameters.get("headers", {})
+    parameters.update(http_options)
+    parameters["headers"] = {**parameters.get("headers", {}), **request_headers}
+    if auth_token is not None:
+        parameters["headers"]["x-tableau-auth"] = auth_token
+    if content_type is not None:
+        parameters["headers"]["content-type"] = content_type
+    Endpoint.set_user_agent(parameters)
+    if content is not None:
+        parameters["data"] = content
+    return parameters
+
+
+@pytest.mark.parametrize(
+    "http_options",
+    [
+        {},
+        {"timeout": 5},
+        {"headers": {"X-Proxy": "1"}, "verify": False},
+        {"headers": {"User-Agent": "custom"}},
+        {"User-Agent": "top level"},
+    ],
+)
+@pytest.mark.parametrize(
+    "arguments",
+    [
+        (None, None, None, None),
+        ("token", b"<tsRequest/>", "text/xml", None),
+        ("token", None, None, {"params": {"pageSize": 10}, "headers": {"Accept": "application/json"}}),
+        (None, None, None, {"headers": {"X-Proxy": "2"}, "stream": True}),
+    ],
+)
+def test_parameters_match_set_parameters(http_options: dict, arguments: tuple) -> None:
+    auth_token, content, content_type, parameters = arguments
+    context = RequestContext("3.19", http_options)
+
+    expected = set_parameters(http_options, auth_token, content, content_type, copy.deepcopy(parameters))
+    assert context.parameters(auth_token, content, content_type, copy.deepcopy(parameters)) == expected
+    assert (
+        Endpoint.set_parameters(http_options, auth_token, content, content_type, copy.deepcopy(parameters)) == expected
+    )
+
+
+def test_parameters_do_not_write_into_http_options() -> None:
+    http_options = {"headers": {"X-Proxy": "1"}}
+    context = RequestContext("3.19", http_options)
+    context.parameters("token", None, "text/xml", None)
+    assert http_options == {"headers": {"X-Proxy": "1"}}
+    assert context.headers == {"X-Proxy": "1"}
+
+
+def test_user_agent() -> None:
+    assert user_agent().startswith("Tableau Server Client/")
+    assert RequestContext(None, {}).parameters(None, None, None, None)["headers"]["User-Agent"] == user_agent()
+
+
+def test_context_is_reused(server: TSC.Server) -> None:
+    assert server.request_context is server.request_context
+
+
+def test_context_follows_version(server: TSC.Server) -> None:
+    assert server.check_at_least_version("3.19")
+    server.version = "3.18"
+    assert not server.check_at_least_version("3.19")
+    assert server.request_context.parsed_version == Version("3.18")
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda server: server.add_http_options({"timeout": 5}),
+        lambda server: server.clear_http_options(),
+        lambda server: server.configure_ssl(allow_weak_dh=False),
+        # Changed in place, without going through the Server methods
+        lambda server: server.http_options.update({"timeout": 10}),
+        lambda server: server.http_options["headers"].update({"X-Proxy": "2"}),
+    ],
+)
+def test_context_follows_http_options(change) -> None:
+    http_options = {"verify": ssl.create_default_context(), "headers": {"X-Proxy": "1"}}
+    server = TSC.Server("http://test", False, http_options=http_options)
+    context = server.request_context
+    change(server)
+    assert server.request_context is not context
+    assert server.request_context.http_options == server.http_options
+
+
+def test_no_version_counts_as_default() -> None:
+    assert RequestContext(None, {}).at_least("2.4")
+    assert not RequestContext(None, {}).at_least("2.5")
+
+
+def test_parameter_added_in_warns(server: TSC.Server) -> None:
+    class Things(Endpoint):
+        @api(version="2.0")
+        @parameter_added_in(fancy="3.20")
+        def get(self, fancy=None):
+            return fancy
+
+    with pytest.warns(UserWarning, match="'fancy' not available in 3.19"):
+        assert Things(server).get(fancy=1) == 1
+    server.version = "3.20"
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        Things(server).get(fancy=1)
+
+
+def test_repeated_checks_do_not_parse_versions(server: TSC.Server, monkeypatch) -> None:
+    assert server.check_at_least_version("3.5")
+
+    def fail(version):
+        raise AssertionError(f"{version} was parsed again")
+
+    monkeypatch.setattr("tableauserverclient.server.request_context.Version", fail)
+    assert server.check_at_least_version("3.5")
+    server.assert_at_least_version("3.5", "Things")
+    assert server.request_context.parameters("token", None, None, None)["headers"]["x-tableau-auth"] == "token"
+
+
+@pytest.mark.benchmark
+def test_request_overhead(server: TSC.Server) -> None:
+    # Everything a request does before the network, which is stubbed out
+    server._auth_token = "token"
+    endpoint = Endpoint(server)
+
+    def cached() -> None:
+        server.assert_at_least_version("3.5", "Things")
+        parameters = server.request_context.parameters("token", None, None, None)
+        endpoint._send_request(fake_get, "http://test/api/3.19/sites", parameters)
+
+    def uncached() -> None:
+        # What the same steps did before the context: parse both versions and merge the options every time
+        assert Version(server.version) >= Version("3.5")
+        parameters = set_parameters(server.http_options, "token", None, None, None)
+        endpoint._send_request(fake_get, "http://test/api/3.19/sites", parameters)
+
+    fast = min(timeit.repeat(cached, number=500, repeat=5))
+    slow = min(timeit.repeat(uncached, number=500, repeat=5))
+    assert fast < slow
@@ -0,0 +1,277 @@
+import sqlite3
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.response_cache import CacheKey, affected_by
+from ._utils import mocked_time
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+GET_USER_XML = TEST_ASSET_DIR / "user_get.xml"
+GET_USER_BY_ID_XML = TEST_ASSET_DIR / "user_get_by_id.xml"
+UPDATE_USER_XML = TEST_ASSET_DIR / "user_update.xml"
+SERVER_INFO_XML = TEST_ASSET_DIR / "server_info_get.xml"
+JOB_INPROGRESS_XML = TEST_ASSET_DIR / "job_get_by_id_inprogress.xml"
+JOB_COMPLETED_XML = TEST_ASSET_DIR / "job_get_by_id_completed.xml"
+
+USER_ID = "dd2239f6-ddf1-4107-981a-4cf94e415794"
+
+
+@pytest.fixture(scope="function")
+def cache():
+    return TSC.ResponseCache(ttl=60, max_entries=10)
+
+
+@pytest.fixture(scope="function")
+def server(cache):
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False, response_cache=cache)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    return server
+
+
+def test_repeated_get_is_cached(server: TSC.Server, cache: TSC.ResponseCache) -> None:
+    with requests_mock.mock() as m:
+        m.get(f"{server.users.baseurl}/{USER_ID}", text=GET_USER_BY_ID_XML.read_text())
+        first = server.users.get_by_id(USER_ID)
+        second = server.users.get_by_id(USER_ID)
+
+    assert m.call_count == 1
+    assert first.id == second.id == USER_ID
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.hit_rate == 0.5
+
+
+def test_query_params_are_part_of_key(server: TSC.Server) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=GET_USER_XML.read_text())
+        server.users.get(TSC.RequestOptions(pagenumber=1))
+        server.users.get(TSC.RequestOptions(pagenumber=2))
+        server.users.get(TSC.RequestOptions(pagenumber=1))
+
+    assert m.call_count == 2
+
+
+def test_site_is_part_of_key(server: TSC.Server) -> None:
+    url = f"{server.baseurl}/sites/dad65087-b08b-4603-af4e-2887b8aafc67"
+    with requests_mock.mock() as m:
+        m.get(url, text="")
+        server.users.get_request(url)
+        server._site_id = "another-site"
+        server.users.get_request(url)
+        server.users.get_request(url)
+
+    assert m.call_count == 2
+
+
+def test_entries_expire(server: TSC.Server) -> None:
+    with requests_mock.mock() as m, patch("time.monotonic") as clock:
+        m.get(server.server_info.baseurl, text=SERVER_INFO_XML.read_text())
+        clock.return_value = 0
+        server.server_info.get()
+        clock.return_value = 59
+        server.server_info.get()
+        clock.return_value = 61
+        server.server_info.get()
+
+    assert m.call_count == 2
+
+
+def test_least_recently_used_is_evicted(server: TSC.Server, cache: TSC.ResponseCache) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=GET_USER_XML.read_text())
+        for page in range(1, 12):
+            server.users.get(TSC.RequestOptions(pagenumber=page))
+        assert len(cache) == 10
+        assert cache.evictions == 1
+        server.users.get(TSC.RequestOptions(pagenumber=1))
+
+    assert m.call_count == 12
+
+
+def test_update_invalidates_resource_and_list(server: TSC.Server, cache: TSC.ResponseCache) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, text=GET_USER_XML.read_text())
+        m.get(f"{server.users.baseurl}/{USER_ID}", text=GET_USER_BY_ID_XML.read_text())
+        m.get(server.server_info.baseurl, text=SERVER_INFO_XML.read_text())
+        m.put(f"{server.users.baseurl}/{USER_ID}", text=UPDATE_USER_XML.read_text())
+        server.users.get()
+        user = server.users.get_by_id(USER_ID)
+        server.server_info.get()
+        server.users.update(user)
+        server.users.get()
+        server.users.get_by_id(USER_ID)
+        server.server_info.get()
+
+    assert cache.invalidations == 2
+    assert [r.method for r in m.request_history] == ["GET", "GET", "GET", "PUT", "GET", "GET"]
+
+
+def test_streamed_responses_are_not_cached(server: TSC.Server, cache: TSC.ResponseCache) -> None:
+    url = f"{server.baseurl}/download"
+    with requests_mock.mock() as m:
+        m.get(url, content=b"data", headers={"Content-Type": "application/octet-stream"})
+        server.users.get_request(url, parameters={"stream": True})
+        server.users.get_request(url, parameters={"stream": True})
+
+    assert m.call_count == 2
+    assert len(cache) == 0
+
+
+def test_errors_are_not_cached(server: TSC.Server, cache: TSC.ResponseCache) -> None:
+    with requests_mock.mock() as m:
+        m.get(server.server_info.baseurl, status_code=500)
+        for _ in range(2):
+            with pytest.raises(Exception):
+                server.server_info.get()
+
+    assert m.call_count == 2
+    assert len(cache) == 0
+
+
+def test_polled_job_is_not_cached(server: TSC.Server, cache: TSC.ResponseCache) -> None:
+    server.version = "3.1"
+    job_id = "777bf7c4-421d-4b2c-a518-11b90187c545"
+    responses = [{"text": JOB_INPROGRESS_XML.read_text()}] * 2 + [{"text": JOB_COMPLETED_XML.read_text()}]
+    with mocked_time(), requests_mock.mock() as m:
+        m.get(f"{server.jobs.baseurl}/{job_id}", responses)
+        job = server.jobs.wait_for_job(job_id, timeout=60)
+
+    assert job.completed_at is not None
+    assert m.call_count == 3
+    assert len(cache) == 0
+
+
+def test_affected_by() -> None:
+    base = "http://test/api/3.19/sites/1"
+    assert affected_by(f"{base}/users", f"{base}/users/2")
+    assert affected_by(f"{base}/users/2", f"{base}/users/2")
+    assert affected_by(f"{base}/users/2/groups", f"{base}/users/2")
+    assert affected_by(f"{base}/users?pageNumber=2", f"{base}/users/2")
+    assert not affected_by(f"{base}/users/20", f"{base}/users/2")
+    assert not affected_by(f"{base}/groups", f"{base}/users/2")
+
+
+def test_cache_key_ignores_param_order() -> None:
+    assert CacheKey.build("u", {"a": 1, "b": 2}, "s", None) == CacheKey.build("u", {"b": 2, "a": 1}, "s", None)
+
+
+def test_invalid_cache_settings() -> None:
+    with pytest.raises(ValueError):
+        TSC.ResponseCache(ttl=0)
+    with pytest.raises(ValueError):
+        TSC.ResponseCache(max_entries=0)
+
+
+def test_disk_cache_shared_between_instances(tmp_path: Path) -> None:
+    db = tmp_path / "cache" / "responses.sqlite3"
+    first = TSC.Server("http://test", False, response_cache=TSC.DiskResponseCache(db))
+    second = TSC.Server("http://test", False, response_cache=TSC.DiskResponseCache(db))
+    for server in (first, second):
+        server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+        server._user_id = "1"
+        server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    with requests_mock.mock() as m:
+        m.get(first.users.baseurl, text=GET_USER_XML.read_text(), headers={"Content-Type": "text/xml"})
+        fresh, _ = first.users.get()
+        cached, pagination_item = second.users.get()
+
+    assert m.call_count == 1
+    assert [u.name for u in cached] == [u.name for u in fresh]
+    assert pagination_item.total_available == 2
+    assert second.response_cache.hits == 1
+
+
+def test_disk_cache_ttls(tmp_path: Path) -> None:
+    cache = TSC.DiskResponseCache(tmp_path / "responses.sqlite3", ttl=60, ttls={"users": 10, "jobs": 0})
+    base = "http://test/api/3.19/sites/1"
+    assert cache.ttl_for(f"{base}/users/2") == 10
+    assert cache.ttl_for(f"{base}/projects") == 60
+    assert cache.ttl_for("http://test/api/3.19/schedules") == 60
+
+    server = TSC.Server("http://test", False, response_cache=cache)
+    server._site_id = "1"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    with requests_mock.mock() as m, patch("time.time") as clock:
+        m.get(f"{server.baseurl}/sites/1/users", text="<a/>")
+        m.get(f"{server.baseurl}/sites/1/jobs", text="<a/>")
+        clock.return_value = 1000
+        server.users.get_request(f"{server.baseurl}/sites/1/users")
+        server.users.get_request(f"{server.baseurl}/sites/1/jobs")
+        clock.return_value = 1009
+        server.users.get_request(f"{server.baseurl}/sites/1/users")
+        server.users.get_request(f"{server.baseurl}/sites/1/jobs")
+        clock.return_value = 1011
+        server.users.get_request(f"{server.baseurl}/sites/1/users")
+
+    assert [r.path.rsplit("/", 1)[1] for r in m.request_history] == ["users", "jobs", "jobs", "users"]
+
+
+def test_disk_cache_size_cap(tmp_path: Path) -> None:
+    cache = TSC.DiskResponseCache(tmp_path / "responses.sqlite3", max_bytes=250)
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"x" * 100
+    for n in range(5):
+        cache.set(CacheKey.build(f"http://test/api/3.19/sites/1/projects/{n}", None, "1", None), response)
+
+    assert len(cache) == 2
+    assert cache.evictions == 3
+    assert cache.get(CacheKey.build("http://test/api/3.19/sites/1/projects/4", None, "1", None)) is not None
+    assert cache.get(CacheKey.build("http://test/api/3.19/sites/1/projects/0", None, "1", None)) is None
+
+
+def test_disk_cache_invalidation(tmp_path: Path) -> None:
+    cache = TSC.DiskResponseCache(tmp_path / "responses.sqlite3")
+    response = requests.Response()
+    response.status_code = 200
+    response._content = b"<a/>"
+    base = "http://test/api/3.19/sites/1"
+    urls = [f"{base}/users", f"{base}/users/2", f"{base}/users/2/groups", f"{base}/users/20", f"{base}/groups"]
+    for url in urls:
+        cache.set(CacheKey.build(url, None, "1", None), response)
+
+    cache.invalidate(f"{base}/users/2")
+
+    remaining = [url for url in urls if cache.get(CacheKey.build(url, None, "1", None)) is not None]
+    assert remaining == [f"{base}/users/20", f"{base}/groups"]
+    assert cache.invalidations == 3
+
+
+def test_disk_cache_locked_invalidation(tmp_path: Path, caplog) -> None:
+    db = tmp_path / "responses.sqlite3"
+    cache = TSC.DiskResponseCache(db)
+    server = TSC.Server("http://test", False, response_cache=cache)
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    # Fail at once instead of waiting for the lock
+    cache._connection().execute("PRAGMA busy_timeout = 0")
+
+    user = TSC.UserItem("test", "Viewer")
+    user._id = USER_ID
+    other = sqlite3.connect(db, isolation_level=None)
+    other.execute("BEGIN EXCLUSIVE")
+    try:
+        with requests_mock.mock() as m:
+            m.put(f"{server.users.baseurl}/{USER_ID}", text=UPDATE_USER_XML.read_text())
+            assert server.users.update(user).id == USER_ID
+        cache.clear()
+    finally:
+        other.execute("ROLLBACK")
+        other.close()
+
+    warnings = [record.getMessage() for record in caplog.records if record.levelname == "WARNING"]
+    assert len(warnings) == 2
+    assert warnings[0].startswith("Could not invalidate")
+    assert warnings[1].startswith("Could not clear")
@@ -0,0 +1,191 @@
+import logging
+import timeit
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.helpers import logging as tsc_logging
+from tableauserverclient.helpers.logging import TRACE, RedactedBody, log_response
+from tableauserverclient.helpers.strings import redact_xml
+from tableauserverclient.server import RequestFactory
+from tableauserverclient.server.endpoint import Endpoint
+
+URL = "http://test/api/3.19/sites"
+SIGN_IN_XML = Path(__file__).parent / "assets" / "auth_sign_in.xml"
+BODY = b'<tsResponse><credentials password="hunter2"/>' + b"<site/>" * 1000 + b"</tsResponse>"
+
+
+@pytest.fixture(scope="function")
+def server() -> TSC.Server:
+    server = TSC.Server("http://test", False)
+    server.version = "3.19"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvS"
+    return server
+
+
+def get(server: TSC.Server, **parameters) -> None:
+    endpoint = Endpoint(server)
+    with requests_mock.mock() as m:
+        m.get(URL, content=BODY, headers={"Content-Length": str(len(BODY))})
+        endpoint.get_request(URL, parameters=parameters or None)
+
+
+def fail_redaction(text):
+    raise AssertionError("the body was formatted")
+
+
+class UnreadableResponse:
+    """A response whose body must not be read."""
+
+    status_code = 200
+    encoding = "utf-8"
+
+    def __init__(self, content_type: str) -> None:
+        self.headers = {"Content-Type": content_type}
+
+    @property
+    def content(self) -> bytes:
+        raise AssertionError("the body was read")
+
+
+def test_no_body_work_at_debug(server: TSC.Server, caplog, monkeypatch) -> None:
+    monkeypatch.setattr(tsc_logging, "redact_secrets", fail_redaction)
+    caplog.set_level(logging.DEBUG, logger="TSC")
+    get(server)
+    assert "hunter2" not in caplog.text
+
+
+def test_no_record_by_default(server: TSC.Server, caplog, monkeypatch) -> None:
+    monkeypatch.setattr(tsc_logging, "redact_secrets", fail_redaction)
+    caplog.set_level(logging.WARNING, logger="TSC")
+    get(server)
+    assert not [record for record in caplog.records if hasattr(record, "tsc_request")]
+
+
+def test_structured_record(server: TSC.Server, caplog) -> None:
+    caplog.set_level(logging.DEBUG, logger="TSC")
+    get(server)
+
+    (record,) = [record for record in caplog.records if hasattr(record, "tsc_request")]
+    details = record.tsc_request
+    assert details["method"] == "GET"
+    assert details["url"] == URL
+    assert details["status"] == 200
+    assert details["bytes"] == len(BODY)
+    assert details["elapsed_ms"] >= 0
+    assert record.getMessage().startswith(f"GET {URL} returned 200 in ")
+
+
+def test_trace_body_is_redacted_and_cut_off(server: TSC.Server, caplog, monkeypatch) -> None:
+    monkeypatch.setenv("TSC_LOG_BODY_MAX_BYTES", "200")
+    caplog.set_level(TRACE, logger="TSC")
+    get(server)
+
+    (record,) = [record for record in caplog.records if record.levelno == TRACE]
+    message = record.getMessage()
+    assert "hunter2" not in message
+    assert "[redacted]" in message
+    assert message.endswith(f"... [{len(BODY) - 200} more bytes]")
+
+
+def test_trace_body_without_password_is_unchanged(caplog) -> None:
+    caplog.set_level(TRACE, logger="TSC")
+    with requests_mock.mock() as m:
+        m.get(URL, content=b"<tsResponse><site/></tsResponse>")
+        response = TSC.Server("http://test", False).session.get(URL)
+    log_response("GET", URL, response, 0.0, False)
+    assert caplog.records[-1].getMessage() == f"GET {URL} response body: <tsResponse><site/></tsResponse>"
+
+
+def trace_messages(caplog) -> str:
+    return "\n".join(record.getMessage() for record in caplog.records if record.levelno == TRACE)
+
+
+@pytest.mark.parametrize(
+    "auth, secret",
+    [
+        (TSC.TableauAuth("testuser", "hunter2", site_id="Samples"), "hunter2"),
+        (TSC.PersonalAccessTokenAuth("mytoken", "Random123Generated", site_id="Samples"), "Random123Generated"),
+        (TSC.JWTAuth("eyJhbGciOiJIUzI1NiJ9.e30.signature", site_id="Samples"), "eyJhbGciOiJIUzI1NiJ9"),
+    ],
+)
+def test_sign_in_bodies_are_redacted(caplog, auth, secret: str) -> None:
+    request = RedactedBody(RequestFactory.Auth.signin_req(auth), "utf-8", 10000)
+    response = RedactedBody(SIGN_IN_XML.read_bytes(), "utf-8", 10000)
+    assert secret not in str(request)
+    assert "eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l" not in str(response)
+
+    server = TSC.Server("http://test", False)
+    caplog.set_level(TRACE, logger="TSC")
+    with requests_mock.mock() as m:
+        m.post(server.auth.baseurl + "/signin", text=SIGN_IN_XML.read_text())
+        server.auth.sign_in(auth)
+    assert secret not in caplog.text
+    assert server.auth_token not in caplog.text
+
+
+def test_switch_site_body_is_redacted(server: TSC.Server, caplog) -> None:
+    caplog.set_level(TRACE, logger="TSC")
+    with requests_mock.mock() as m:
+        m.post(server.auth.baseurl + "/switchSite", text=SIGN_IN_XML.read_text())
+        server.auth.switch_site(TSC.SiteItem("Samples", "Samples"))
+
+    messages = trace_messages(caplog)
+    assert 'token="[redacted]"' in messages
+    assert server.auth_token not in messages
+
+
+def test_cut_off_token_is_redacted(caplog, monkeypatch) -> None:
+    monkeypatch.setenv("TSC_LOG_BODY_MAX_BYTES", "40")
+    caplog.set_level(TRACE, logger="TSC")
+    with requests_mock.mock() as m:
+        m.get(URL, content=b'<tsResponse><credentials token="eIX6mvFsqyansa4KqEI1UwOpS8ggRs2l"/></tsResponse>')
+        response = TSC.Server("http://test", False).session.get(URL)
+    log_response("GET", URL, response, 0.0, False)
+    assert "eIX6mvFsq" not in trace_messages(caplog)
+
+
+def test_sampling_skips_bodies(server: TSC.Server, caplog, monkeypatch) -> None:
+    monkeypatch.setenv("TSC_LOG_BODY_SAMPLE_RATE", "0")
+    caplog.set_level(TRACE, logger="TSC")
+    get(server)
+    assert not [record for record in caplog.records if record.levelno == TRACE]
+    assert [record for record in caplog.records if hasattr(record, "tsc_request")]
+
+
+@pytest.mark.parametrize(
+    "content_type, streamed",
+    [("application/octet-stream", False), ("application/xml", True)],
+)
+def test_binary_and_streamed_bodies_are_not_read(caplog, content_type: str, streamed: bool) -> None:
+    caplog.set_level(TRACE, logger="TSC")
+    log_response("GET", URL, UnreadableResponse(content_type), 0.0, streamed)
+    assert [record.tsc_request["status"] for record in caplog.records] == [200]
+
+
+def test_request_body_at_trace(server: TSC.Server, caplog) -> None:
+    caplog.set_level(TRACE, logger="TSC")
+    endpoint = Endpoint(server)
+    with requests_mock.mock() as m:
+        m.post(URL, text="<tsResponse/>")
+        endpoint.post_request(URL, b'<tsRequest><credentials password="hunter2"/></tsRequest>')
+    messages = [record.getMessage() for record in caplog.records if record.levelno == TRACE]
+    assert messages[0].startswith(f"POST {URL} request body: ")
+    assert "hunter2" not in messages[0]
+
+
+@pytest.mark.benchmark
+def test_logging_overhead() -> None:
+    # What a request used to log at the default level: the whole body, redacted, built into a string
+    class Response:
+        status_code = 200
+        headers = {"Content-Type": "application/xml", "Content-Length": str(len(BODY))}
+        content = BODY
+        encoding = "utf-8"
+
+    response = Response()
+    now = min(timeit.repeat(lambda: log_response("GET", URL, response, 0.0, False), number=200, repeat=3))
+    before = min(timeit.repeat(lambda: redact_xml(response.content.decode(response.encoding)), number=200, repeat=3))
+    assert now < before
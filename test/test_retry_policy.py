@@ -0,0 +1,135 @@
+from email.utils import formatdate
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.server.endpoint.exceptions import InternalServerError, NonXMLResponseError
+from ._utils import mocked_time
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+
+GET_USER_XML = TEST_ASSET_DIR / "user_get.xml"
+
+
+@pytest.fixture(scope="function")
+def policy():
+    return TSC.RetryPolicy(max_retries=3, jitter=0)
+
+
+@pytest.fixture(scope="function")
+def server(policy):
+    """Fixture to create a TSC.Server instance for testing."""
+    server = TSC.Server("http://test", False, retry_policy=policy)
+
+    # Fake signin
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+
+    return server
+
+
+def test_no_retry_by_default() -> None:
+    server = TSC.Server("http://test", False)
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    with requests_mock.mock() as m:
+        m.get(server.users.baseurl, status_code=503)
+        with pytest.raises(InternalServerError):
+            server.users.get()
+    assert m.call_count == 1
+
+
+def test_retries_until_success(server: TSC.Server, policy: TSC.RetryPolicy) -> None:
+    responses = [
+        {"status_code": 503},
+        {"status_code": 429},
+        {"status_code": 200, "text": GET_USER_XML.read_text()},
+    ]
+    with mocked_time() as mock_time, requests_mock.mock() as m:
+        m.get(server.users.baseurl, responses)
+        users, _ = server.users.get()
+
+    assert len(users) == 2
+    assert m.call_count == 3
+    # Exponential backoff without jitter: 0.5 then 1.0
+    assert mock_time() == pytest.approx(1.5)
+    assert policy.retry_count == 2
+    assert policy.retries_by_status == {503: 1, 429: 1}
+
+
+def test_gives_up_after_max_retries(server: TSC.Server, policy: TSC.RetryPolicy) -> None:
+    with mocked_time(), requests_mock.mock() as m:
+        m.get(server.users.baseurl, status_code=502)
+        with pytest.raises(InternalServerError):
+            server.users.get()
+
+    assert m.call_count == 4
+    assert policy.retry_count == 3
+    assert policy.exhausted_count == 1
+
+
+def test_honours_retry_after_seconds(server: TSC.Server) -> None:
+    responses = [
+        {"status_code": 429, "headers": {"Retry-After": "7"}},
+        {"status_code": 200, "text": GET_USER_XML.read_text()},
+    ]
+    with mocked_time() as mock_time, requests_mock.mock() as m:
+        m.get(server.users.baseurl, responses)
+        server.users.get()
+
+    assert mock_time() == pytest.approx(7)
+
+
+def test_honours_retry_after_date(policy: TSC.RetryPolicy) -> None:
+    class FakeResponse:
+        status_code = 503
+        headers = {"Retry-After": formatdate(1000 + 12, usegmt=True)}
+
+    with patch("time.time", lambda: 1000):
+        assert policy.next_delay("get", FakeResponse(), 0, 0) == pytest.approx(12)  # type: ignore
+
+
+def test_max_elapsed_caps_retries(server: TSC.Server) -> None:
+    server.retry_policy = TSC.RetryPolicy(max_elapsed=10)
+    responses = [
+        {"status_code": 429, "headers": {"Retry-After": "60"}},
+        {"status_code": 200, "text": GET_USER_XML.read_text()},
+    ]
+    with mocked_time() as mock_time, requests_mock.mock() as m:
+        m.get(server.users.baseurl, responses)
+        with pytest.raises(NonXMLResponseError):
+            server.users.get()
+
+    assert m.call_count == 1
+    assert mock_time() == 0
+
+
+def test_post_is_not_retried(server: TSC.Server) -> None:
+    with mocked_time(), requests_mock.mock() as m:
+        m.post(server.users.baseurl, status_code=503)
+        with pytest.raises(InternalServerError):
+            server.users.add(TSC.UserItem("test", "Viewer"))
+
+    assert m.call_count == 1
+
+
+def test_upload_append_is_not_retried(server: TSC.Server, policy: TSC.RetryPolicy) -> None:
+    url = f"{server.fileuploads.baseurl}/7720:170fe6b1c1c7422dadff20f944d58a52-1:0"
+    with mocked_time(), requests_mock.mock() as m:
+        m.put(url, status_code=502)
+        with pytest.raises(InternalServerError):
+            server.fileuploads.append("7720:170fe6b1c1c7422dadff20f944d58a52-1:0", b"chunk", "multipart/mixed")
+
+    # The server may have taken the chunk before the gateway failed, so sending it again could add it twice
+    assert m.call_count == 1
+    assert policy.retry_count == 0
+
+
+def test_invalid_policy() -> None:
+    with pytest.raises(ValueError):
+        TSC.RetryPolicy(max_retries=-1)
+    with pytest.raises(ValueError):
+        TSC.RetryPolicy(jitter=2)
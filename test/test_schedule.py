@@ -1,5 +1,6 @@
 from pathlib import Path
 from datetime import time
+from typing import Literal
 
 import pytest
 import requests_mock
@@ -448,7 +449,7 @@ def test_batch_update_state_items(server: TSC.Server) -> None:
     new_schedules[1]._id = "cecbb71e-def0-4030-8068-5ae50f51db1c"
     new_schedules[2]._id = "f39a6e7d-405e-4c07-8c18-95845f9da80e"
 
-    state = "active"
+    state: Literal["active", "suspended"] = "active"
     with requests_mock.mock() as m:
         m.put(f"{server.schedules.baseurl}?state={state}", text=BATCH_UPDATE_STATE.read_text())
         resp = server.schedules.batch_update_state(new_schedules, state)
@@ -466,7 +467,7 @@ def test_batch_update_state_str(server: TSC.Server) -> None:
         "f39a6e7d-405e-4c07-8c18-95845f9da80e",
     ]
 
-    state = "suspended"
+    state: Literal["active", "suspended"] = "suspended"
     with requests_mock.mock() as m:
         m.put(f"{server.schedules.baseurl}?state={state}", text=BATCH_UPDATE_STATE.read_text())
         resp = server.schedules.batch_update_state(new_schedules, state)
@@ -484,7 +485,7 @@ def test_batch_update_state_all(server: TSC.Server) -> None:
         "f39a6e7d-405e-4c07-8c18-95845f9da80e",
     ]
 
-    state = "suspended"
+    state: Literal["active", "suspended"] = "suspended"
     with requests_mock.mock() as m:
         m.put(f"{server.schedules.baseurl}?state={state}&updateAll=true", text=BATCH_UPDATE_STATE.read_text())
         _ = server.schedules.batch_update_state(new_schedules, state, True)
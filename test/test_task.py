@@ -56,6 +56,7 @@ def test_get_tasks_with_workbook(server: TSC.Server, baseurl: str) -> None:
         all_tasks, pagination_item = server.tasks.get()
 
     task = all_tasks[0]
+    assert task.target is not None  # for mypy
     assert "c7a9327e-1cda-4504-b026-ddb43b976d1d" == task.target.id
     assert "workbook" == task.target.type
 
@@ -67,6 +68,7 @@ def test_get_tasks_with_datasource(server: TSC.Server, baseurl: str) -> None:
         all_tasks, pagination_item = server.tasks.get()
 
     task = all_tasks[0]
+    assert task.target is not None  # for mypy
     assert "c7a9327e-1cda-4504-b026-ddb43b976d1d" == task.target.id
     assert "datasource" == task.target.type
 
@@ -77,9 +79,7 @@ def test_get_tasks_with_workbook_and_datasource(server: TSC.Server, baseurl: str
         m.get(baseurl, text=response_xml)
         all_tasks, pagination_item = server.tasks.get()
 
-    assert "workbook" == all_tasks[0].target.type
-    assert "datasource" == all_tasks[1].target.type
-    assert "workbook" == all_tasks[2].target.type
+    assert ["workbook", "datasource", "workbook"] == [task.target and task.target.type for task in all_tasks[:3]]
 
 
 def test_get_task_with_schedule(server: TSC.Server, baseurl: str) -> None:
@@ -89,6 +89,7 @@ def test_get_task_with_schedule(server: TSC.Server, baseurl: str) -> None:
         all_tasks, pagination_item = server.tasks.get()
 
     task = all_tasks[0]
+    assert task.target is not None  # for mypy
     assert "c7a9327e-1cda-4504-b026-ddb43b976d1d" == task.target.id
     assert "workbook" == task.target.type
     assert "b60b4efd-a6f7-4599-beb3-cb677e7abac1" == task.schedule_id
@@ -100,6 +101,7 @@ def test_get_task_without_schedule(server: TSC.Server, baseurl: str) -> None:
         all_tasks, pagination_item = server.tasks.get()
 
     task = all_tasks[0]
+    assert task.target is not None  # for mypy
     assert "c7a9327e-1cda-4504-b026-ddb43b976d1d" == task.target.id
     assert "datasource" == task.target.type
 
@@ -110,6 +112,7 @@ def test_get_task_with_interval(server: TSC.Server, baseurl: str) -> None:
         all_tasks, pagination_item = server.tasks.get()
 
     task = all_tasks[0]
+    assert task.target is not None  # for mypy
     assert "e4de0575-fcc7-4232-5659-be09bb8e7654" == task.target.id
     assert "datasource" == task.target.type
 
@@ -132,9 +135,11 @@ def test_get_materializeviews_tasks(server: TSC.Server, baseurl: str) -> None:
         all_tasks, pagination_item = server.tasks.get(task_type=TaskItem.Type.DataAcceleration)
 
     task = all_tasks[0]
+    assert task.target is not None  # for mypy
     assert "a462c148-fc40-4670-a8e4-39b7f0c58c7f" == task.target.id
     assert "workbook" == task.target.type
     assert "b22190b4-6ac2-4eed-9563-4afc03444413" == task.schedule_id
+    assert task.schedule_item is not None  # for mypy
     assert parse_datetime("2019-12-09T22:30:00Z") == task.schedule_item.next_run_at
     assert parse_datetime("2019-12-09T20:45:04Z") == task.last_run_at
     assert TSC.TaskItem.Type.DataAcceleration == task.task_type
@@ -158,6 +163,7 @@ def test_get_by_id(server: TSC.Server, baseurl: str) -> None:
         m.get(f"{baseurl}/{task_id}", text=response_xml)
         task = server.tasks.get_by_id(task_id)
 
+    assert task.target is not None  # for mypy
     assert "c7a9327e-1cda-4504-b026-ddb43b976d1d" == task.target.id
     assert "workbook" == task.target.type
     assert "b60b4efd-a6f7-4599-beb3-cb677e7abac1" == task.schedule_id
@@ -0,0 +1,253 @@
+import json
+import os
+import sys
+import unittest.mock
+from pathlib import Path
+
+import pytest
+import requests_mock
+
+import tableauserverclient as TSC
+from tableauserverclient.config import BYTES_PER_MB
+from tableauserverclient.server.endpoint.exceptions import InternalServerError
+from tableauserverclient.server.endpoint.fileuploads_endpoint import Fileuploads
+from tableauserverclient.server.upload_checkpoint import UploadCheckpoint
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+FILEUPLOAD_INITIALIZE = TEST_ASSET_DIR / "fileupload_initialize.xml"
+FILEUPLOAD_APPEND = TEST_ASSET_DIR / "fileupload_append.xml"
+DATASOURCE_PUBLISH = TEST_ASSET_DIR / "datasource_publish.xml"
+UPLOAD_ID = "7720:170fe6b1c1c7422dadff20f944d58a52-1:0"
+SESSION_GONE = (
+    '<tsResponse xmlns="http://tableau.com/api"><error code="404001">'
+    "<summary>Resource Not Found</summary><detail>Upload session not found</detail></error></tsResponse>"
+)
+
+
+@pytest.fixture(scope="function")
+def server(monkeypatch, tmp_path: Path) -> TSC.Server:
+    monkeypatch.setenv("TSC_UPLOAD_CHECKPOINT_DIR", str(tmp_path / "checkpoints"))
+    monkeypatch.setenv("TSC_CHUNK_SIZE_MB", "1")
+    server = TSC.Server("http://test", False)
+    server._site_id = "dad65087-b08b-4603-af4e-2887b8aafc67"
+    server._auth_token = "j80k54ll2lfMZ0tv97mlPvvSCRyD0DOM"
+    return server
+
+
+@pytest.fixture(scope="function")
+def data_file(tmp_path: Path) -> Path:
+    path = tmp_path / "big.hyper"
+    path.write_bytes(os.urandom(5 * BYTES_PER_MB))
+    return path
+
+
+class Appends:
+    """
+    Answers appends with the size of the bytes appended so far, starting
+    from `uploaded`, and keeps each chunk as it is sent, before its read
+    buffer is reused.
+    """
+
+    def __init__(self, *statuses: int, uploaded: int = 0) -> None:
+        self.statuses = list(statuses)
+        self.uploaded = uploaded
+        self.chunks: list[bytes] = []
+
+    def __call__(self, request, context) -> str:
+        context.status_code = self.statuses.pop(0) if self.statuses else 200
+        if context.status_code == 404:
+            return SESSION_GONE
+        if context.status_code != 200:
+            return ""
+        self.chunks.append(bytes(request.body).split(b"\r\n\r\n")[2].rsplit(b"\r\n--", 1)[0])
+        self.uploaded += len(self.chunks[-1])
+        return FILEUPLOAD_APPEND.read_text().replace('fileSize="5"', f'fileSize="{self.uploaded // BYTES_PER_MB}"')
+
+
+def checkpoint_for(server: TSC.Server, path: Path) -> dict:
+    with open(UploadCheckpoint.path_for(server.server_address, server.site_id, path)) as f:
+        return json.load(f)
+
+
+def fail_third_chunk(server: TSC.Server, data_file: Path) -> None:
+    with requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=Appends(200, 200, 500))
+        with pytest.raises(InternalServerError):
+            server.fileuploads.upload(str(data_file), resume=True)
+
+
+def test_checkpoint_records_acknowledged_chunks(server: TSC.Server, data_file: Path) -> None:
+    fail_third_chunk(server, data_file)
+
+    saved = checkpoint_for(server, data_file)
+    assert saved["upload_id"] == UPLOAD_ID
+    assert saved["acknowledged"] == 2 * BYTES_PER_MB
+    assert saved["size"] == 5 * BYTES_PER_MB
+    assert saved["file_size_mb"] == 2
+
+
+def test_resume_sends_the_rest(server: TSC.Server, data_file: Path) -> None:
+    fail_third_chunk(server, data_file)
+
+    appends = Appends(uploaded=2 * BYTES_PER_MB)
+    with requests_mock.mock() as m:
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=appends)
+        assert server.fileuploads.upload(str(data_file), resume=True) == UPLOAD_ID
+
+        # No new session, and only the chunks after the acknowledged ones
+        assert [request.method for request in m.request_history] == ["PUT"] * 3
+    assert b"".join(appends.chunks) == data_file.read_bytes()[2 * BYTES_PER_MB :]
+
+    assert not UploadCheckpoint.path_for(server.server_address, server.site_id, data_file).exists()
+
+
+def test_changed_file_starts_over(server: TSC.Server, data_file: Path) -> None:
+    fail_third_chunk(server, data_file)
+    data = bytearray(data_file.read_bytes())
+    data[0] ^= 0xFF
+    stat = data_file.stat()
+    data_file.write_bytes(data)
+    # Same size and modification time, so only the hash tells them apart
+    os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    appends = Appends()
+    with requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=appends)
+        server.fileuploads.upload(str(data_file), resume=True)
+
+        assert m.request_history[0].method == "POST"
+    assert b"".join(appends.chunks) == bytes(data)
+
+
+@pytest.mark.parametrize("change", ["size", "mtime"])
+def test_checkpoint_of_other_size_or_mtime_is_ignored(server: TSC.Server, data_file: Path, change: str) -> None:
+    fail_third_chunk(server, data_file)
+    stat = data_file.stat()
+    if change == "size":
+        with data_file.open("ab") as f:
+            f.write(b"\0")
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    else:
+        os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    path = UploadCheckpoint.path_for(server.server_address, server.site_id, data_file)
+    assert UploadCheckpoint.resume(path, data_file) is None
+    assert not path.exists()
+
+
+def test_malformed_checkpoint_is_ignored(server: TSC.Server, data_file: Path) -> None:
+    path = UploadCheckpoint.path_for(server.server_address, server.site_id, data_file)
+    path.write_text(json.dumps({"format": 1, "upload_id": UPLOAD_ID, "size": "5"}))
+
+    assert UploadCheckpoint.resume(path, data_file) is None
+    assert not path.exists()
+
+
+def test_expired_session_starts_over(server: TSC.Server, data_file: Path) -> None:
+    fail_third_chunk(server, data_file)
+
+    appends = Appends(404)
+    with requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=appends)
+        assert server.fileuploads.upload(str(data_file), resume=True) == UPLOAD_ID
+
+        assert [request.method for request in m.request_history] == ["PUT", "POST"] + ["PUT"] * 5
+    assert b"".join(appends.chunks) == data_file.read_bytes()
+
+
+def test_session_without_acknowledged_bytes_starts_over(server: TSC.Server, data_file: Path) -> None:
+    fail_third_chunk(server, data_file)
+
+    # The session reports only the chunk sent after resuming, not the 2MB the checkpoint says it holds
+    appends = Appends()
+    with requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=appends)
+        assert server.fileuploads.upload(str(data_file), resume=True) == UPLOAD_ID
+
+        assert [request.method for request in m.request_history] == ["PUT", "POST"] + ["PUT"] * 5
+    assert b"".join(appends.chunks[1:]) == data_file.read_bytes()
+    assert not UploadCheckpoint.path_for(server.server_address, server.site_id, data_file).exists()
+
+
+def test_without_resume_no_checkpoint(server: TSC.Server, data_file: Path) -> None:
+    with requests_mock.mock() as m:
+        m.post(server.fileuploads.baseurl, text=FILEUPLOAD_INITIALIZE.read_text())
+        m.put(f"{server.fileuploads.baseurl}/{UPLOAD_ID}", text=Appends(200, 500))
+        with pytest.raises(InternalServerError):
+            server.fileuploads.upload(str(data_file))
+
+    assert not UploadCheckpoint.path_for(server.server_address, server.site_id, data_file).exists()
+
+
+# User IDs and the mode bits of directories are only checked where the platform has them
+posix_only = pytest.mark.skipif(not hasattr(os, "getuid"), reason="no user IDs on this platform")
+
+
+def test_default_directory_is_in_the_user_cache(monkeypatch, tmp_path: Path) -> None:
+    monkeypatch.delenv("TSC_UPLOAD_CHECKPOINT_DIR", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setattr(os, "name", "posix")
+    monkeypatch.setattr(sys, "platform", "linux")
+
+    assert TSC.config.config.UPLOAD_CHECKPOINT_DIR == os.path.join(tmp_path, "tableauserverclient", "uploads")
+
+
+@posix_only
+def test_directory_is_created_private(server: TSC.Server, data_file: Path, tmp_path: Path) -> None:
+    UploadCheckpoint.path_for(server.server_address, server.site_id, data_file)
+
+    assert (tmp_path / "checkpoints").stat().st_mode & 0o777 == 0o700
+
+
+@posix_only
+def test_directory_of_another_user_is_refused(server: TSC.Server, monkeypatch, data_file: Path, tmp_path: Path) -> None:
+    (tmp_path / "checkpoints").mkdir(mode=0o700)
+    monkeypatch.setattr(os, "getuid", lambda: (tmp_path / "checkpoints").stat().st_uid + 1)
+
+    with requests_mock.mock() as m, pytest.raises(PermissionError):
+        server.fileuploads.upload(str(data_file), resume=True)
+    assert not m.called
+
+
+@posix_only
+def test_directory_others_can_write_to_is_refused(server: TSC.Server, data_file: Path, tmp_path: Path) -> None:
+    (tmp_path / "checkpoints").mkdir()
+    (tmp_path / "checkpoints").chmod(0o777)
+
+    with pytest.raises(PermissionError):
+        UploadCheckpoint.path_for(server.server_address, server.site_id, data_file)
+
+
+@posix_only
+def test_save_does_not_write_through_symlinks(server: TSC.Server, data_file: Path, tmp_path: Path) -> None:
+    path = UploadCheckpoint.path_for(server.server_address, server.site_id, data_file)
+    target = tmp_path / "target"
+    target.write_text("unchanged")
+    path.with_suffix(".tmp").symlink_to(target)
+
+    fail_third_chunk(server, data_file)
+
+    assert target.read_text() == "unchanged"
+    assert checkpoint_for(server, data_file)["acknowledged"] == 2 * BYTES_PER_MB
+    # Nothing but the checkpoint and the symlink, every partial checkpoint was moved into place
+    assert sorted(path.parent.iterdir()) == [path, path.with_suffix(".tmp")]
+
+
+def test_resume_needs_a_path(server: TSC.Server, data_file: Path) -> None:
+    with data_file.open("rb") as f, pytest.raises(ValueError):
+        server.fileuploads.upload(f, resume=True)
+
+
+def test_publish_passes_resume(server: TSC.Server, monkeypatch, data_file: Path) -> None:
+    monkeypatch.setenv("TSC_FILESIZE_LIMIT_MB", "1")
+    server.version = "3.19"
+    item = TSC.DatasourceItem("ee8c6e70-43b6-11e6-af4f-f7b0d8e20760", "big")
+    with requests_mock.mock() as m, unittest.mock.patch.object(Fileuploads, "upload", return_value=UPLOAD_ID) as upload:
+        m.post(server.datasources.baseurl, text=DATASOURCE_PUBLISH.read_text())
+        server.datasources.publish(item, data_file, "CreateNew", resume=True)
+
+    upload.assert_called_once_with(data_file, resume=True)
@@ -109,7 +109,7 @@ def test_get_by_id_usage(server: TSC.Server) -> None:
 
 def test_get_by_id_missing_id(server: TSC.Server) -> None:
     with pytest.raises(TSC.MissingRequiredFieldError):
-        server.views.get_by_id(None)
+        server.views.get_by_id(None)  # type: ignore[arg-type]
 
 
 def test_get_with_usage(server: TSC.Server) -> None:
@@ -192,6 +192,7 @@ def test_virtual_connection_download_revision(server: TSC.Server) -> None:
 def test_virtual_connection_delete(server: TSC.Server) -> None:
     vconn = VirtualConnectionItem("vconn")
     vconn._id = "8fd7cc02-bb55-4d15-b8b1-9650239efe79"
+    assert vconn.id is not None  # for mypy
     with requests_mock.mock() as m:
         m.delete(f"{server.virtual_connections.baseurl}/{vconn.id}")
         server.virtual_connections.delete(vconn)
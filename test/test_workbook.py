@@ -86,6 +86,25 @@ def test_get(server: TSC.Server) -> None:
     assert {"Safari", "Sample"} == all_workbooks[1].tags
 
 
+def test_get_parses_response_once(server: TSC.Server, monkeypatch: pytest.MonkeyPatch) -> None:
+    from tableauserverclient.helpers import parsing
+
+    calls = []
+
+    def counting_fromstring(text):
+        calls.append(text)
+        return fromstring(text)
+
+    monkeypatch.setattr(parsing, "fromstring", counting_fromstring)
+    with requests_mock.mock() as m:
+        m.get(server.workbooks.baseurl, text=GET_XML.read_text())
+        all_workbooks, pagination_item = server.workbooks.get()
+
+    assert len(calls) == 1
+    assert 2 == pagination_item.total_available
+    assert 2 == len(all_workbooks)
+
+
 def test_get_ignore_invalid_date(server: TSC.Server) -> None:
     response_xml = GET_INVALID_DATE_XML.read_text()
     with requests_mock.mock() as m:
@@ -681,7 +700,7 @@ def test_publish_with_hidden_views_on_workbook(server: TSC.Server) -> None:
 
         new_workbook.hidden_views = ["GDP per capita"]
         new_workbook = server.workbooks.publish(new_workbook, sample_workbook, publish_mode)
-        request_body = m._adapter.request_history[0]._request.body
+        request_body = bytes(m._adapter.request_history[0]._request.body)
         # order of attributes in xml is unspecified
         assert re.search(b'<views><view.*?hidden=\\"true\\".*?\\/><\\/views>', request_body)
         assert re.search(b'<views><view.*?name=\\"GDP per capita\\".*?\\/><\\/views>', request_body)
@@ -702,7 +721,7 @@ def test_publish_with_thumbnails_user_id(server: TSC.Server) -> None:
         sample_workbook = os.path.join(TEST_ASSET_DIR, "SampleWB.twbx")
         publish_mode = server.PublishMode.CreateNew
         new_workbook = server.workbooks.publish(new_workbook, sample_workbook, publish_mode)
-        request_body = m._adapter.request_history[0]._request.body
+        request_body = bytes(m._adapter.request_history[0]._request.body)
         # order of attributes in xml is unspecified
         assert re.search(b'thumbnailsUserId=\\"ee8c6e70-43b6-11e6-af4f-f7b0d8e20761\\"', request_body)
 
@@ -722,7 +741,7 @@ def test_publish_with_thumbnails_group_id(server: TSC.Server) -> None:
         sample_workbook = os.path.join(TEST_ASSET_DIR, "SampleWB.twbx")
         publish_mode = server.PublishMode.CreateNew
         new_workbook = server.workbooks.publish(new_workbook, sample_workbook, publish_mode)
-        request_body = m._adapter.request_history[0]._request.body
+        request_body = bytes(m._adapter.request_history[0]._request.body)
         assert re.search(b'thumbnailsGroupId=\\"ee8c6e70-43b6-11e6-af4f-f7b0d8e20762\\"', request_body)
 
 
@@ -798,7 +817,7 @@ def test_publish_non_bytes_file_object(server: TSC.Server) -> None:
 
     with open(os.path.join(TEST_ASSET_DIR, "SampleWB.twbx")) as f:
         with pytest.raises(TypeError):
-            server.workbooks.publish(new_workbook, f, server.PublishMode.CreateNew)
+            server.workbooks.publish(new_workbook, f, server.PublishMode.CreateNew)  # type: ignore[call-overload]
 
 
 def test_publish_file_object_of_unknown_type_raises_exception(server: TSC.Server) -> None:
@@ -905,7 +924,11 @@ def test_create_extracts_one(server: TSC.Server) -> None:
             status_code=200,
             text=response_xml,
         )
-        server.workbooks.create_extract("3cc6cd06-89ce-4fdc-b935-5294135d6d42", False, datasource)
+        server.workbooks.create_extract(
+            "3cc6cd06-89ce-4fdc-b935-5294135d6d42", False, includeAll=False, datasources=[datasource]
+        )
+
+    assert b'<datasource id="1f951daf-4061-451a-9df1-69a8062664f2"' in m.last_request.body
 
 
 def test_revisions(server: TSC.Server) -> None:
@@ -946,7 +969,7 @@ def test_delete_revision(server: TSC.Server) -> None:
 
     with requests_mock.mock() as m:
         m.delete(f"{server.workbooks.baseurl}/{workbook.id}/revisions/3")
-        server.workbooks.delete_revision(workbook.id, "3")
+        server.workbooks.delete_revision(workbook._id, "3")
 
 
 def test_download_revision(server: TSC.Server) -> None:
@@ -0,0 +1,98 @@
+import timeit
+from pathlib import Path
+from xml.etree.ElementTree import ParseError
+
+import pytest
+from defusedxml import EntitiesForbidden
+
+from tableauserverclient.helpers.parsing import DEFUSEDXML, LXML, fromstring
+from tableauserverclient.namespace import OLD_NAMESPACE, Namespace
+from tableauserverclient.server.endpoint.exceptions import ServerResponseError
+
+TEST_ASSET_DIR = Path(__file__).parent / "assets"
+XML_ASSETS = sorted(TEST_ASSET_DIR.glob("*.xml"))
+
+
+@pytest.fixture(params=[DEFUSEDXML, LXML])
+def backend(request, monkeypatch) -> str:
+    if request.param == LXML:
+        pytest.importorskip("lxml")
+    monkeypatch.setenv("TSC_XML_BACKEND", request.param)
+    return request.param
+
+
+def as_tuple(element) -> tuple:
+    return (
+        element.tag,
+        dict(element.attrib),
+        element.text,
+        element.tail,
+        [as_tuple(child) for child in element],
+    )
+
+
+@pytest.mark.parametrize("asset", XML_ASSETS, ids=lambda path: path.name)
+def test_lxml_matches_defusedxml(asset: Path, monkeypatch) -> None:
+    pytest.importorskip("lxml")
+    body = asset.read_bytes()
+
+    monkeypatch.setenv("TSC_XML_BACKEND", DEFUSEDXML)
+    expected = as_tuple(fromstring(body))
+    monkeypatch.setenv("TSC_XML_BACKEND", LXML)
+    assert as_tuple(fromstring(body)) == expected
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        b'<!DOCTYPE x [<!ENTITY a "b">]><x>&a;</x>',
+        b'<!DOCTYPE x [<!ENTITY a SYSTEM "file:///etc/passwd">]><x>&a;</x>',
+    ],
+)
+def test_entities_forbidden(backend: str, document: bytes) -> None:
+    with pytest.raises(EntitiesForbidden):
+        fromstring(document)
+
+
+def test_comments_are_dropped(backend: str) -> None:
+    root = fromstring("<?xml version='1.0' encoding='UTF-8'?><x><!-- note --><?pi value?><y/></x>")
+    assert [child.tag for child in root] == ["y"]
+
+
+def test_syntax_error(backend: str) -> None:
+    with pytest.raises(ParseError):
+        fromstring(b"<x>")
+
+
+def test_namespace_detect(backend: str) -> None:
+    namespace = Namespace()
+    namespace.detect(f'<?xml version="1.0"?><tsResponse xmlns="{OLD_NAMESPACE}"/>'.encode())
+    assert namespace() == {"t": OLD_NAMESPACE}
+
+
+def test_server_response_error(backend: str) -> None:
+    body = (
+        b'<tsResponse xmlns="http://tableau.com/api">'
+        b'<error code="404002"><summary>Not Found</summary><detail>Missing</detail></error>'
+        b"</tsResponse>"
+    )
+    error = ServerResponseError.from_response(body, {"t": "http://tableau.com/api"}, "http://test")
+    assert (error.code, error.summary, error.detail) == ("404002", "Not Found", "Missing")
+
+
+def test_unknown_backend(monkeypatch) -> None:
+    monkeypatch.setenv("TSC_XML_BACKEND", "expat")
+    with pytest.raises(ValueError):
+        fromstring(b"<x/>")
+
+
+@pytest.mark.benchmark
+def test_lxml_faster_on_assets(monkeypatch) -> None:
+    pytest.importorskip("lxml")
+    bodies = [asset.read_bytes() for asset in XML_ASSETS]
+
+    def parse_all(backend: str) -> float:
+        monkeypatch.setenv("TSC_XML_BACKEND", backend)
+        return min(timeit.repeat(lambda: [fromstring(body) for body in bodies], number=1, repeat=5))
+
+    assert parse_all(LXML) < parse_all(DEFUSEDXML)